@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark: executemany vs multi-row INSERT vs Parquet + COPY INTO for CREDIT_BUREAU_REPORT
+With DATABRICKS_HOST / DATABRICKS_TOKEN set it loads the warehouse
+load_databricks.py uses (and empties CREDIT_BUREAU_REPORT there):
+
+    python data/cloud_loaders/benchmark_databricks_load.py
+
+Without them it runs against a stand-in connection that accepts every
+statement, counts statements and bytes sent, and charges each one
+BENCHMARK_ROUND_TRIP_MS plus its bytes at BENCHMARK_UPLOAD_MBPS - so the
+numbers show how many round trips and bytes each path costs, not real
+warehouse timings.
+"""
+
+import os
+import time
+
+import pyarrow.parquet as pq
+from tqdm import tqdm
+
+import load_databricks as gen
+from loaders import DatabricksLoader, DatabricksVolumeLoader
+
+BENCHMARK_REPORTS = int(os.getenv('BENCHMARK_REPORTS', '100000'))
+
+# Stand-in network: latency per statement and upload bandwidth
+BENCHMARK_ROUND_TRIP_MS = float(os.getenv('BENCHMARK_ROUND_TRIP_MS', '100'))
+BENCHMARK_UPLOAD_MBPS = float(os.getenv('BENCHMARK_UPLOAD_MBPS', '100'))
+
+TABLE = f'{gen.CATALOG_NAME}.{gen.SCHEMA_NAME}.CREDIT_BUREAU_REPORT'
+
+# ============================================
+# STAND-IN CONNECTION
+# ============================================
+
+class CountingCursor:
+    """Accepts every statement; COPY INTO reports the rows of the files PUT before it"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.result = []
+
+    def _statement(self, size):
+        self.connection.statements += 1
+        self.connection.bytes_sent += size
+        self.connection.network_seconds += (BENCHMARK_ROUND_TRIP_MS / 1000
+                                            + size / (BENCHMARK_UPLOAD_MBPS * 1e6 / 8))
+
+    def execute(self, statement, parameters=None):
+        size = len(statement.encode('utf-8'))
+        self.description, self.result = None, []
+        if statement.startswith('PUT'):
+            path = statement.split("'")[1]
+            size += os.path.getsize(path)
+            self.connection.uploaded.append(pq.read_metadata(path).num_rows)
+        elif statement.startswith('COPY INTO'):
+            inserted = sum(self.connection.uploaded)
+            self.connection.uploaded = []
+            self.description = [('num_affected_rows',), ('num_inserted_rows',)]
+            self.result = [(inserted, inserted)]
+        elif statement.startswith('DESCRIBE'):
+            self.result = [(name, 'string', None) for name in self.connection.columns]
+        self._statement(size)
+
+    def executemany(self, statement, seq_of_parameters):
+        # The connector sends one statement per parameter set
+        for parameters in seq_of_parameters:
+            self._statement(len(statement.encode('utf-8')) + len(repr(parameters)))
+
+    def fetchone(self):
+        return self.result[0] if self.result else None
+
+    def fetchall(self):
+        return self.result
+
+    def close(self):
+        pass
+
+class CountingConnection:
+    """Stand-in for a SQL warehouse connection"""
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.statements = 0
+        self.bytes_sent = 0
+        self.network_seconds = 0.0
+        self.uploaded = []
+
+    def cursor(self):
+        return CountingCursor(self)
+
+    def close(self):
+        pass
+
+# ============================================
+# BENCHMARK
+# ============================================
+
+def insert_batches(connection, table_name, df, batch_size=1000):
+    """The old load_dataframe_to_databricks path: executemany() over 1,000-row batches"""
+    cursor = connection.cursor()
+    sql = f"INSERT INTO {table_name} VALUES ({', '.join(['?'] * len(df.columns))})"
+    rows = list(df.itertuples(index=False, name=None))
+    for i in tqdm(range(0, len(rows), batch_size)):
+        cursor.executemany(sql, rows[i:i + batch_size])
+    cursor.close()
+
+def run(conn, label, load, reports_df):
+    standin = isinstance(conn, CountingConnection)
+    if standin:
+        conn.statements, conn.bytes_sent, conn.network_seconds = 0, 0, 0.0
+    else:
+        cursor = conn.cursor()
+        cursor.execute(f"TRUNCATE TABLE {TABLE}")
+        cursor.close()
+    start = time.perf_counter()
+    load()
+    seconds = time.perf_counter() - start
+    if standin:
+        print(f"   {conn.statements:,} statements, {conn.bytes_sent / 1e6:,.1f} MB sent, "
+              f"{conn.network_seconds:,.1f}s modelled network time")
+        seconds += conn.network_seconds
+    else:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT COUNT(*) FROM {TABLE}")
+        rows = cursor.fetchone()[0]
+        cursor.close()
+        assert rows == len(reports_df), f"{rows:,} rows loaded, expected {len(reports_df):,}"
+    print(f"⏱️  {label}: {seconds:.1f}s ({len(reports_df) / seconds:,.0f} rows/s)\n")
+    return seconds
+
+def main():
+    print("=" * 80)
+    print(f"⏱️  DATABRICKS LOAD BENCHMARK ({BENCHMARK_REPORTS:,} CREDIT_BUREAU_REPORT rows)")
+    print("=" * 80)
+    reports_df = gen.generate_credit_reports(BENCHMARK_REPORTS)
+    if gen.DATABRICKS_HOST:
+        conn = gen.get_databricks_connection()
+        if not conn:
+            return
+        gen.create_catalog_and_schema(conn)
+        gen.create_iceberg_tables(conn)
+    else:
+        print(f"⚠️  DATABRICKS_HOST not set: stand-in connection, {BENCHMARK_ROUND_TRIP_MS:.0f} ms "
+              f"per statement, {BENCHMARK_UPLOAD_MBPS:.0f} Mbit/s upload\n")
+        conn = CountingConnection(reports_df.columns.tolist())
+
+    results = {
+        'executemany, 1,000-row batches': run(
+            conn, 'executemany', lambda: insert_batches(conn, TABLE, reports_df), reports_df),
+        'multi-row INSERT ... VALUES': run(
+            conn, 'multi-row VALUES', lambda: DatabricksLoader(conn).load(TABLE, reports_df), reports_df),
+        'Parquet in a volume + COPY INTO': run(
+            conn, 'Parquet + COPY INTO',
+            lambda: DatabricksVolumeLoader(conn, gen.VOLUME_PATH).load(TABLE, reports_df), reports_df),
+    }
+    conn.close()
+
+    baseline = results['executemany, 1,000-row batches']
+    print("=" * 80)
+    for label, seconds in results.items():
+        print(f"   {label:<40} {seconds:>8.1f}s {len(reports_df) / seconds:>12,.0f} rows/s "
+              f"{baseline / seconds:>6.1f}x")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
@@ -12,8 +12,14 @@ from faker import Faker
 from datetime import datetime, timedelta
 import random
 import os
+import sys
 from tqdm import tqdm
 
+# Bulk loaders shared with the generators
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'generators'))
+from loaders import DatabricksLoader, DatabricksVolumeLoader, print_load_summary
+from loaders.databricks import DATABRICKS_STAGING_DIR
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -33,6 +39,12 @@ DATABRICKS_WAREHOUSE = os.getenv('DATABRICKS_WAREHOUSE_ID', '')
 CATALOG_NAME = os.getenv('DATABRICKS_CATALOG', 'credit_bureau_data')
 SCHEMA_NAME = os.getenv('DATABRICKS_SCHEMA', 'credit_bureau')
 
+# 'volume': Parquet files staged in a Unity Catalog volume + COPY INTO
+# 'values': multi-row INSERT ... VALUES (no volume needed)
+LOAD_METHOD = os.getenv('DATABRICKS_LOAD_METHOD', 'volume')
+VOLUME_NAME = os.getenv('DATABRICKS_VOLUME', 'load_staging')
+VOLUME_PATH = f'/Volumes/{CATALOG_NAME}/{SCHEMA_NAME}/{VOLUME_NAME}'
+
 NUM_CUSTOMERS = int(os.getenv('NUM_CUSTOMERS', '100000'))
 
 print("=" * 70)
@@ -41,6 +53,7 @@ print("=" * 70)
 print(f"Catalog: {CATALOG_NAME}")
 print(f"Schema: {SCHEMA_NAME}")
 print(f"Storage: Databricks-managed (serverless)")
+print(f"Load method: {LOAD_METHOD}")
 print("=" * 70)
 
 def get_databricks_connection():
@@ -65,7 +78,9 @@ def get_databricks_connection():
         connection = sql.connect(
             server_hostname=DATABRICKS_HOST.replace('https://', ''),
             http_path=http_path,
-            access_token=DATABRICKS_TOKEN
+            access_token=DATABRICKS_TOKEN,
+            # PUT may only upload files from here (Parquet staging for COPY INTO)
+            staging_allowed_local_path=DATABRICKS_STAGING_DIR
         )
         
         print("✅ Connected to Databricks successfully!\n")
@@ -101,6 +116,11 @@ def create_catalog_and_schema(connection):
         COMMENT 'Credit bureau managed tables - accessible via Polaris'
     """)
     print(f"✅ Schema: {SCHEMA_NAME}")
+
+    if LOAD_METHOD == 'volume':
+        # Staging area for the Parquet files COPY INTO loads
+        cursor.execute(f"CREATE VOLUME IF NOT EXISTS {SCHEMA_NAME}.{VOLUME_NAME}")
+        print(f"✅ Volume: {VOLUME_PATH}")
     print(f"📁 Storage: Databricks-managed (serverless)\n")
     
     cursor.close()
@@ -321,28 +341,6 @@ def generate_income_verification(num_customers):
     
     return pd.DataFrame(data)
 
-def load_dataframe_to_databricks(connection, table_name, df, batch_size=1000):
-    """Load DataFrame to Databricks Iceberg table"""
-    cursor = connection.cursor()
-    
-    print(f"📥 Loading {len(df):,} rows to {table_name}...")
-    
-    # Prepare SQL
-    columns = df.columns.tolist()
-    placeholders = ', '.join(['?' for _ in columns])
-    sql = f"INSERT INTO {CATALOG_NAME}.{SCHEMA_NAME}.{table_name} VALUES ({placeholders})"
-    
-    # Convert to list of tuples
-    data = [tuple(x) for x in df.to_numpy()]
-    
-    # Batch insert
-    for i in tqdm(range(0, len(data), batch_size)):
-        batch = data[i:i+batch_size]
-        cursor.executemany(sql, batch)
-    
-    cursor.close()
-    print(f"✅ Loaded {len(df):,} rows\n")
-
 def main():
     # Connect
     conn = get_databricks_connection()
@@ -362,8 +360,14 @@ def main():
     
     # Load data
     print("📤 Loading data to Databricks Iceberg tables...\n")
-    load_dataframe_to_databricks(conn, 'CREDIT_BUREAU_REPORT', credit_reports_df)
-    load_dataframe_to_databricks(conn, 'INCOME_VERIFICATION', income_verification_df)
+    if LOAD_METHOD == 'volume':
+        loader = DatabricksVolumeLoader(conn, VOLUME_PATH)
+    else:
+        loader = DatabricksLoader(conn)
+    print_load_summary([
+        loader.load(f'{CATALOG_NAME}.{SCHEMA_NAME}.CREDIT_BUREAU_REPORT', credit_reports_df),
+        loader.load(f'{CATALOG_NAME}.{SCHEMA_NAME}.INCOME_VERIFICATION', income_verification_df),
+    ])
     
     # Verify
     cursor = conn.cursor()
@@ -12,8 +12,13 @@ from datetime import datetime, timedelta
 import random
 from tqdm import tqdm
 import os
+import sys
 from pathlib import Path
 
+# Bulk loaders shared with the generators
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'generators'))
+from loaders import Checkpoint, OracleArrayLoader, print_load_summary
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -21,10 +26,12 @@ try:
 except ImportError:
     print("⚠️  python-dotenv not installed. Using environment variables directly.")
 
+SEED = 42
+
 fake = Faker()
-Faker.seed(42)
-np.random.seed(42)
-random.seed(42)
+Faker.seed(SEED)
+np.random.seed(SEED)
+random.seed(SEED)
 
 # Configuration from environment
 ORACLE_HOST = os.getenv('ORACLE_CLOUD_HOST', 'localhost')
@@ -40,6 +47,10 @@ WALLET_PASSWORD = os.getenv('ORACLE_WALLET_PASSWORD', '')
 NUM_CUSTOMERS = int(os.getenv('NUM_CUSTOMERS', '100000'))
 NUM_ACCOUNTS = int(NUM_CUSTOMERS * 1.8)
 NUM_LOANS = int(NUM_CUSTOMERS * 0.35)
+# Rows generated (from their own seed), committed and checkpointed together
+CHUNK_ROWS = int(os.getenv('CHUNK_ROWS', '50000'))
+# Continue an interrupted load from its checkpoint instead of recreating the schema
+RESUME = os.getenv('RESUME', 'true').lower() == 'true'
 
 print("=" * 70)
 print("Oracle Cloud T24 Data Loader")
@@ -203,12 +214,22 @@ def create_schema(connection):
     cursor.close()
     print("✅ Schema creation complete!\n")
 
-def generate_customers(num_customers):
-    """Generate customer master data"""
+def seed_generators(seed):
+    """Reseed every random source, so what follows comes out the same on every run"""
+    Faker.seed(seed)
+    np.random.seed(seed)
+    random.seed(seed)
+
+def run_config():
+    """Settings that shape the generated rows; a checkpoint only resumes a run with the same ones"""
+    return f"customers={NUM_CUSTOMERS} chunk={CHUNK_ROWS} seed={SEED}"
+
+def generate_customers(num_customers, first=0):
+    """Generate customer master data (customers first .. first + num_customers - 1)"""
     print(f"👥 Generating {num_customers:,} customers...")
     
     customers = []
-    for i in tqdm(range(num_customers)):
+    for i in tqdm(range(first, first + num_customers)):
         age = int(np.random.normal(40, 15))
         age = max(18, min(80, age))
         dob = datetime.now() - timedelta(days=age*365.25)
@@ -243,12 +264,12 @@ def generate_customers(num_customers):
     
     return customers
 
-def generate_accounts(num_accounts, customer_ids):
-    """Generate account data"""
+def generate_accounts(num_accounts, customer_ids, first=0):
+    """Generate account data (accounts first .. first + num_accounts - 1)"""
     print(f"💳 Generating {num_accounts:,} accounts...")
     
     accounts = []
-    for i in tqdm(range(num_accounts)):
+    for i in tqdm(range(first, first + num_accounts)):
         customer_id = random.choice(customer_ids)
         product_type = random.choices(
             ['SAVINGS', 'CURRENT', 'FIXED_DEPOSIT', 'CREDIT_CARD'],
@@ -283,12 +304,12 @@ def generate_accounts(num_accounts, customer_ids):
     
     return accounts
 
-def generate_loans(num_loans, customer_ids):
-    """Generate loan data"""
+def generate_loans(num_loans, customer_ids, first=0):
+    """Generate loan data (loans first .. first + num_loans - 1)"""
     print(f"🏦 Generating {num_loans:,} loans...")
     
     loans = []
-    for i in tqdm(range(num_loans)):
+    for i in tqdm(range(first, first + num_loans)):
         customer_id = random.choice(customer_ids)
         loan_type = random.choices(
             ['PERSONAL', 'MORTGAGE', 'AUTO', 'BUSINESS'],
@@ -330,7 +351,7 @@ def generate_loans(num_loans, customer_ids):
         loans.append((
             f'LN-{i:08d}',
             customer_id,
-            f'ACC-{random.randint(0, num_loans):07d}',
+            f'ACC-{random.randint(0, NUM_LOANS):07d}',
             loan_type,
             f'LN{random.randint(100, 999)}',
             f'{loan_type} Loan',
@@ -360,26 +381,12 @@ def generate_loans(num_loans, customer_ids):
     
     return loans
 
-def bulk_insert(connection, table_name, data, batch_size=1000):
-    """Bulk insert data into Oracle"""
-    cursor = connection.cursor()
-    
-    total_rows = len(data)
-    print(f"📥 Inserting {total_rows:,} rows into {table_name}...")
-    
-    # Get column count
-    col_count = len(data[0])
-    placeholders = ', '.join([f':{i+1}' for i in range(col_count)])
-    sql = f"INSERT INTO {table_name} VALUES ({placeholders})"
-    
-    # Batch insert
-    for i in tqdm(range(0, total_rows, batch_size)):
-        batch = data[i:i+batch_size]
-        cursor.executemany(sql, batch)
-        connection.commit()
-    
-    cursor.close()
-    print(f"✅ Inserted {total_rows:,} rows\n")
+def pending_chunks(checkpoint, table_name, total_rows, generate):
+    """(chunk_index, seed, rows) for the chunks of a table not committed yet; generate(count, first)"""
+    for chunk in checkpoint.chunks(table_name, total_rows, CHUNK_ROWS):
+        if not chunk.committed:
+            seed_generators(chunk.seed)
+            yield chunk.index, chunk.seed, generate(chunk.count, chunk.first)
 
 def main():
     # Connect
@@ -387,22 +394,28 @@ def main():
     if not conn:
         return
     
-    # Create schema
-    create_schema(conn)
-    
-    # Generate data
-    print("🎲 Generating sample data...\n")
-    customers = generate_customers(NUM_CUSTOMERS)
-    customer_ids = [c[0] for c in customers]
-    
-    accounts = generate_accounts(NUM_ACCOUNTS, customer_ids)
-    loans = generate_loans(NUM_LOANS, customer_ids)
+    # Create schema, unless an interrupted run with the same settings can be continued
+    checkpoint = Checkpoint(conn, 'oracle', 'load_oracle_cloud', run_config(), SEED)
+    if RESUME and checkpoint.resumable:
+        print(f"♻️  Resuming from checkpoint: {checkpoint.describe()}\n")
+    else:
+        create_schema(conn)
+        checkpoint.reset()
     
-    # Load data
-    print("📤 Loading data to Oracle Cloud...\n")
-    bulk_insert(conn, 'T24_CUSTOMER', customers)
-    bulk_insert(conn, 'T24_ACCOUNT', accounts)
-    bulk_insert(conn, 'T24_LOAN', loans)
+    # Generate and load data, chunk by chunk: each chunk commits with its checkpoint row
+    print("🎲 Generating sample data and 📤 loading it to Oracle Cloud...\n")
+    customer_ids = [f'CUS-{i:06d}' for i in range(NUM_CUSTOMERS)]
+    customers = pending_chunks(checkpoint, 'T24_CUSTOMER', NUM_CUSTOMERS, generate_customers)
+    accounts = pending_chunks(checkpoint, 'T24_ACCOUNT', NUM_ACCOUNTS,
+                              lambda count, first: generate_accounts(count, customer_ids, first))
+    loans = pending_chunks(checkpoint, 'T24_LOAN', NUM_LOANS,
+                           lambda count, first: generate_loans(count, customer_ids, first))
+    loader = OracleArrayLoader(conn)
+    print_load_summary([loader.load('T24_CUSTOMER', customers, checkpoint=checkpoint),
+                        loader.load('T24_ACCOUNT', accounts, checkpoint=checkpoint),
+                        loader.load('T24_LOAN', loans, checkpoint=checkpoint)])
+    # Complete: the next run starts over
+    checkpoint.reset()
     
     # Verify
     cursor = conn.cursor()
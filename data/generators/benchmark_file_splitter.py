@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: split throughput of file_splitter.split_csv
+Writes a synthetic CSV with quoted commas, escaped quotes and multi-line
+addresses, splits it into gzip parts, and checks that the parts hold exactly
+the source rows: row counts match and the part bodies concatenate back to the
+source bytes.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from file_splitter import SPLIT_COMPRESSLEVEL, open_binary, split_csv
+from output_writer import RollingWriter
+from upload_manifest import count_rows
+
+BENCHMARK_SPLIT_MB = float(os.getenv('BENCHMARK_SPLIT_MB', '256'))
+BENCHMARK_PART_MB = float(os.getenv('BENCHMARK_PART_MB', '8'))
+BENCHMARK_FORMATS = os.getenv('BENCHMARK_FORMATS', 'csv,csv.gz').split(',')
+CHUNK_ROWS = 100000
+MB = 1024 * 1024
+
+STREETS = np.array(['Main St', 'Oak Ave', 'Pine Rd', 'Maple Dr', 'Cedar Ln'], dtype=object)
+CITIES = np.array(['Springfield, IL 62701', 'Portland, OR 97201', 'Austin, TX 73301'], dtype=object)
+NOTES = np.array(['', 'called "twice"', 'prefers email, not phone', 'n/a'], dtype=object)
+
+def make_chunk(rng, start, n):
+    """Rows with the awkward CSV cases the generators produce"""
+    numbers = rng.integers(1, 9999, n).astype(str)
+    return pd.DataFrame({
+        'ID': np.arange(start, start + n),
+        'ADDRESS': np.char.add(np.char.add(numbers, ' '), STREETS[rng.integers(0, len(STREETS), n)].astype(str))
+                   .astype(object) + '\n' + CITIES[rng.integers(0, len(CITIES), n)],
+        'NOTE': NOTES[rng.integers(0, len(NOTES), n)],
+        'AMOUNT': rng.uniform(0, 100000, n).round(2),
+    })
+
+def make_source(directory, output_format):
+    """Write ~BENCHMARK_SPLIT_MB of uncompressed CSV in the given format"""
+    rng = np.random.default_rng(42)
+    writer = RollingWriter(directory, 'benchmark_source.csv', output_format=output_format)
+    written = start = 0
+    while written < BENCHMARK_SPLIT_MB * MB:
+        chunk = make_chunk(rng, start, CHUNK_ROWS)
+        written += len(chunk.to_csv(index=False))
+        writer.write(chunk)
+        start += CHUNK_ROWS
+    (filename, rows), = writer.close().items()
+    return os.path.join(directory, filename), rows, written
+
+def body_digest(paths):
+    """SHA-256 of the data rows of one or more CSV files, headers skipped"""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open_binary(path) as f:
+            f.readline()
+            for block in iter(lambda: f.read(MB), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+def run(directory, output_format):
+    source, source_rows, source_bytes = make_source(directory, output_format)
+    parts_dir = os.path.join(directory, f'parts_{output_format}')
+    os.makedirs(parts_dir)
+
+    start = time.perf_counter()
+    parts = split_csv(source, parts_dir, BENCHMARK_PART_MB)
+    seconds = time.perf_counter() - start
+
+    part_rows = {os.path.basename(p): count_rows(p) for p in parts}
+    assert count_rows(source) == source_rows, "source row count mismatch"
+    assert sum(parts.values()) == source_rows, f"splitter counted {sum(parts.values())} rows, source has {source_rows}"
+    assert sum(part_rows.values()) == source_rows, f"parts hold {sum(part_rows.values())} rows, source has {source_rows}"
+    assert all(part_rows[os.path.basename(p)] == rows for p, rows in parts.items()), "per-part row count mismatch"
+    assert body_digest(parts) == body_digest([source]), "parts do not concatenate to the source"
+
+    sizes = [os.path.getsize(p) / MB for p in parts]
+    print(f"\n{output_format}: {source_bytes / MB:.0f} MB, {source_rows:,} rows -> {len(parts)} parts "
+          f"({min(sizes):.1f}-{max(sizes):.1f} MB gzip) in {seconds:.2f}s")
+    print(f"   {source_bytes / MB / seconds:.1f} MB/s uncompressed  |  {source_rows / seconds:,.0f} rows/s  |  "
+          f"row counts OK")
+
+def main():
+    print("=" * 80)
+    print("⏱️  FILE SPLITTER BENCHMARK")
+    print("=" * 80)
+    print(f"~{BENCHMARK_SPLIT_MB:g} MB source, ~{BENCHMARK_PART_MB:g} MB parts, gzip level {SPLIT_COMPRESSLEVEL}")
+
+    with tempfile.TemporaryDirectory(prefix='split_benchmark_') as directory:
+        for output_format in BENCHMARK_FORMATS:
+            run(directory, output_format)
+
+    print("\n" + "=" * 80)
+
+if __name__ == "__main__":
+    main()
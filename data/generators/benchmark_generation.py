@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: row-by-row loop generators vs the columnar NumPy engine
+Reports rows/sec for the high-volume tables of generate_all_snowflake_data.py
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+# Keep benchmark output away from data/generated_csv
+os.environ.setdefault('OUTPUT_DIR', tempfile.mkdtemp(prefix='gen_benchmark_'))
+
+import faker_pools
+import generate_all_snowflake_data as gen
+import vectorized_engine as ve
+from key_registry import KeyRegistry
+
+BENCHMARK_ROWS = int(os.getenv('BENCHMARK_ROWS', '20000'))
+BENCHMARK_CUSTOMERS = int(os.getenv('BENCHMARK_CUSTOMERS', '1000'))
+
+def timed(fn, *args):
+    """Run fn and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def run_loop(rows):
+    """Time the loop generators for each high-volume table"""
+    gen.NUM_DIGITAL_SESSIONS = BENCHMARK_CUSTOMERS * 5
+    gen.NUM_ACCOUNTS = int(BENCHMARK_CUSTOMERS * 1.8)
+    gen.NUM_DIGITAL_EVENTS = rows
+    gen.NUM_TRANSACTIONS = rows
+    gen.NUM_TRADELINES = rows
+    gen.NUM_CREDIT_INQUIRIES = rows
+
+    digital_df = gen.generate_digital_customer_profile(BENCHMARK_CUSTOMERS)
+    keys = KeyRegistry(np.arange(BENCHMARK_CUSTOMERS), digital_df['DIGITAL_ID'].to_numpy())
+    gen.generate_digital_sessions(keys)
+    customers_df = gen.generate_t24_customers(BENCHMARK_CUSTOMERS)
+    keys.assign_accounts(gen.pool_rng, gen.NUM_ACCOUNTS)
+    gen.generate_t24_accounts(customers_df, keys)
+
+    return {
+        'digital_event': timed(gen.generate_digital_events, keys)[1],
+        't24_transaction': timed(gen.generate_t24_transactions, keys)[1],
+        'tradeline': timed(gen.generate_tradelines, keys)[1],
+        'credit_inquiry': timed(gen.generate_credit_inquiries, keys)[1],
+    }
+
+def run_vectorized(rows):
+    """Time the vectorized builders (including the CSV write) for each high-volume table"""
+    rng = np.random.default_rng(gen.SEED)
+    pools = faker_pools.load_pools(gen.SEED)
+    now = gen.datetime.now()
+    keys = KeyRegistry(np.arange(BENCHMARK_CUSTOMERS), ve.uuid4_array(rng, BENCHMARK_CUSTOMERS))
+
+    ve.build_digital_customer_profile(rng, pools, now, keys)
+    ve.build_digital_sessions(rng, pools, now, BENCHMARK_CUSTOMERS * 5, keys)
+    customers_df = ve.build_t24_customers(rng, pools, now, keys)
+    keys.assign_accounts(rng, int(BENCHMARK_CUSTOMERS * 1.8))
+    ve.build_t24_accounts(rng, pools, now, customers_df, keys)
+
+    def build_and_save(builder, filename, *args):
+        gen.save_csv(builder(rng, pools, now, *args), filename, 'rows')
+
+    return {
+        'digital_event': timed(build_and_save, ve.build_digital_events, 'digital_event.csv', rows, keys)[1],
+        't24_transaction': timed(build_and_save, ve.build_t24_transactions, 't24_transaction.csv', rows, keys)[1],
+        'tradeline': timed(build_and_save, ve.build_tradelines, 'tradeline.csv', rows, keys)[1],
+        'credit_inquiry': timed(build_and_save, ve.build_credit_inquiries, 'credit_inquiry.csv', rows, keys)[1],
+    }
+
+def main():
+    print("=" * 80)
+    print("⏱️  GENERATION ENGINE BENCHMARK")
+    print("=" * 80)
+    print(f"Rows per table: {BENCHMARK_ROWS:,}  |  Customers: {BENCHMARK_CUSTOMERS:,}")
+    print(f"Scratch output: {gen.OUTPUT_DIR}")
+
+    loop_times = run_loop(BENCHMARK_ROWS)
+    vector_times = run_vectorized(BENCHMARK_ROWS)
+
+    print("\n" + "=" * 80)
+    print(f"   {'Table':<20} {'loop rows/s':>15} {'vectorized rows/s':>20} {'speedup':>10}")
+    for table, loop_seconds in loop_times.items():
+        vector_seconds = vector_times[table]
+        print(f"   {table:<20} {BENCHMARK_ROWS / loop_seconds:>15,.0f} "
+              f"{BENCHMARK_ROWS / vector_seconds:>20,.0f} {loop_seconds / vector_seconds:>9.1f}x")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: executemany vs multi-row INSERT vs LOAD DATA LOCAL INFILE for DIGITAL_EVENT
+Runs against the MySQL set by MYSQL_HOST / MYSQL_PORT / MYSQL_DATABASE /
+MYSQL_USER / MYSQL_PASSWORD - e.g. the local mysql-digital container from
+infrastructure/docker (started with --local-infile=1, tables from mysql/init.sql):
+
+    docker compose -f infrastructure/docker/docker-compose.yml up -d mysql-digital
+    python data/generators/benchmark_mysql_load.py
+
+The benchmark empties the digital banking tables in that database.
+"""
+
+import os
+import time
+
+import generate_mysql_data as gen
+from loaders import MySQLLoader
+from loaders.mysql import infile_supported
+
+BENCHMARK_EVENTS = int(os.getenv('BENCHMARK_EVENTS', '500000'))
+
+def reset_tables(conn, tables):
+    cursor = conn.cursor()
+    cursor.execute("SET SESSION foreign_key_checks = 0")
+    for table in tables:
+        cursor.execute(f"TRUNCATE TABLE {table}")
+    cursor.execute("SET SESSION foreign_key_checks = 1")
+    conn.commit()
+    cursor.close()
+
+def check_events(conn, events_df):
+    """Every row arrived, and NULLs stayed NULLs"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*), COUNT(ERROR_CODE), SUM(SUCCESS) FROM DIGITAL_EVENT")
+    rows, error_codes, successes = cursor.fetchone()
+    cursor.close()
+    assert rows == len(events_df), f"{rows:,} rows loaded, expected {len(events_df):,}"
+    assert error_codes == events_df['ERROR_CODE'].notna().sum(), "ERROR_CODE NULLs do not match"
+    assert successes == events_df['SUCCESS'].sum(), "SUCCESS flags do not match"
+
+def run(conn, label, load, events_df):
+    reset_tables(conn, ['DIGITAL_EVENT'])
+    start = time.perf_counter()
+    load()
+    seconds = time.perf_counter() - start
+    check_events(conn, events_df)
+    print(f"⏱️  {label}: {seconds:.1f}s ({len(events_df) / seconds:,.0f} rows/s, row counts OK)\n")
+    return seconds
+
+def main():
+    print("=" * 80)
+    print(f"⏱️  MYSQL LOAD BENCHMARK ({BENCHMARK_EVENTS:,} DIGITAL_EVENT rows)")
+    print("=" * 80)
+    conn = gen.get_mysql_connection()
+    if not conn:
+        return
+    reset_tables(conn, ['DIGITAL_EVENT', 'DIGITAL_SESSION', 'DIGITAL_CUSTOMER_PROFILE'])
+
+    # Parents first so the event foreign keys resolve
+    customers = max(1, BENCHMARK_EVENTS // (gen.SESSIONS_PER_CUSTOMER * gen.EVENTS_PER_SESSION))
+    profiles_df = gen.generate_digital_profiles(customers)
+    sessions_df = gen.generate_sessions(customers, gen.SESSIONS_PER_CUSTOMER, profiles_df)
+    events_df = next(gen.generate_events(sessions_df, BENCHMARK_EVENTS / len(sessions_df),
+                                         batch_size=BENCHMARK_EVENTS))
+    print()
+    parent_method = 'infile' if infile_supported(conn) else 'insert'
+    MySQLLoader(conn, method=parent_method).load('DIGITAL_CUSTOMER_PROFILE', profiles_df)
+    MySQLLoader(conn, method=parent_method).load('DIGITAL_SESSION', sessions_df)
+
+    results = {
+        'executemany, commit per 1,000 rows': run(
+            conn, 'executemany', lambda: gen.bulk_insert(conn, 'DIGITAL_EVENT', events_df), events_df),
+        'multi-row INSERT, max_allowed_packet': run(
+            conn, 'multi-row INSERT',
+            lambda: MySQLLoader(conn, method='insert').load('DIGITAL_EVENT', events_df), events_df),
+    }
+    if parent_method == 'infile':
+        results['LOAD DATA LOCAL INFILE'] = run(
+            conn, 'LOAD DATA LOCAL INFILE',
+            lambda: MySQLLoader(conn, method='infile').load('DIGITAL_EVENT', events_df), events_df)
+    else:
+        print("⚠️  Server has local_infile=OFF, skipping LOAD DATA LOCAL INFILE\n")
+    conn.close()
+
+    baseline = results['executemany, commit per 1,000 rows']
+    print("=" * 80)
+    for label, seconds in results.items():
+        print(f"   {label:<40} {seconds:>8.1f}s {len(events_df) / seconds:>12,.0f} rows/s "
+              f"{baseline / seconds:>6.1f}x")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: row-by-row INSERT vs 1,000-row executemany vs array DML for T24_ACCOUNT
+Runs against the oracle-t24 container from infrastructure/docker (Oracle XE,
+tables from oracle/init.sql), the database generate_t24_data.py connects to:
+
+    docker compose -f infrastructure/docker/docker-compose.yml up -d oracle-t24
+    python data/generators/benchmark_oracle_load.py
+
+The benchmark empties the T24 tables in that database.
+"""
+
+import os
+import time
+
+from tqdm import tqdm
+
+import generate_t24_data as gen
+from loaders import OracleArrayLoader
+from loaders.oracle import frame_rows, insert_sql
+
+BENCHMARK_ACCOUNTS = int(os.getenv('BENCHMARK_ACCOUNTS', '180000'))
+
+# ============================================
+# BASELINES
+# ============================================
+
+def insert_row_by_row(connection, table_name, df):
+    """The old generator path: one execute() per row, one commit"""
+    cursor = connection.cursor()
+    sql = insert_sql(table_name, len(df.columns))
+    for row in tqdm(frame_rows(df)):
+        cursor.execute(sql, row)
+    connection.commit()
+    cursor.close()
+
+def insert_batches(connection, table_name, df, batch_size=1000):
+    """The old cloud loader path: executemany() over 1,000 rows, a commit per batch"""
+    cursor = connection.cursor()
+    sql = insert_sql(table_name, len(df.columns))
+    rows = frame_rows(df)
+    for i in tqdm(range(0, len(rows), batch_size)):
+        cursor.executemany(sql, rows[i:i + batch_size])
+        connection.commit()
+    cursor.close()
+
+# ============================================
+# BENCHMARK
+# ============================================
+
+def clear_tables(conn):
+    cursor = conn.cursor()
+    # Children first; the parent keeps its foreign keys, so no TRUNCATE
+    for table in ['T24_COLLATERAL', 'T24_PAYMENT_SCHEDULE', 'T24_LOAN', 'T24_TRANSACTION', 'T24_ACCOUNT']:
+        cursor.execute(f"TRUNCATE TABLE {table}")
+    cursor.execute("DELETE FROM T24_CUSTOMER")
+    conn.commit()
+    cursor.close()
+
+def run(conn, label, load, accounts_df):
+    cursor = conn.cursor()
+    cursor.execute("TRUNCATE TABLE T24_ACCOUNT")
+    start = time.perf_counter()
+    load()
+    seconds = time.perf_counter() - start
+    cursor.execute("SELECT COUNT(*), COUNT(JOINT_HOLDER_1) FROM T24_ACCOUNT")
+    rows, joint_holders = cursor.fetchone()
+    cursor.close()
+    assert rows == len(accounts_df), f"{rows:,} rows loaded, expected {len(accounts_df):,}"
+    assert joint_holders == 0, "NULL joint holders were not loaded as NULL"
+    print(f"⏱️  {label}: {seconds:.1f}s ({len(accounts_df) / seconds:,.0f} rows/s, row counts OK)\n")
+    return seconds
+
+def main():
+    print("=" * 80)
+    print(f"⏱️  ORACLE LOAD BENCHMARK ({BENCHMARK_ACCOUNTS:,} T24_ACCOUNT rows)")
+    print("=" * 80)
+    conn = gen.get_oracle_connection()
+    if not conn:
+        return
+    clear_tables(conn)
+
+    num_customers = max(1, BENCHMARK_ACCOUNTS * gen.NUM_CUSTOMERS // gen.NUM_ACCOUNTS)
+    customers_df = gen.generate_customers(num_customers)
+    accounts_df = gen.generate_accounts(customers_df, gen.assign_keys(num_customers, BENCHMARK_ACCOUNTS, 0))
+    print()
+    OracleArrayLoader(conn).load('T24_CUSTOMER', customers_df)
+
+    results = {
+        'execute per row, one commit': run(
+            conn, 'execute per row', lambda: insert_row_by_row(conn, 'T24_ACCOUNT', accounts_df), accounts_df),
+        'executemany, commit per 1,000 rows': run(
+            conn, 'executemany (1,000 rows)', lambda: insert_batches(conn, 'T24_ACCOUNT', accounts_df), accounts_df),
+        'array DML, setinputsizes, one commit': run(
+            conn, 'array DML', lambda: OracleArrayLoader(conn).load('T24_ACCOUNT', accounts_df), accounts_df),
+    }
+    conn.close()
+
+    baseline = results['execute per row, one commit']
+    print("=" * 80)
+    for label, seconds in results.items():
+        print(f"   {label:<40} {seconds:>8.1f}s {len(accounts_df) / seconds:>12,.0f} rows/s "
+              f"{baseline / seconds:>6.1f}x")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: execute_batch INSERT vs COPY FROM STDIN for digital_event
+Runs against the PostgreSQL set by POSTGRES_HOST / POSTGRES_PORT /
+POSTGRES_DATABASE / POSTGRES_USER / POSTGRES_PASSWORD - e.g. the local
+postgres-digital container from infrastructure/docker:
+
+    docker compose -f infrastructure/docker/docker-compose.yml up -d postgres-digital
+    POSTGRES_HOST=localhost python data/generators/benchmark_postgres_load.py
+
+The benchmark recreates the digital banking tables in that database.
+"""
+
+import os
+import time
+
+import generate_postgres_data as gen
+from loaders import PostgresCopyLoader
+
+BENCHMARK_EVENTS = int(os.getenv('BENCHMARK_EVENTS', '500000'))
+
+def reset_events(conn):
+    cursor = conn.cursor()
+    cursor.execute("TRUNCATE TABLE digital_event")
+    conn.commit()
+    cursor.close()
+
+def check_events(conn, events_df):
+    """Every row arrived, and NULLs stayed NULLs"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*), COUNT(error_code), COUNT(event_data) FROM digital_event")
+    rows, error_codes, event_data = cursor.fetchone()
+    cursor.close()
+    assert rows == len(events_df), f"{rows:,} rows loaded, expected {len(events_df):,}"
+    assert error_codes == events_df['error_code'].notna().sum(), "error_code NULLs do not match"
+    assert event_data == len(events_df), "event_data lost values"
+
+def run(conn, label, load, events_df):
+    reset_events(conn)
+    start = time.perf_counter()
+    load()
+    seconds = time.perf_counter() - start
+    check_events(conn, events_df)
+    print(f"⏱️  {label}: {seconds:.1f}s ({len(events_df) / seconds:,.0f} rows/s, row counts OK)\n")
+    return seconds
+
+def main():
+    print("=" * 80)
+    print(f"⏱️  POSTGRES LOAD BENCHMARK ({BENCHMARK_EVENTS:,} digital_event rows)")
+    print("=" * 80)
+    conn = gen.get_postgres_connection()
+    if not conn:
+        return
+    gen.create_tables(conn)
+
+    # Parents first so the event foreign keys resolve
+    customers = max(1, BENCHMARK_EVENTS // (gen.SESSIONS_PER_CUSTOMER * gen.EVENTS_PER_SESSION))
+    profiles_df = gen.generate_digital_profiles(customers)
+    sessions_df = gen.generate_sessions(customers, gen.SESSIONS_PER_CUSTOMER, profiles_df)
+    events_df = gen.generate_events(sessions_df, BENCHMARK_EVENTS / len(sessions_df))
+    print()
+    PostgresCopyLoader(conn).load('digital_customer_profile', profiles_df)
+    PostgresCopyLoader(conn).load('digital_session', sessions_df)
+
+    results = {
+        'execute_batch, commit per 1,000 rows': run(
+            conn, 'execute_batch', lambda: gen.bulk_insert_postgres(conn, 'digital_event', events_df), events_df),
+        'COPY, indexes kept': run(
+            conn, 'COPY (indexes kept)',
+            lambda: PostgresCopyLoader(conn, rebuild_indexes=False).load('digital_event', events_df), events_df),
+        'COPY, indexes + FKs dropped, rebuilt': run(
+            conn, 'COPY (indexes + FKs rebuilt)',
+            lambda: PostgresCopyLoader(conn, rebuild_indexes=True).load('digital_event', events_df), events_df),
+    }
+    conn.close()
+
+    baseline = results['execute_batch, commit per 1,000 rows']
+    print("=" * 80)
+    for label, seconds in results.items():
+        print(f"   {label:<40} {seconds:>8.1f}s {len(events_df) / seconds:>12,.0f} rows/s "
+              f"{baseline / seconds:>6.1f}x")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: serial vs pipelined stage upload against a fake Snowflake connection
+The fake connection records every statement with its start/end time and
+simulates PUT and COPY latency, so the pipeline can be timed and its
+statement ordering checked without a Snowflake account.
+"""
+
+import os
+import re
+import tempfile
+import threading
+import time
+
+from stage_loader import load_pipelined, print_throughput_report
+
+BENCHMARK_TABLES = int(os.getenv('BENCHMARK_TABLES', '8'))
+BENCHMARK_FILES_PER_TABLE = int(os.getenv('BENCHMARK_FILES_PER_TABLE', '3'))
+BENCHMARK_FILE_MB = float(os.getenv('BENCHMARK_FILE_MB', '2'))
+
+# Simulated latency
+PUT_MB_PER_SECOND = float(os.getenv('PUT_MB_PER_SECOND', '40'))
+STATEMENT_SECONDS = float(os.getenv('STATEMENT_SECONDS', '0.05'))
+COPY_SECONDS_PER_FILE = float(os.getenv('COPY_SECONDS_PER_FILE', '0.1'))
+ROWS_PER_FILE = 10000
+
+class FakeCursor:
+    """DB-API cursor that sleeps instead of talking to Snowflake"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = None
+        self._result = []
+
+    def execute(self, sql):
+        sql = ' '.join(sql.split())
+        start = time.perf_counter()
+        self.description, self._result = None, []
+        if sql.startswith('PUT'):
+            path = re.search(r'file://(\S+)', sql).group(1)
+            time.sleep(STATEMENT_SECONDS + os.path.getsize(path) / 1024 / 1024 / PUT_MB_PER_SECOND)
+        elif sql.startswith('COPY'):
+            files = re.findall(r"'([^']+\.csv)'", sql)
+            time.sleep(STATEMENT_SECONDS + COPY_SECONDS_PER_FILE * len(files))
+            self.description = [('file',), ('status',), ('rows_parsed',), ('rows_loaded',)]
+            self._result = [(f, 'LOADED', ROWS_PER_FILE, ROWS_PER_FILE) for f in files]
+        else:
+            time.sleep(STATEMENT_SECONDS)
+        self.conn.record(sql, start, time.perf_counter())
+
+    def fetchall(self):
+        return self._result
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    """Records (statement, start, end) for every execute, thread-safely"""
+
+    def __init__(self):
+        self.statements = []
+        self._lock = threading.Lock()
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def record(self, sql, start, end):
+        with self._lock:
+            self.statements.append((sql, start, end))
+
+def make_files(directory):
+    """Write BENCHMARK_TABLES tables of BENCHMARK_FILES_PER_TABLE part files each"""
+    filenames, mappings = [], {}
+    payload = b'x' * int(BENCHMARK_FILE_MB * 1024 * 1024)
+    for t in range(BENCHMARK_TABLES):
+        mappings[f'table_{t}.csv'] = ('BENCH', f'TABLE_{t}')
+        for part in range(BENCHMARK_FILES_PER_TABLE):
+            filename = f'table_{t}_{part:05d}.csv'
+            with open(os.path.join(directory, filename), 'wb') as f:
+                f.write(payload)
+            filenames.append(filename)
+    return filenames, mappings
+
+def check_ordering(conn, mappings):
+    """Every table is truncated before its COPY, and COPY starts after all its PUTs end"""
+    for key, (schema, table) in mappings.items():
+        stem = key[:-len('.csv')]
+        puts = [(s, e) for sql, s, e in conn.statements
+                if sql.startswith('PUT') and re.search(rf'/{stem}_\d{{5}}\.csv ', sql)]
+        truncate = [s for sql, s, e in conn.statements if sql == f'TRUNCATE TABLE {schema}.{table}']
+        copy = [s for sql, s, e in conn.statements if sql.startswith(f'COPY INTO {schema}.{table} ')]
+        assert len(puts) == BENCHMARK_FILES_PER_TABLE, f"{table}: {len(puts)} PUTs"
+        assert len(truncate) == 1 and len(copy) == 1, f"{table}: missing TRUNCATE/COPY"
+        assert truncate[0] < copy[0], f"{table}: COPY before TRUNCATE"
+        assert copy[0] >= max(e for _, e in puts), f"{table}: COPY started before its files landed"
+
+def run(label, directory, filenames, mappings, upload_workers, copy_workers):
+    conn = FakeConnection()
+    file_results, table_results, wall = load_pipelined(
+        conn, directory, filenames, mappings, 'BENCH_STAGE',
+        upload_workers=upload_workers, copy_workers=copy_workers)
+    check_ordering(conn, mappings)
+    print(f"\n{label}: {wall:.2f}s ({len(conn.statements)} statements, ordering OK)")
+    return file_results, table_results, wall
+
+def main():
+    print("=" * 80)
+    print("⏱️  STAGE LOADER BENCHMARK (fake connection)")
+    print("=" * 80)
+    print(f"{BENCHMARK_TABLES} tables x {BENCHMARK_FILES_PER_TABLE} files x {BENCHMARK_FILE_MB:g} MB  |  "
+          f"PUT {PUT_MB_PER_SECOND:g} MB/s, {COPY_SECONDS_PER_FILE:g}s COPY per file")
+
+    with tempfile.TemporaryDirectory(prefix='stage_benchmark_') as directory:
+        filenames, mappings = make_files(directory)
+        _, _, serial = run("Serial (1 upload / 1 COPY worker)", directory, filenames, mappings, 1, 1)
+        results = run("Pipelined (8 upload / 4 COPY workers)", directory, filenames, mappings, 8, 4)
+
+    print_throughput_report(*results)
+    print("\n" + "=" * 80)
+    print(f"   Speedup: {serial / results[2]:.1f}x")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Synthetic CDC change stream for load testing the Openflow connectors
+The generators only write an initial snapshot; this keeps changing a source
+database at a steady rate so the connectors in snowflake/01_connectors have
+a realistic stream of inserts, updates and deletes to replicate:
+
+    oracle    new T24_TRANSACTION rows, T24_ACCOUNT balance updates,
+              T24_LOAN days-past-due changes, purges of older new transactions
+    postgres  new digital_event rows, digital_session updates,
+              digital_customer_profile logins, purges of older new events
+    mysql     the same on the DIGITAL_* tables
+
+Keys are skewed like real traffic: the k-th hottest account / session /
+customer is picked with weight 1 / k**CDC_ZIPF_EXPONENT. CDC_WORKERS
+connections share one token bucket, so together they apply
+CDC_OPS_PER_SECOND operations in transactions of CDC_BATCH_OPS.
+
+Every second a row also goes into CDC_HEARTBEAT (SENT_AT in UTC). Add the
+table to the connector's TABLES and the replication lag is the age of the
+newest heartbeat in Snowflake (the query is printed at the end).
+
+    CDC_TARGET=oracle CDC_OPS_PER_SECOND=5000 python data/generators/cdc_stream.py
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Source database: 'oracle' (T24), 'postgres' or 'mysql' (digital banking)
+CDC_TARGET = os.getenv('CDC_TARGET', 'postgres')
+# Operations per second, across all workers
+CDC_OPS_PER_SECOND = float(os.getenv('CDC_OPS_PER_SECOND', '5000'))
+# Connections applying changes
+CDC_WORKERS = int(os.getenv('CDC_WORKERS', '8'))
+# Operations per transaction
+CDC_BATCH_OPS = int(os.getenv('CDC_BATCH_OPS', '10'))
+# Seconds to run; 0 runs until interrupted
+CDC_DURATION_SECONDS = float(os.getenv('CDC_DURATION_SECONDS', '300'))
+# Key skew: 0 is uniform, around 1 is typical hot-key traffic
+CDC_ZIPF_EXPONENT = float(os.getenv('CDC_ZIPF_EXPONENT', '1.1'))
+# Operation mix, e.g. "new_transaction=60,balance_update=30,loan_dpd=8,transaction_purge=2"
+CDC_MIX = os.getenv('CDC_MIX', '')
+CDC_REPORT_SECONDS = float(os.getenv('CDC_REPORT_SECONDS', '10'))
+CDC_SEED = int(os.getenv('CDC_SEED', '42'))
+
+HEARTBEAT_TABLE = 'CDC_HEARTBEAT'
+
+HEARTBEAT_DDL = {
+    'oracle': f"CREATE TABLE {HEARTBEAT_TABLE} (HEARTBEAT_ID NUMBER(12) PRIMARY KEY, SENT_AT TIMESTAMP NOT NULL)",
+    'postgres': f"CREATE TABLE IF NOT EXISTS {HEARTBEAT_TABLE} (HEARTBEAT_ID BIGINT PRIMARY KEY, SENT_AT TIMESTAMP NOT NULL)",
+    'mysql': f"CREATE TABLE IF NOT EXISTS {HEARTBEAT_TABLE} (HEARTBEAT_ID BIGINT PRIMARY KEY, SENT_AT TIMESTAMP(6) NOT NULL)",
+}
+
+# ============================================
+# RATE AND SKEW
+# ============================================
+
+class TokenBucket:
+    """Rate limit shared by the workers: take(n) waits until n more operations are allowed"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self, n):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                wait = (n - self.tokens) / self.rate
+            time.sleep(wait)
+
+class HotKeys:
+    """Rows of a key table drawn with Zipf skew; the hot rows are scattered, not the first ones"""
+
+    def __init__(self, rows, exponent, seed):
+        self.rows = rows
+        self.order = np.random.default_rng(seed).permutation(len(rows))
+        weights = 1.0 / np.arange(1, len(rows) + 1) ** exponent
+        self.cdf = np.cumsum(weights) / weights.sum()
+
+    def sample(self, rng, n):
+        """n rows, sorted so concurrent transactions lock hot rows in the same order"""
+        ranks = np.minimum(np.searchsorted(self.cdf, rng.random(n)), len(self.rows) - 1)
+        return sorted(self.rows[i] for i in self.order[ranks])
+
+def utc_now():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def bind(sql, dialect):
+    """%s placeholders in the driver's paramstyle (:1, :2, ... for Oracle)"""
+    if dialect != 'oracle':
+        return sql
+    parts = sql.split('%s')
+    return ''.join(part + (f':{i + 1}' if i < len(parts) - 1 else '') for i, part in enumerate(parts))
+
+# ============================================
+# CHANGES
+# ============================================
+
+class T24Changes:
+    """Core banking activity on the Oracle T24 tables"""
+
+    dialect = 'oracle'
+    mix = {'transaction_purge': 2, 'new_transaction': 60, 'balance_update': 30, 'loan_dpd': 8}
+
+    def __init__(self, connection):
+        cursor = connection.cursor()
+        cursor.execute("SELECT ACCOUNT_ID, CUSTOMER_ID, CURRENCY FROM T24_ACCOUNT WHERE ACCOUNT_STATUS = 'ACTIVE'")
+        self.accounts = HotKeys(cursor.fetchall(), CDC_ZIPF_EXPONENT, CDC_SEED)
+        cursor.execute("SELECT LOAN_ID FROM T24_LOAN WHERE LOAN_STATUS <> 'CLOSED'")
+        self.loans = HotKeys([loan_id for loan_id, in cursor.fetchall()], CDC_ZIPF_EXPONENT, CDC_SEED + 1)
+        cursor.close()
+        self.run = uuid.uuid4().hex[:8].upper()
+
+    def transaction_purge(self, rng, n, worker):
+        ids = [(transaction_id,) for transaction_id in worker.purge_ids(n)]
+        return "DELETE FROM T24_TRANSACTION WHERE TRANSACTION_ID = %s", ids
+
+    def new_transaction(self, rng, n, worker):
+        rows = []
+        now = utc_now()
+        for (account_id, customer_id, currency), amount in zip(self.accounts.sample(rng, n),
+                                                                rng.lognormal(4.5, 1.2, n)):
+            transaction_id = f'CDC{self.run}{worker.number:03d}{worker.next_id():010d}'
+            worker.batch_inserted.append(transaction_id)
+            debit = rng.random() < 0.6
+            rows.append((transaction_id, account_id, customer_id, 'DEBIT' if debit else 'CREDIT',
+                         'DR01' if debit else 'CR01', round(float(amount), 2), currency, round(float(amount), 2),
+                         1.0, now.date(), now.date(), now,
+                         str(rng.choice(['MOBILE', 'INTERNET', 'ATM', 'BRANCH', 'POS'])),
+                         f'REF{worker.number:03d}{worker.count:010d}', 0))
+        return ("INSERT INTO T24_TRANSACTION (TRANSACTION_ID, ACCOUNT_ID, CUSTOMER_ID, TRANSACTION_TYPE, "
+                "TRANSACTION_CODE, AMOUNT, CURRENCY, AMOUNT_LCY, EXCHANGE_RATE, VALUE_DATE, BOOKING_DATE, "
+                "PROCESSING_TIME, CHANNEL, REFERENCE, REVERSAL_FLAG) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"), rows
+
+    def balance_update(self, rng, n, worker):
+        changes = np.round(rng.normal(0, 250, n), 2)
+        rows = [(float(change), float(change), account_id)
+                for (account_id, _, _), change in zip(self.accounts.sample(rng, n), changes)]
+        return ("UPDATE T24_ACCOUNT SET WORKING_BALANCE = WORKING_BALANCE + %s, "
+                "ONLINE_ACTUAL_BAL = ONLINE_ACTUAL_BAL + %s, LAST_ACTIVITY_DATE = CURRENT_DATE, "
+                "MODIFIED_DATE = CURRENT_TIMESTAMP WHERE ACCOUNT_ID = %s"), rows
+
+    def loan_dpd(self, rng, n, worker):
+        # Mostly cures and first misses; a few roll on towards default
+        days = rng.choice([0, 15, 45, 75, 120], size=n, p=[0.55, 0.2, 0.12, 0.08, 0.05])
+        rows = [(int(dpd), int(dpd) // 30, 'CURRENT' if dpd == 0 else ('DELINQUENT' if dpd < 90 else 'DEFAULT'),
+                 loan_id) for loan_id, dpd in zip(self.loans.sample(rng, n), days)]
+        return ("UPDATE T24_LOAN SET DAYS_PAST_DUE = %s, ARREARS_AMOUNT = MONTHLY_PAYMENT * %s, "
+                "LOAN_STATUS = %s, MODIFIED_DATE = CURRENT_TIMESTAMP "
+                "WHERE LOAN_ID = %s AND LOAN_STATUS <> 'CLOSED'"), rows
+
+class DigitalChanges:
+    """Mobile / internet banking activity on the digital banking tables"""
+
+    mix = {'event_purge': 2, 'session_event': 70, 'session_update': 15, 'profile_login': 13}
+
+    # Unquoted names: MySQL's tables are upper case, PostgreSQL folds them to lower case
+    event_types = ['PAGE_VIEW', 'BUTTON_CLICK', 'BALANCE_CHECK', 'TRANSFER', 'PAYMENT', 'SEARCH']
+    page_names = ['Dashboard', 'Accounts', 'Transfers', 'Payments', 'Profile', 'Settings']
+
+    def __init__(self, connection, dialect):
+        self.dialect = dialect
+        cursor = connection.cursor()
+        cursor.execute("SELECT SESSION_ID, DIGITAL_ID, CUSTOMER_ID FROM DIGITAL_SESSION")
+        self.sessions = HotKeys(cursor.fetchall(), CDC_ZIPF_EXPONENT, CDC_SEED)
+        cursor.execute("SELECT DIGITAL_ID FROM DIGITAL_CUSTOMER_PROFILE")
+        self.profiles = HotKeys([digital_id for digital_id, in cursor.fetchall()], CDC_ZIPF_EXPONENT, CDC_SEED + 1)
+        cursor.close()
+
+    def event_purge(self, rng, n, worker):
+        ids = [(event_id,) for event_id in worker.purge_ids(n)]
+        return "DELETE FROM DIGITAL_EVENT WHERE EVENT_ID = %s", ids
+
+    def session_event(self, rng, n, worker):
+        rows = []
+        now = utc_now()
+        for session_id, digital_id, customer_id in self.sessions.sample(rng, n):
+            event_id = str(uuid.uuid4())
+            worker.batch_inserted.append(event_id)
+            event_type = str(rng.choice(self.event_types))
+            success = bool(rng.random() > 0.05)
+            rows.append((event_id, session_id, digital_id, customer_id, event_type, event_type.title(), now,
+                         str(rng.choice(self.page_names)), f'element_{int(rng.integers(1, 200))}',
+                         f'{{"action": "{event_type}", "value": {int(rng.integers(1, 1000))}}}',
+                         int(rng.integers(50, 2000)), success,
+                         None if success else f'ERR_{int(rng.integers(100, 999))}', now))
+        return ("INSERT INTO DIGITAL_EVENT (EVENT_ID, SESSION_ID, DIGITAL_ID, CUSTOMER_ID, EVENT_TYPE, EVENT_NAME, "
+                "EVENT_TIMESTAMP, PAGE_NAME, ELEMENT_ID, EVENT_DATA, RESPONSE_TIME_MS, SUCCESS, ERROR_CODE, "
+                "CREATED_DATE) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"), rows
+
+    def session_update(self, rng, n, worker):
+        now = utc_now()
+        rows = [(now, int(pages), int(errors), session_id)
+                for (session_id, _, _), pages, errors in zip(self.sessions.sample(rng, n),
+                                                               rng.integers(1, 4, n), rng.random(n) < 0.05)]
+        return ("UPDATE DIGITAL_SESSION SET SESSION_END = %s, PAGES_VIEWED = PAGES_VIEWED + %s, "
+                "ERROR_COUNT = ERROR_COUNT + %s WHERE SESSION_ID = %s"), rows
+
+    def profile_login(self, rng, n, worker):
+        now = utc_now()
+        rows = [(now, now, digital_id) for digital_id in self.profiles.sample(rng, n)]
+        return ("UPDATE DIGITAL_CUSTOMER_PROFILE SET LAST_LOGIN = %s, LOGIN_COUNT = LOGIN_COUNT + 1, "
+                "MODIFIED_DATE = %s WHERE DIGITAL_ID = %s"), rows
+
+def operation_mix(changes):
+    """[(name, weight)] from CDC_MIX, or the source's default mix"""
+    mix = dict(changes.mix)
+    if CDC_MIX:
+        mix = {name.strip(): float(weight) for name, weight in (item.split('=') for item in CDC_MIX.split(','))}
+        unknown = set(mix) - set(changes.mix)
+        if unknown:
+            raise ValueError(f"unknown {CDC_TARGET} operations in CDC_MIX: {', '.join(sorted(unknown))}; "
+                             f"expected {', '.join(changes.mix)}")
+    # Purges first: a batch never deletes the rows it inserts
+    return [(name, mix.get(name, 0)) for name in changes.mix]
+
+# ============================================
+# WORKERS
+# ============================================
+
+class Stats:
+    """Operations and commit latencies, shared by the workers"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ops = Counter()
+        self.commits = 0
+        self.latencies = []
+        self.errors = 0
+        self.last_error = None
+
+    def record(self, counts, seconds):
+        with self.lock:
+            self.ops.update(counts)
+            self.commits += 1
+            self.latencies.append(seconds)
+
+    def failed(self, error):
+        with self.lock:
+            self.errors += 1
+            self.last_error = error
+
+    def drain_latencies(self):
+        with self.lock:
+            latencies, self.latencies = self.latencies, []
+        return latencies
+
+class Worker:
+    """One connection applying batches of changes"""
+
+    def __init__(self, number, connection, changes, mix, bucket, stats, stopped):
+        self.number = number
+        self.connection = connection
+        self.changes = changes
+        self.names = [name for name, _ in mix]
+        weights = np.array([weight for _, weight in mix], dtype=float)
+        self.weights = weights / weights.sum()
+        self.bucket = bucket
+        self.stats = stats
+        self.stopped = stopped
+        self.rng = np.random.default_rng([CDC_SEED, number])
+        # Committed inserts still to purge; the current batch's are applied only once it commits
+        self.inserted = deque()
+        self.batch_inserted = []
+        self.batch_purged = []
+        self.count = 0
+
+    def next_id(self):
+        self.count += 1
+        return self.count
+
+    def purge_ids(self, n):
+        """Up to n of the oldest committed inserts, put back if the batch rolls back"""
+        ids = [self.inserted.popleft() for _ in range(min(n, len(self.inserted)))]
+        self.batch_purged.extend(ids)
+        return ids
+
+    def run(self):
+        while not self.stopped.is_set():
+            self.bucket.take(CDC_BATCH_OPS)
+            counts = self.rng.multinomial(CDC_BATCH_OPS, self.weights)
+            start = time.perf_counter()
+            done = {}
+            self.batch_inserted, self.batch_purged = [], []
+            cursor = self.connection.cursor()
+            try:
+                for name, count in zip(self.names, counts):
+                    if count:
+                        sql, rows = getattr(self.changes, name)(self.rng, int(count), self)
+                        if rows:
+                            cursor.executemany(bind(sql, self.changes.dialect), rows)
+                            # Rows actually changed (an UPDATE of a closed loan changes none)
+                            done[name] = cursor.rowcount if cursor.rowcount >= 0 else len(rows)
+                self.connection.commit()
+                self.inserted.extend(self.batch_inserted)
+                self.stats.record(done, time.perf_counter() - start)
+            except Exception as e:
+                # Lock timeouts / deadlocks on hot keys: count them and carry on
+                self.connection.rollback()
+                self.inserted.extendleft(reversed(self.batch_purged))
+                self.stats.failed(e)
+            finally:
+                cursor.close()
+
+def heartbeat(connection, dialect, stopped):
+    """One CDC_HEARTBEAT row per second, for measuring replication lag downstream"""
+    cursor = connection.cursor()
+    if dialect == 'oracle':
+        cursor.execute("SELECT COUNT(*) FROM USER_TABLES WHERE TABLE_NAME = :1", [HEARTBEAT_TABLE])
+        exists = cursor.fetchone()[0] > 0
+    else:
+        exists = False
+    if not exists:
+        cursor.execute(HEARTBEAT_DDL[dialect])
+    cursor.execute(f"SELECT COALESCE(MAX(HEARTBEAT_ID), 0) FROM {HEARTBEAT_TABLE}")
+    beat = int(cursor.fetchone()[0])
+    connection.commit()
+    while not stopped.wait(1.0):
+        beat += 1
+        cursor.execute(bind(f"INSERT INTO {HEARTBEAT_TABLE} (HEARTBEAT_ID, SENT_AT) VALUES (%s, %s)", dialect),
+                       [beat, utc_now()])
+        connection.commit()
+    cursor.close()
+
+# ============================================
+# MAIN
+# ============================================
+
+def open_source():
+    """(connect function, changes) for CDC_TARGET"""
+    if CDC_TARGET == 'oracle':
+        import generate_t24_data as source
+        connect = source.get_oracle_connection
+        return connect, lambda connection: T24Changes(connection)
+    if CDC_TARGET == 'postgres':
+        import generate_postgres_data as source
+        connect = source.get_postgres_connection
+    elif CDC_TARGET == 'mysql':
+        import generate_mysql_data as source
+        connect = source.get_mysql_connection
+    else:
+        raise ValueError(f"CDC_TARGET must be oracle, postgres or mysql, not {CDC_TARGET!r}")
+    return connect, lambda connection: DigitalChanges(connection, CDC_TARGET)
+
+def report(stats, seconds, last_ops):
+    """One progress line; returns the operation total"""
+    latencies = np.array(stats.drain_latencies() or [0.0]) * 1000
+    total = sum(stats.ops.values())
+    print(f"   {seconds:>7.0f}s  {(total - last_ops) / CDC_REPORT_SECONDS:>9,.0f} ops/s  "
+          f"commit p50 {np.percentile(latencies, 50):>6.1f} ms  p99 {np.percentile(latencies, 99):>7.1f} ms  "
+          f"errors {stats.errors:,}")
+    return total
+
+def main():
+    print("=" * 70)
+    print("Synthetic CDC Change Stream")
+    print("=" * 70)
+    print(f"Target: {CDC_TARGET}, {CDC_OPS_PER_SECOND:,.0f} ops/s over {CDC_WORKERS} connections, "
+          f"{CDC_BATCH_OPS} ops per transaction")
+    print(f"Key skew: Zipf exponent {CDC_ZIPF_EXPONENT}")
+    print(f"Duration: {f'{CDC_DURATION_SECONDS:.0f}s' if CDC_DURATION_SECONDS else 'until interrupted'}")
+    print("=" * 70)
+    print()
+
+    connect, make_changes = open_source()
+    connections = [connect() for _ in range(CDC_WORKERS + 1)]
+    if any(connection is None for connection in connections):
+        return
+    print("\n🔑 Loading keys...")
+    changes = make_changes(connections[0])
+    mix = operation_mix(changes)
+    print(f"✅ Mix: {', '.join(f'{name} {weight:g}' for name, weight in mix)}\n")
+
+    bucket = TokenBucket(CDC_OPS_PER_SECOND, max(CDC_BATCH_OPS, CDC_OPS_PER_SECOND / 10))
+    stats = Stats()
+    stopped = threading.Event()
+    workers = [Worker(i, connection, changes, mix, bucket, stats, stopped)
+               for i, connection in enumerate(connections[1:])]
+    threads = [threading.Thread(target=worker.run, name=f'cdc-worker-{worker.number}', daemon=True)
+               for worker in workers]
+    threads.append(threading.Thread(target=heartbeat, args=(connections[0], changes.dialect, stopped),
+                                    name='cdc-heartbeat', daemon=True))
+    for thread in threads:
+        thread.start()
+
+    print(f"🔄 Applying changes (report every {CDC_REPORT_SECONDS:.0f}s, Ctrl-C to stop)...")
+    start = time.perf_counter()
+    last_ops = 0
+    try:
+        while not CDC_DURATION_SECONDS or time.perf_counter() - start < CDC_DURATION_SECONDS:
+            time.sleep(CDC_REPORT_SECONDS)
+            last_ops = report(stats, time.perf_counter() - start, last_ops)
+    except KeyboardInterrupt:
+        print("\n⏹️  Stopping...")
+    stopped.set()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    for connection in connections:
+        connection.close()
+
+    total = sum(stats.ops.values())
+    print("\n" + "=" * 70)
+    print(f"🎉 {total:,} operations in {stats.commits:,} transactions, {seconds:.0f}s "
+          f"({total / seconds:,.0f} ops/s, target {CDC_OPS_PER_SECOND:,.0f})")
+    for name, _ in mix:
+        print(f"   • {name:<20} {stats.ops[name]:>12,}")
+    if stats.errors:
+        print(f"⚠️  {stats.errors:,} transactions rolled back, last: {stats.last_error}")
+    print("=" * 70)
+    print(f"\n💡 Replication lag, once {HEARTBEAT_TABLE} is in the connector's TABLES:")
+    print(f"   SELECT DATEDIFF('millisecond', MAX(SENT_AT), SYSDATE()) AS LAG_MS FROM <destination schema>.{HEARTBEAT_TABLE};")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Direct DataFrame-to-Snowflake load path
+Generated chunks are converted to typed Parquet in memory, PUT into the stage
+from a byte stream, and COPYed into their tables - no CSV, and nothing written
+to local disk.
+
+StageWriter has the same interface as output_writer.RollingWriter, so the
+generators switch between files and Snowflake with OUTPUT_TARGET alone.
+"""
+
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from output_writer import arrow_schema, table_for_file, to_arrow
+from stage_loader import copy_table
+
+# Stage sub-directory the Parquet parts are PUT into (cleared before and after a load)
+DIRECT_STAGE_PREFIX = os.getenv('DIRECT_STAGE_PREFIX', 'direct')
+
+# Background PUTs per process, so generation continues while a part uploads
+DIRECT_UPLOAD_WORKERS = int(os.getenv('DIRECT_UPLOAD_WORKERS', '2'))
+
+# One connection and upload pool per process (sharded workers each open their own)
+_connection = None
+_uploads = None
+
+def _forget_parent_state():
+    # A forked worker must not share the parent's socket or upload threads
+    global _connection, _uploads
+    _connection = _uploads = None
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_parent_state)
+
+def get_connection(connect):
+    """This process's Snowflake connection, opened with connect() on first use"""
+    global _connection
+    if _connection is None:
+        _connection = connect()
+    return _connection
+
+def _upload_pool():
+    global _uploads
+    if _uploads is None:
+        _uploads = ThreadPoolExecutor(max_workers=DIRECT_UPLOAD_WORKERS)
+    return _uploads
+
+def stage_path(stage):
+    """@<stage>/<prefix> location of the direct-load parts"""
+    return f"{stage}/{DIRECT_STAGE_PREFIX}"
+
+def put_stream(conn, stream, filename, stage):
+    """PUT an in-memory file into the stage under filename"""
+    cursor = conn.cursor()
+    try:
+        # The connector takes the staged name from the file:// path and the bytes from file_stream
+        cursor.execute(f"PUT file://{filename} @{stage_path(stage)} AUTO_COMPRESS=FALSE OVERWRITE=TRUE",
+                       file_stream=stream)
+    finally:
+        cursor.close()
+
+def clear_stage(conn, stage):
+    """Remove every direct-load part from the stage"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"REMOVE @{stage_path(stage)}/")
+    finally:
+        cursor.close()
+
+# ============================================
+# STAGE WRITER
+# ============================================
+
+class StageWriter:
+    """Append DataFrame chunks to in-memory Parquet parts PUT as <table>_<part:05d>.parquet
+
+    Parts roll over every rows_per_file rows (0 = one part per table). Uploads
+    run in the background; close() waits for them and raises the first error.
+    """
+
+    def __init__(self, conn, stage, filename, rows_per_file=0):
+        self.conn = conn
+        self.stage = stage
+        self.table = filename
+        self.rows_per_file = rows_per_file
+        self.stem = os.path.splitext(filename)[0]
+        self.files = {}  # staged filename -> rows
+        self.uploads = []
+        self.schema = None
+        self.buffer = None
+        self.sink = None
+        self.current = None
+        self.current_rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _open(self, df):
+        """Start a new in-memory part"""
+        import pyarrow.parquet as pq
+        if self.schema is None:
+            self.schema = arrow_schema(self.table, df)
+        self.current = f'{self.stem}_{len(self.files):05d}.parquet'
+        self.buffer = io.BytesIO()
+        self.sink = pq.ParquetWriter(self.buffer, self.schema, compression='snappy')
+        self.files[self.current] = 0
+        self.current_rows = 0
+
+    def _flush(self):
+        """Finish the current part and hand it to the upload pool"""
+        if self.sink is None:
+            return
+        self.sink.close()
+        self.buffer.seek(0)
+        # Bound memory: wait for the oldest part once enough of this table's parts are in flight
+        pending = [future for future in self.uploads if not future.done()]
+        if len(pending) >= DIRECT_UPLOAD_WORKERS:
+            pending[0].result()
+        self.uploads.append(_upload_pool().submit(put_stream, self.conn, self.buffer, self.current, self.stage))
+        self.sink = self.buffer = None
+
+    def write(self, df):
+        """Append a chunk (one row group), splitting it across parts when needed"""
+        start = 0
+        while start < len(df) or self.sink is None:
+            if self.sink is None or (self.rows_per_file and self.current_rows >= self.rows_per_file):
+                self._flush()
+                self._open(df)
+            take = len(df) - start
+            if self.rows_per_file:
+                take = min(take, self.rows_per_file - self.current_rows)
+            self.sink.write_table(to_arrow(df.iloc[start:start + take], self.schema))
+            self.current_rows += take
+            self.files[self.current] += take
+            start += take
+        return self
+
+    def close(self):
+        """Upload the last part, wait for every PUT and return {filename: rows}"""
+        self._flush()
+        for future in self.uploads:
+            future.result()
+        self.uploads = []
+        return self.files
+
+# ============================================
+# COPY
+# ============================================
+
+def load_staged(conn, stage, written, table_mappings, copy_workers=4):
+    """TRUNCATE + COPY every table from its staged Parquet parts
+
+    written maps staged filename -> rows (as returned by the writers).
+    Returns the per-table results of stage_loader.copy_table.
+    """
+    by_table = {}
+    for filename in sorted(written):
+        by_table.setdefault(table_for_file(filename), []).append(filename)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=copy_workers) as copies:
+        futures = [copies.submit(copy_table, conn, stage_path(stage), filenames, *table_mappings[key])
+                   for key, filenames in by_table.items()]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result['error']:
+                print(f"✗ Failed to copy into {result['schema']}.{result['table']}: {result['error']}")
+            else:
+                print(f"✓ {result['schema']}.{result['table']}: {result['rows'] or 0:,} rows loaded "
+                      f"from {result['files']} Parquet part(s) in {result['seconds']:.1f}s")
+    return results
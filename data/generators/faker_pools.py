@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Pre-generated Faker value pools for the data generators
+Faker is the slowest part of generation, so names, emails, phones, addresses
+etc. are generated once per (seed, pool size, locale), cached to disk between
+runs, and then sampled and cheaply perturbed with NumPy indexing.
+"""
+
+import json
+import os
+
+import faker
+import numpy as np
+from faker import Faker
+
+# Values generated per pool
+POOL_SIZE = int(os.getenv('FAKER_POOL_SIZE', '5000'))
+
+# On-disk cache for generated pools (set FAKER_POOL_CACHE='' to disable)
+POOL_CACHE_DIR = os.getenv('FAKER_POOL_CACHE', os.path.join(
+    os.path.expanduser('~'), '.cache', 'snowflake_faker_pools'))
+
+# Pool name -> Faker provider
+PROVIDERS = ('email', 'phone_number', 'user_name', 'name', 'company', 'address', 'city')
+
+# Pools already loaded in this process
+_loaded = {}
+
+def _cache_path(seed, pool_size, locale):
+    # Faker's version is part of the key: providers change output between releases
+    return os.path.join(POOL_CACHE_DIR, f'pools_{locale}_{seed}_{pool_size}_faker{faker.VERSION}.json')
+
+def build_pools(seed, pool_size=POOL_SIZE, locale='en_US'):
+    """Generate every pool with Faker (slow path)"""
+    fake = Faker(locale)
+    fake.seed_instance(seed)
+    return {name: [getattr(fake, name)() for _ in range(pool_size)] for name in PROVIDERS}
+
+def load_pools(seed, pool_size=POOL_SIZE, locale='en_US'):
+    """Pools for (seed, pool_size, locale): from memory, then the disk cache, then Faker"""
+    key = (seed, pool_size, locale)
+    if key in _loaded:
+        return _loaded[key]
+
+    path = _cache_path(seed, pool_size, locale) if POOL_CACHE_DIR else None
+    if path and os.path.exists(path):
+        with open(path) as f:
+            values = json.load(f)
+    else:
+        values = build_pools(seed, pool_size, locale)
+        if path:
+            os.makedirs(POOL_CACHE_DIR, exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(values, f)
+            os.replace(tmp_path, path)  # atomic, so parallel workers never read a partial file
+
+    _loaded[key] = {name: np.array(values[name], dtype=object) for name in PROVIDERS}
+    return _loaded[key]
+
+# ============================================
+# SAMPLING AND PERTURBATION
+# ============================================
+
+def sample(rng, pool, n):
+    """Draw n values from a pool"""
+    return pool[rng.integers(0, len(pool), n)]
+
+def truncate(values, max_length):
+    """Vectorized value[:max_length]"""
+    return np.asarray(values).astype(f'U{max_length}').astype(object)
+
+def perturb_emails(rng, pools, n):
+    """Emails recombined from pooled user names and pooled domains, plus a random 0-99 suffix
+
+    Widens a pool of POOL_SIZE emails to ~POOL_SIZE^2 * 100 distinct values at
+    sampling cost only.
+    """
+    domains = np.array([email.split('@', 1)[1] for email in pools['email']], dtype=object)
+    local = sample(rng, pools['user_name'], n).astype(str)
+    suffix = np.where(rng.random(n) < 0.5, rng.integers(0, 100, n).astype(str), '')
+    return np.char.add(np.char.add(np.char.add(local, suffix), '@'),
+                       sample(rng, domains, n).astype(str)).astype(object)
+
+def unique_usernames(rng, pools, numbers, max_length=50, width=6):
+    """Pooled user names with a _<number:06d> suffix, so they are unique per customer number
+
+    The base is trimmed to leave room for the suffix, as the UNIQUE USERNAME
+    column in the MySQL schema requires.
+    """
+    base = truncate(sample(rng, pools['user_name'], len(numbers)), max_length - width - 1).astype(str)
+    digits = np.char.zfill(np.asarray(numbers, dtype=np.int64).astype(str), width)
+    return np.char.add(np.char.add(base, '_'), digits).astype(object)
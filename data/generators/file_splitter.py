@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Split large generated CSV files into compressed parts for parallel COPY INTO
+Snowflake loads the files of one COPY in parallel, but a single file is read by
+one thread, so big tables load fastest as many ~100-250MB compressed parts.
+
+Files are cut on record boundaries only: a newline inside a quoted field
+(e.g. a multi-line address) never ends a part. Every part gets the header, so
+the usual SKIP_HEADER = 1 file format applies. Parts are named like the
+generator's own rolling parts (digital_event_00000.csv.gz, ...), so one PATTERN
+per table picks up every file of that table.
+"""
+
+import gzip
+import io
+import os
+import re
+
+import numpy as np
+
+from output_writer import format_for_file
+
+# Target compressed size per part; CSVs larger than this on disk are split
+SPLIT_TARGET_MB = float(os.getenv('SPLIT_TARGET_MB', '150'))
+# gzip level for the parts: level 1 is ~3x faster than 6 for ~10% larger files
+SPLIT_COMPRESSLEVEL = int(os.getenv('SPLIT_COMPRESSLEVEL', '1'))
+
+READ_BLOCK_SIZE = 8 * 1024 * 1024
+MB = 1024 * 1024
+
+# ============================================
+# RECORD BOUNDARIES
+# ============================================
+
+def open_binary(path):
+    """Decompressed byte stream of a csv, csv.gz or csv.zst file"""
+    fmt = format_for_file(os.path.basename(path))
+    if fmt == 'csv.zst':
+        import pyarrow as pa
+        return io.BufferedReader(pa.CompressedInputStream(pa.OSFile(path), 'zstd'), READ_BLOCK_SIZE)
+    if fmt == 'csv.gz':
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+def record_boundary(buffer):
+    """Index just past the last newline in buffer that ends a CSV record (0 if none)
+
+    buffer must start on a record boundary. A newline ends a record when the
+    quotes before it are balanced; escaped quotes ("") keep the count even.
+    """
+    quotes = buffer.count(b'"')
+    end = len(buffer)
+    while True:
+        newline = buffer.rfind(b'\n', 0, end)
+        if newline < 0:
+            return 0
+        quotes -= buffer.count(b'"', newline + 1, end)
+        if quotes % 2 == 0:
+            return newline + 1
+        end = newline
+
+def count_records(chunk):
+    """Records in a chunk of whole CSV records, not counting newlines inside quotes"""
+    if b'"' not in chunk:
+        return chunk.count(b'\n')
+    # Running XOR over quote characters is True inside a quoted field
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    inside = np.bitwise_xor.accumulate(data == ord('"'))
+    return int(np.count_nonzero((data == ord('\n')) & ~inside))
+
+# ============================================
+# SPLITTING
+# ============================================
+
+def split_csv(path, output_dir, target_mb=SPLIT_TARGET_MB, compresslevel=SPLIT_COMPRESSLEVEL):
+    """Split one CSV into <stem>_<part:05d>.csv.gz parts of ~target_mb compressed
+
+    Returns {part_path: rows}.
+    """
+    stem = re.sub(r'\.csv(\.gz|\.zst)?$', '', os.path.basename(path))
+    target_bytes = target_mb * MB
+    parts = {}
+    raw = sink = None
+
+    def open_part():
+        nonlocal raw, sink
+        close_part()
+        part_path = os.path.join(output_dir, f'{stem}_{len(parts):05d}.csv.gz')
+        raw = open(part_path, 'wb')
+        sink = gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=compresslevel)
+        sink.write(header)
+        parts[part_path] = 0
+        return part_path
+
+    def close_part():
+        if sink is not None:
+            sink.close()
+            raw.close()
+
+    with open_binary(path) as source:
+        header = source.readline()
+        if header and not header.endswith(b'\n'):
+            header += b'\n'
+        part_path, carry = open_part(), b''
+        while True:
+            block = source.read(READ_BLOCK_SIZE)
+            buffer = carry + block
+            cut = record_boundary(buffer) if block else len(buffer)
+            chunk, carry = buffer[:cut], buffer[cut:]
+            if chunk:
+                if not chunk.endswith(b'\n'):
+                    chunk += b'\n'  # last record without a trailing newline
+                # raw.tell() is the compressed size so far
+                if parts[part_path] and raw.tell() >= target_bytes:
+                    part_path = open_part()
+                sink.write(chunk)
+                parts[part_path] += count_records(chunk)
+            if not block:
+                break
+    close_part()
+    return parts
+
+def needs_split(path, target_mb=SPLIT_TARGET_MB):
+    """CSV family files larger than the target part size"""
+    return (target_mb > 0 and format_for_file(os.path.basename(path)) != 'parquet'
+            and os.path.getsize(path) > target_mb * MB)
+
+def table_pattern(key):
+    """COPY PATTERN matching every CSV file and part of a table (t24_customer.csv)"""
+    stem = re.escape(key[:-len('.csv')])
+    return f"(.*/)?{stem}(_[0-9]{{5}})*[.]csv([.]gz|[.]zst)?"
+
+def split_plan(plan, csv_dir, split_dir, target_mb=SPLIT_TARGET_MB, compresslevel=SPLIT_COMPRESSLEVEL):
+    """Replace large files in reload entries of a copy plan with their split parts
+
+    Split tables are re-staged completely (the old staged files are removed
+    first) and COPYed by PATTERN, so the stage never mixes old and new parts.
+    Append entries are left alone. Returns {source filename: {part_path: rows}}.
+    """
+    splits = {}
+    for key, entry in plan.items():
+        if not entry['truncate'] or not entry['upload']:
+            continue
+        sources = [os.path.join(csv_dir, f) for f in entry['copy']]
+        if not any(needs_split(path, target_mb) for path in sources):
+            continue
+        uploads = []
+        for path in sources:
+            if needs_split(path, target_mb):
+                parts = split_csv(path, split_dir, target_mb, compresslevel)
+                splits[os.path.basename(path)] = parts
+                uploads.extend(parts)
+            else:
+                uploads.append(path)
+        entry['upload'] = uploads
+        entry['copy'] = [os.path.basename(p) for p in uploads]
+        entry['pattern'] = table_pattern(key)
+    return splits
@@ -12,34 +12,103 @@ import random
 import os
 from tqdm import tqdm
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import direct_loader
+import faker_pools
+import vectorized_engine as ve
+from key_registry import KeyRegistry
+from output_writer import RollingWriter, clear_outputs, table_for_file
+
+# Generation engine: 'loop' (row-by-row Faker) or 'vectorized' (columnar NumPy)
+GENERATION_ENGINE = os.getenv('GENERATION_ENGINE', 'loop')
+SEED = int(os.getenv('SEED', '42'))
 
 # Initialize
 fake = Faker()
-Faker.seed(42)
-np.random.seed(42)
-random.seed(42)
-
-# Configuration - REDUCED volumes for faster demo
-NUM_CUSTOMERS = 3000
-NUM_ACCOUNTS = 5400  # 1.8 per customer
-NUM_LOANS = 1200  # 40% of customers
-NUM_TRANSACTIONS = 30000
-NUM_PAYMENT_SCHEDULES = 15000
-NUM_DIGITAL_SESSIONS = 15000  # 5 per customer
-NUM_DIGITAL_EVENTS = 60000  # 4 per session
-NUM_CREDIT_INQUIRIES = 12000
-NUM_TRADELINES = 18000  # 6 per customer
+Faker.seed(SEED)
+np.random.seed(SEED)
+random.seed(SEED)
+
+# Generator for sampling the pre-generated Faker value pools (see faker_pools.py)
+pool_rng = np.random.default_rng(SEED)
+
+# Scale factor: SF=1 is the base demo volume below, SF=1000 is ~3M customers
+SCALE_FACTOR = float(os.getenv('SCALE_FACTOR', '1'))
+
+# Sharded generation (vectorized engine): customers per shard and worker processes
+CUSTOMERS_PER_SHARD = int(os.getenv('CUSTOMERS_PER_SHARD', '50000'))
+WORKERS = int(os.getenv('WORKERS', str(os.cpu_count() or 1)))
+
+# Reference timestamp shared by all shards (ISO format, defaults to now)
+AS_OF = os.getenv('AS_OF')
+
+# Reference tables are stamped with a fixed time (AS_OF when set), so regenerating
+# them gives identical files that the upload manifest skips
+REFERENCE_DATE = datetime.fromisoformat(AS_OF) if AS_OF else datetime(2024, 1, 1)
+
+# Configuration - REDUCED volumes for faster demo (SF=1)
+NUM_CUSTOMERS = int(3000 * SCALE_FACTOR)
+NUM_ACCOUNTS = int(5400 * SCALE_FACTOR)  # 1.8 per customer
+NUM_LOANS = int(1200 * SCALE_FACTOR)  # 40% of customers
+NUM_TRANSACTIONS = int(30000 * SCALE_FACTOR)
+NUM_PAYMENT_SCHEDULES = int(15000 * SCALE_FACTOR)
+NUM_DIGITAL_SESSIONS = int(15000 * SCALE_FACTOR)  # 5 per customer
+NUM_DIGITAL_EVENTS = int(60000 * SCALE_FACTOR)  # 4 per session
+NUM_CREDIT_INQUIRIES = int(12000 * SCALE_FACTOR)
+NUM_TRADELINES = int(18000 * SCALE_FACTOR)  # 6 per customer
 
 # Output directory
-OUTPUT_DIR = 'data/generated_csv'
+OUTPUT_DIR = os.getenv('OUTPUT_DIR', 'data/generated_csv')
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-print("=" * 80)
-print("🏦 SNOWFLAKE CREDIT DECISIONING - DATA GENERATOR")
-print("=" * 80)
-print(f"Generating {NUM_CUSTOMERS:,} customers with ALL related data")
-print(f"Output directory: {OUTPUT_DIR}")
-print("=" * 80)
+# Streaming output: rows buffered per chunk, and rows per output file before rolling (0 = never split)
+CHUNK_SIZE = int(os.getenv('CHUNK_SIZE', '100000'))
+ROWS_PER_FILE = int(os.getenv('ROWS_PER_FILE', '1000000'))
+
+# Output format: csv, csv.gz, csv.zst or parquet (typed from the Snowflake DDL)
+OUTPUT_FORMAT = os.getenv('OUTPUT_FORMAT', 'csv')
+
+# Output target: 'files' (OUTPUT_DIR) or 'snowflake' (in-memory Parquet PUT straight
+# into the stage and COPYed, no CSV on disk - see direct_loader.py)
+OUTPUT_TARGET = os.getenv('OUTPUT_TARGET', 'files')
+
+# ============================================
+# OUTPUT
+# ============================================
+
+# Rows written per output file, reported in the summary
+written_rows = {}
+
+def snowflake_connection():
+    """This process's Snowflake connection for the direct load path"""
+    # Imported lazily: only the snowflake target needs the connector
+    from upload_to_snowflake import connect_to_snowflake
+    return direct_loader.get_connection(connect_to_snowflake)
+
+def table_writer(filename):
+    """Open a rolling writer for one output table"""
+    if OUTPUT_TARGET == 'snowflake':
+        from upload_to_snowflake import SNOWFLAKE_STAGE
+        return direct_loader.StageWriter(snowflake_connection(), SNOWFLAKE_STAGE, filename, ROWS_PER_FILE)
+    return RollingWriter(OUTPUT_DIR, filename, ROWS_PER_FILE, OUTPUT_FORMAT)
+
+def flush_chunk(writer, rows, force=False):
+    """Write buffered row dicts as one chunk once CHUNK_SIZE is reached"""
+    if rows and (force or len(rows) >= CHUNK_SIZE):
+        writer.write(pd.DataFrame(rows))
+        rows.clear()
+
+def finish_table(writer, rows):
+    """Flush the last chunk and record the files written; returns the table row count"""
+    flush_chunk(writer, rows, force=True)
+    files = writer.close()
+    written_rows.update(files)
+    return sum(files.values())
+
+def write_table(df, filename):
+    """Write a whole DataFrame through the rolling writer"""
+    return finish_table(table_writer(filename).write(df), [])
 
 # ============================================
 # 1. DIGITAL BANKING DATA
@@ -52,15 +121,26 @@ def generate_digital_customer_profile(num_customers):
     customers = []
     customer_ids = [f'CUS-{i:06d}' for i in range(num_customers)]
     
-    for customer_id in tqdm(customer_ids):
+    # Faker-backed columns are sampled from the pre-generated value pools
+    pools = faker_pools.load_pools(SEED)
+    now, _ = ve.reference_times(datetime.now())
+    emails = faker_pools.perturb_emails(pool_rng, pools, num_customers)
+    mobile_numbers = faker_pools.truncate(faker_pools.sample(pool_rng, pools['phone_number'], num_customers), 20)
+    usernames = faker_pools.truncate(faker_pools.sample(pool_rng, pools['user_name'], num_customers), 30)
+    registration_dates = ve.datetimes_between(pool_rng, now, num_customers, 3 * 365 * 86400).tolist()
+    last_logins = ve.datetimes_between(pool_rng, now, num_customers, 30 * 86400).tolist()
+    ekyc_dates = ve.datetimes_between(pool_rng, now, num_customers, 2 * 365 * 86400).tolist()
+    created_dates = ve.datetimes_between(pool_rng, now, num_customers, 3 * 365 * 86400).tolist()
+    
+    for i, customer_id in enumerate(tqdm(customer_ids)):
         customers.append({
             'DIGITAL_ID': str(uuid.uuid4()),
             'CUSTOMER_ID': customer_id,
-            'EMAIL': fake.email(),
-            'MOBILE_NUMBER': fake.phone_number()[:20],
-            'USERNAME': fake.user_name()[:30],
-            'REGISTRATION_DATE': fake.date_time_between(start_date='-3y', end_date='now'),
-            'LAST_LOGIN': fake.date_time_between(start_date='-30d', end_date='now'),
+            'EMAIL': emails[i],
+            'MOBILE_NUMBER': mobile_numbers[i],
+            'USERNAME': usernames[i],
+            'REGISTRATION_DATE': registration_dates[i],
+            'LAST_LOGIN': last_logins[i],
             'LOGIN_COUNT': random.randint(5, 500),
             'FAILED_LOGIN_COUNT': random.randint(0, 5),
             'MFA_ENABLED': random.choice([True, False]),
@@ -72,35 +152,38 @@ def generate_digital_customer_profile(num_customers):
             'EMAIL_VERIFIED': random.choice([True, False]),
             'MOBILE_VERIFIED': random.choice([True, False]),
             'EKYC_STATUS': random.choice(['VERIFIED', 'PENDING', 'REJECTED']),
-            'EKYC_DATE': fake.date_time_between(start_date='-2y', end_date='now') if random.random() > 0.1 else None,
+            'EKYC_DATE': ekyc_dates[i] if random.random() > 0.1 else None,
             'PREFERRED_LANGUAGE': random.choice(['EN', 'ZH', 'MS', 'TA']),
             'TIMEZONE': 'Asia/Singapore',
-            'CREATED_DATE': fake.date_time_between(start_date='-3y', end_date='now'),
+            'CREATED_DATE': created_dates[i],
             'MODIFIED_DATE': datetime.now()
         })
     
     df = pd.DataFrame(customers)
-    df.to_csv(f'{OUTPUT_DIR}/digital_customer_profile.csv', index=False)
+    write_table(df, 'digital_customer_profile.csv')
     print(f"✓ Created {len(df):,} digital customer profiles")
     return df
 
-def generate_digital_sessions(digital_df):
-    """Generate digital banking sessions"""
+def generate_digital_sessions(keys):
+    """Generate digital banking sessions, registering their keys for the child events"""
     print("\n📱 Generating Digital Sessions...")
     
     sessions = []
-    customer_ids = digital_df['CUSTOMER_ID'].tolist()
-    digital_ids = dict(zip(digital_df['CUSTOMER_ID'], digital_df['DIGITAL_ID']))
+    session_ids = []
+    session_starts = []
+    writer = table_writer('digital_session.csv')
+    parents = keys.sample_customers(pool_rng, NUM_DIGITAL_SESSIONS)
+    customer_ids = keys.customer_ids[parents]
+    digital_ids = keys.digital_ids[parents]
     
-    for _ in tqdm(range(NUM_DIGITAL_SESSIONS)):
-        customer_id = random.choice(customer_ids)
+    for i in tqdm(range(NUM_DIGITAL_SESSIONS)):
         session_start = fake.date_time_between(start_date='-90d', end_date='now')
         duration = random.randint(30, 3600)
         
         sessions.append({
             'SESSION_ID': str(uuid.uuid4()),
-            'DIGITAL_ID': digital_ids[customer_id],
-            'CUSTOMER_ID': customer_id,
+            'DIGITAL_ID': digital_ids[i],
+            'CUSTOMER_ID': customer_ids[i],
             'SESSION_START': session_start,
             'SESSION_END': session_start + timedelta(seconds=duration),
             'DURATION_SECONDS': duration,
@@ -122,31 +205,40 @@ def generate_digital_sessions(digital_df):
             'EXIT_REASON': random.choice(['LOGOUT', 'TIMEOUT', 'COMPLETED', 'ERROR']),
             'CREATED_DATE': session_start
         })
+        # Only the keys are kept in memory for the child events
+        session_ids.append(sessions[-1]['SESSION_ID'])
+        session_starts.append(session_start)
+        flush_chunk(writer, sessions)
     
-    df = pd.DataFrame(sessions)
-    df.to_csv(f'{OUTPUT_DIR}/digital_session.csv', index=False)
-    print(f"✓ Created {len(df):,} digital sessions")
-    return df
+    keys.register_sessions(session_ids, parents, session_starts)
+    rows = finish_table(writer, sessions)
+    print(f"✓ Created {rows:,} digital sessions")
+    return rows
 
-def generate_digital_events(sessions_df):
-    """Generate digital banking events"""
+def generate_digital_events(keys):
+    """Generate digital banking events for the registered sessions"""
     print("\n📱 Generating Digital Events...")
     
     events = []
-    session_data = sessions_df[['SESSION_ID', 'DIGITAL_ID', 'CUSTOMER_ID', 'SESSION_START']].to_dict('records')
+    writer = table_writer('digital_event.csv')
+    parents = keys.sample_sessions(pool_rng, NUM_DIGITAL_EVENTS)
+    session_ids = keys.session_ids[parents]
+    session_starts = keys.session_start[parents]
+    customers = keys.session_customer[parents]
+    digital_ids = keys.digital_ids[customers]
+    customer_ids = keys.customer_ids[customers]
     
-    for _ in tqdm(range(NUM_DIGITAL_EVENTS)):
-        session = random.choice(session_data)
+    for i in tqdm(range(NUM_DIGITAL_EVENTS)):
         event_types = ['PAGE_VIEW', 'BUTTON_CLICK', 'TRANSACTION', 'SEARCH', 'FORM_SUBMIT']
         
         events.append({
             'EVENT_ID': str(uuid.uuid4()),
-            'SESSION_ID': session['SESSION_ID'],
-            'DIGITAL_ID': session['DIGITAL_ID'],
-            'CUSTOMER_ID': session['CUSTOMER_ID'],
+            'SESSION_ID': session_ids[i],
+            'DIGITAL_ID': digital_ids[i],
+            'CUSTOMER_ID': customer_ids[i],
             'EVENT_TYPE': random.choice(event_types),
             'EVENT_NAME': random.choice(['account_view', 'transfer', 'bill_payment', 'balance_check', 'statement_download']),
-            'EVENT_TIMESTAMP': session['SESSION_START'] + timedelta(seconds=random.randint(0, 3600)),
+            'EVENT_TIMESTAMP': session_starts[i] + timedelta(seconds=random.randint(0, 3600)),
             'PAGE_NAME': random.choice(['Dashboard', 'Accounts', 'Transfer', 'Bills', 'Profile']),
             'ELEMENT_ID': f'btn_{random.randint(1, 100)}',
             'EVENT_DATA': '{"amount": 1000, "currency": "SGD"}',
@@ -154,45 +246,53 @@ def generate_digital_events(sessions_df):
             'SUCCESS': random.choice([True, True, True, False]),
             'ERROR_CODE': None if random.random() > 0.1 else f'ERR_{random.randint(100, 999)}',
             'ERROR_MESSAGE': None if random.random() > 0.1 else 'Timeout error',
-            'CREATED_DATE': session['SESSION_START']
+            'CREATED_DATE': session_starts[i]
         })
+        flush_chunk(writer, events)
     
-    df = pd.DataFrame(events)
-    df.to_csv(f'{OUTPUT_DIR}/digital_event.csv', index=False)
-    print(f"✓ Created {len(df):,} digital events")
-    return df
+    rows = finish_table(writer, events)
+    print(f"✓ Created {rows:,} digital events")
+    return rows
 
 def generate_digital_kyc(digital_df):
     """Generate KYC documents"""
     print("\n📱 Generating Digital KYC Documents...")
     
     kyc_docs = []
-    for _, row in tqdm(digital_df.iterrows(), total=len(digital_df)):
-        issue_date = fake.date_between(start_date='-10y', end_date='-1y')
+    n = len(digital_df)
+    now, today = ve.reference_times(datetime.now())
+    issue_dates = ve.days_ago(pool_rng, today, n, 10 * 365, 365).tolist()
+    document_numbers = ve.bothify_array(pool_rng, n, 2, 6)
+    upload_dates = ve.datetimes_between(pool_rng, now, n, 2 * 365 * 86400).tolist()
+    verification_dates = ve.datetimes_between(pool_rng, now, n, 2 * 365 * 86400).tolist()
+    created_dates = ve.datetimes_between(pool_rng, now, n, 2 * 365 * 86400).tolist()
+    
+    for i, (_, row) in enumerate(tqdm(digital_df.iterrows(), total=n)):
+        issue_date = issue_dates[i]
         
         kyc_docs.append({
             'DOCUMENT_ID': str(uuid.uuid4()),
             'DIGITAL_ID': row['DIGITAL_ID'],
             'CUSTOMER_ID': row['CUSTOMER_ID'],
             'DOCUMENT_TYPE': random.choice(['PASSPORT', 'NRIC', 'DRIVERS_LICENSE']),
-            'DOCUMENT_NUMBER': f'{fake.bothify(text="??######")}',
+            'DOCUMENT_NUMBER': document_numbers[i],
             'ISSUING_COUNTRY': 'SGP',
             'ISSUE_DATE': issue_date,
             'EXPIRY_DATE': issue_date + timedelta(days=3650),
-            'UPLOAD_DATE': fake.date_time_between(start_date='-2y', end_date='now'),
+            'UPLOAD_DATE': upload_dates[i],
             'VERIFICATION_STATUS': random.choice(['VERIFIED', 'PENDING', 'REJECTED']),
-            'VERIFICATION_DATE': fake.date_time_between(start_date='-2y', end_date='now'),
+            'VERIFICATION_DATE': verification_dates[i],
             'VERIFICATION_METHOD': random.choice(['AI', 'MANUAL', 'THIRD_PARTY']),
             'CONFIDENCE_SCORE': round(random.uniform(85, 99.9), 2),
             'REJECTION_REASON': None if random.random() > 0.1 else 'Document unclear',
             'FACE_MATCH_SCORE': round(random.uniform(90, 99.9), 2),
             'LIVENESS_CHECK': random.choice([True, False]),
-            'CREATED_DATE': fake.date_time_between(start_date='-2y', end_date='now'),
+            'CREATED_DATE': created_dates[i],
             'MODIFIED_DATE': datetime.now()
         })
     
     df = pd.DataFrame(kyc_docs)
-    df.to_csv(f'{OUTPUT_DIR}/digital_kyc_document.csv', index=False)
+    write_table(df, 'digital_kyc_document.csv')
     print(f"✓ Created {len(df):,} KYC documents")
     return df
 
@@ -205,6 +305,11 @@ def generate_t24_customers(num_customers):
     print("\n🏦 Generating T24 Customers...")
     
     customers = []
+    pools = faker_pools.load_pools(SEED)
+    mnemonics = faker_pools.truncate(faker_pools.sample(pool_rng, pools['user_name'], num_customers), 20)
+    short_names = faker_pools.truncate(faker_pools.sample(pool_rng, pools['name'], num_customers), 50)
+    full_names = faker_pools.sample(pool_rng, pools['name'], num_customers)
+    
     for i in tqdm(range(num_customers)):
         age = int(np.random.normal(40, 15))
         age = max(18, min(80, age))
@@ -219,9 +324,9 @@ def generate_t24_customers(num_customers):
         
         customers.append({
             'CUSTOMER_ID': f'CUS-{i:06d}',
-            'MNEMONIC': fake.user_name()[:20],
-            'SHORT_NAME': fake.name()[:50],
-            'NAME_1': fake.name(),
+            'MNEMONIC': mnemonics[i],
+            'SHORT_NAME': short_names[i],
+            'NAME_1': full_names[i],
             'NAME_2': '',
             'GENDER': random.choice(['M', 'F']),
             'DATE_OF_BIRTH': dob.date(),
@@ -243,21 +348,21 @@ def generate_t24_customers(num_customers):
         })
     
     df = pd.DataFrame(customers)
-    df.to_csv(f'{OUTPUT_DIR}/t24_customer.csv', index=False)
+    write_table(df, 't24_customer.csv')
     print(f"✓ Created {len(df):,} T24 customers")
     return df
 
-def generate_t24_accounts(customers_df):
-    """Generate T24 accounts"""
+def generate_t24_accounts(customers_df, keys):
+    """Generate T24 accounts for the accounts assigned in keys"""
     print("\n🏦 Generating T24 Accounts...")
     
     accounts = []
-    customer_ids = customers_df['CUSTOMER_ID'].tolist()
-    customer_segments = dict(zip(customers_df['CUSTOMER_ID'], customers_df['TARGET_MARKET']))
+    account_ids = keys.account_ids(np.arange(keys.num_accounts))
+    customer_ids = keys.customer_ids[keys.account_owner]
+    segments = customers_df['TARGET_MARKET'].to_numpy()[keys.account_owner]
     
-    for i in tqdm(range(NUM_ACCOUNTS)):
-        customer_id = random.choice(customer_ids)
-        segment = customer_segments[customer_id]
+    for i in tqdm(range(keys.num_accounts)):
+        segment = segments[i]
         
         product_type = random.choices(
             ['SAVINGS', 'CURRENT', 'FIXED_DEPOSIT', 'CREDIT_CARD'],
@@ -275,8 +380,8 @@ def generate_t24_accounts(customers_df):
         opening_date = fake.date_between(start_date='-10y', end_date='today')
         
         accounts.append({
-            'ACCOUNT_ID': f'ACC-{i:07d}',
-            'CUSTOMER_ID': customer_id,
+            'ACCOUNT_ID': account_ids[i],
+            'CUSTOMER_ID': customer_ids[i],
             'ACCOUNT_TITLE': f'{product_type} Account',
             'CATEGORY': product_type[:4],
             'PRODUCT_CODE': f'PRD{random.randint(100, 999)}',
@@ -298,20 +403,22 @@ def generate_t24_accounts(customers_df):
         })
     
     df = pd.DataFrame(accounts)
-    df.to_csv(f'{OUTPUT_DIR}/t24_account.csv', index=False)
+    write_table(df, 't24_account.csv')
     print(f"✓ Created {len(df):,} T24 accounts")
     return df
 
-def generate_t24_loans(customers_df):
-    """Generate T24 loans"""
+def generate_t24_loans(customers_df, keys):
+    """Generate T24 loans for the loans assigned in keys"""
     print("\n🏦 Generating T24 Loans...")
     
     loans = []
-    customer_data = customers_df[['CUSTOMER_ID', 'RISK_CATEGORY']].to_dict('records')
+    loan_ids = keys.loan_ids(np.arange(keys.num_loans))
+    customer_ids = keys.customer_ids[keys.loan_owner]
+    account_ids = keys.account_ids(keys.loan_account)
+    risk_categories = customers_df['RISK_CATEGORY'].to_numpy()[keys.loan_owner]
     
-    for i in tqdm(range(NUM_LOANS)):
-        customer = random.choice(customer_data)
-        risk_cat = customer['RISK_CATEGORY']
+    for i in tqdm(range(keys.num_loans)):
+        risk_cat = risk_categories[i]
         
         loan_type = random.choices(
             ['PERSONAL', 'MORTGAGE', 'AUTO', 'BUSINESS'],
@@ -372,9 +479,9 @@ def generate_t24_loans(customers_df):
             loan_status = 'CLOSED'
         
         loans.append({
-            'LOAN_ID': f'LN-{i:08d}',
-            'CUSTOMER_ID': customer['CUSTOMER_ID'],
-            'ACCOUNT_ID': f'ACC-{random.randint(0, NUM_ACCOUNTS-1):07d}',
+            'LOAN_ID': loan_ids[i],
+            'CUSTOMER_ID': customer_ids[i],
+            'ACCOUNT_ID': account_ids[i],
             'LOAN_TYPE': loan_type,
             'PRODUCT_CODE': f'LN{random.randint(100, 999)}',
             'PRODUCT_NAME': f'{loan_type} Loan',
@@ -403,28 +510,30 @@ def generate_t24_loans(customers_df):
         })
     
     df = pd.DataFrame(loans)
-    df.to_csv(f'{OUTPUT_DIR}/t24_loan.csv', index=False)
+    write_table(df, 't24_loan.csv')
     print(f"✓ Created {len(df):,} T24 loans")
     return df
 
-def generate_t24_transactions(accounts_df):
-    """Generate T24 transactions"""
+def generate_t24_transactions(keys):
+    """Generate T24 transactions on the accounts assigned in keys"""
     print("\n🏦 Generating T24 Transactions...")
     
     transactions = []
-    account_ids = accounts_df['ACCOUNT_ID'].tolist()
-    account_customers = dict(zip(accounts_df['ACCOUNT_ID'], accounts_df['CUSTOMER_ID']))
+    writer = table_writer('t24_transaction.csv')
+    parents = keys.sample_accounts(pool_rng, NUM_TRANSACTIONS)
+    account_ids = keys.account_ids(parents)
+    customer_ids = keys.customer_ids[keys.account_owner[parents]]
+    counterparty_accounts = keys.account_ids(keys.sample_accounts(pool_rng, NUM_TRANSACTIONS))
     
     for i in tqdm(range(NUM_TRANSACTIONS)):
-        account_id = random.choice(account_ids)
         txn_type = random.choice(['DEPOSIT', 'WITHDRAWAL', 'TRANSFER', 'PAYMENT', 'FEE'])
         amount = random.uniform(10, 5000)
         value_date = fake.date_between(start_date='-1y', end_date='today')
         
         transactions.append({
             'TRANSACTION_ID': f'TXN-{i:010d}',
-            'ACCOUNT_ID': account_id,
-            'CUSTOMER_ID': account_customers[account_id],
+            'ACCOUNT_ID': account_ids[i],
+            'CUSTOMER_ID': customer_ids[i],
             'TRANSACTION_TYPE': txn_type,
             'TRANSACTION_CODE': f'TC{random.randint(100, 999)}',
             'TRANSACTION_DESC': f'{txn_type} transaction',
@@ -439,7 +548,7 @@ def generate_t24_transactions(accounts_df):
             'CHANNEL': random.choice(['MOBILE', 'ATM', 'BRANCH', 'INTERNET', 'POS']),
             'MERCHANT_NAME': fake.company() if txn_type == 'PAYMENT' else None,
             'MERCHANT_CATEGORY': random.choice(['RETAIL', 'FOOD', 'TRAVEL', 'UTILITIES']) if txn_type == 'PAYMENT' else None,
-            'COUNTERPARTY_ACCT': f'ACC-{random.randint(0, NUM_ACCOUNTS-1):07d}' if txn_type == 'TRANSFER' else None,
+            'COUNTERPARTY_ACCT': counterparty_accounts[i] if txn_type == 'TRANSFER' else None,
             'COUNTERPARTY_NAME': fake.name() if txn_type == 'TRANSFER' else None,
             'COUNTERPARTY_BANK': random.choice(['DBS', 'OCBC', 'UOB', 'MAYBANK']) if txn_type == 'TRANSFER' else None,
             'REFERENCE': f'REF{random.randint(100000, 999999)}',
@@ -447,19 +556,22 @@ def generate_t24_transactions(accounts_df):
             'REVERSED_TXN_ID': None,
             'CREATED_DATE': datetime.combine(value_date, datetime.min.time())
         })
+        flush_chunk(writer, transactions)
     
-    df = pd.DataFrame(transactions)
-    df.to_csv(f'{OUTPUT_DIR}/t24_transaction.csv', index=False)
-    print(f"✓ Created {len(df):,} T24 transactions")
-    return df
+    rows = finish_table(writer, transactions)
+    print(f"✓ Created {rows:,} T24 transactions")
+    return rows
 
-def generate_t24_payment_schedule(loans_df):
-    """Generate payment schedules for loans"""
+def generate_t24_payment_schedule(loans_df, keys):
+    """Generate payment schedules for the loans assigned in keys (loans_df in loan order)"""
     print("\n🏦 Generating T24 Payment Schedules...")
     
     schedules = []
-    for _ in tqdm(range(NUM_PAYMENT_SCHEDULES)):
-        loan = loans_df.sample(1).iloc[0]
+    writer = table_writer('t24_payment_schedule.csv')
+    loan_rows = loans_df.to_dict('records')
+    parents = keys.sample_loans(pool_rng, NUM_PAYMENT_SCHEDULES)
+    for i in tqdm(range(NUM_PAYMENT_SCHEDULES)):
+        loan = loan_rows[parents[i]]
         installment_num = random.randint(1, loan['TERM_MONTHS'])
         due_date = loan['START_DATE'] + timedelta(days=installment_num*30)
         
@@ -476,7 +588,7 @@ def generate_t24_payment_schedule(loans_df):
             status = 'SCHEDULED'
         
         schedules.append({
-            'SCHEDULE_ID': f'SCH-{len(schedules):010d}',
+            'SCHEDULE_ID': f'SCH-{i:010d}',
             'LOAN_ID': loan['LOAN_ID'],
             'CUSTOMER_ID': loan['CUSTOMER_ID'],
             'INSTALLMENT_NUMBER': installment_num,
@@ -494,11 +606,11 @@ def generate_t24_payment_schedule(loans_df):
             'CREATED_DATE': loan['START_DATE'],
             'MODIFIED_DATE': datetime.now()
         })
+        flush_chunk(writer, schedules)
     
-    df = pd.DataFrame(schedules)
-    df.to_csv(f'{OUTPUT_DIR}/t24_payment_schedule.csv', index=False)
-    print(f"✓ Created {len(df):,} payment schedules")
-    return df
+    rows = finish_table(writer, schedules)
+    print(f"✓ Created {rows:,} payment schedules")
+    return rows
 
 def generate_t24_collateral(loans_df):
     """Generate collateral records"""
@@ -532,7 +644,7 @@ def generate_t24_collateral(loans_df):
         })
     
     df = pd.DataFrame(collaterals)
-    df.to_csv(f'{OUTPUT_DIR}/t24_collateral.csv', index=False)
+    write_table(df, 't24_collateral.csv')
     print(f"✓ Created {len(df):,} collateral records")
     return df
 
@@ -579,21 +691,22 @@ def generate_credit_scores(customers_df):
         })
     
     df = pd.DataFrame(scores)
-    df.to_csv(f'{OUTPUT_DIR}/credit_score.csv', index=False)
+    write_table(df, 'credit_score.csv')
     print(f"✓ Created {len(df):,} credit scores")
     return df
 
-def generate_credit_inquiries(customers_df):
+def generate_credit_inquiries(keys):
     """Generate credit inquiries"""
     print("\n📊 Generating Credit Inquiries...")
     
     inquiries = []
-    customer_ids = customers_df['CUSTOMER_ID'].tolist()
+    writer = table_writer('credit_inquiry.csv')
+    customer_ids = keys.customer_ids[keys.sample_customers(pool_rng, NUM_CREDIT_INQUIRIES)]
     
-    for _ in tqdm(range(NUM_CREDIT_INQUIRIES)):
+    for i in tqdm(range(NUM_CREDIT_INQUIRIES)):
         inquiries.append({
-            'INQUIRY_ID': f'INQ-{len(inquiries):010d}',
-            'CUSTOMER_ID': random.choice(customer_ids),
+            'INQUIRY_ID': f'INQ-{i:010d}',
+            'CUSTOMER_ID': customer_ids[i],
             'INQUIRY_DATE': fake.date_between(start_date='-2y', end_date='today'),
             'INQUIRY_TYPE': random.choice(['HARD', 'SOFT']),
             'CREDITOR_NAME': random.choice(['DBS Bank', 'OCBC Bank', 'UOB', 'Standard Chartered', 'Citibank']),
@@ -602,27 +715,28 @@ def generate_credit_inquiries(customers_df):
             'INQUIRY_REASON': random.choice(['NEW_CREDIT', 'ACCOUNT_REVIEW', 'CREDIT_INCREASE']),
             'CREATED_DATE': datetime.now()
         })
+        flush_chunk(writer, inquiries)
     
-    df = pd.DataFrame(inquiries)
-    df.to_csv(f'{OUTPUT_DIR}/credit_inquiry.csv', index=False)
-    print(f"✓ Created {len(df):,} credit inquiries")
-    return df
+    rows = finish_table(writer, inquiries)
+    print(f"✓ Created {rows:,} credit inquiries")
+    return rows
 
-def generate_tradelines(customers_df):
+def generate_tradelines(keys):
     """Generate credit tradelines"""
     print("\n📊 Generating Tradelines...")
     
     tradelines = []
-    customer_ids = customers_df['CUSTOMER_ID'].tolist()
+    writer = table_writer('tradeline.csv')
+    customer_ids = keys.customer_ids[keys.sample_customers(pool_rng, NUM_TRADELINES)]
     
-    for _ in tqdm(range(NUM_TRADELINES)):
+    for i in tqdm(range(NUM_TRADELINES)):
         open_date = fake.date_between(start_date='-15y', end_date='-1y')
         credit_limit = random.uniform(5000, 50000)
         balance = random.uniform(0, credit_limit * 0.8)
         
         tradelines.append({
-            'TRADELINE_ID': f'TL-{len(tradelines):010d}',
-            'CUSTOMER_ID': random.choice(customer_ids),
+            'TRADELINE_ID': f'TL-{i:010d}',
+            'CUSTOMER_ID': customer_ids[i],
             'CREDITOR_NAME': random.choice(['DBS', 'OCBC', 'UOB', 'Citi', 'HSBC', 'Standard Chartered']),
             'ACCOUNT_TYPE': random.choice(['CREDIT_CARD', 'INSTALLMENT_LOAN', 'LINE_OF_CREDIT', 'MORTGAGE']),
             'ACCOUNT_NUMBER': f'****{random.randint(1000, 9999)}',
@@ -639,11 +753,11 @@ def generate_tradelines(customers_df):
             'CREATED_DATE': open_date,
             'MODIFIED_DATE': datetime.now()
         })
+        flush_chunk(writer, tradelines)
     
-    df = pd.DataFrame(tradelines)
-    df.to_csv(f'{OUTPUT_DIR}/tradeline.csv', index=False)
-    print(f"✓ Created {len(df):,} tradelines")
-    return df
+    rows = finish_table(writer, tradelines)
+    print(f"✓ Created {rows:,} tradelines")
+    return rows
 
 def generate_public_records(customers_df):
     """Generate public records (bankruptcies, liens)"""
@@ -671,7 +785,7 @@ def generate_public_records(customers_df):
         })
     
     df = pd.DataFrame(records)
-    df.to_csv(f'{OUTPUT_DIR}/public_record.csv', index=False)
+    write_table(df, 'public_record.csv')
     print(f"✓ Created {len(df):,} public records")
     return df
 
@@ -706,7 +820,7 @@ def generate_country_codes():
             'REGION': region,
             'CURRENCY': currency,
             'ACTIVE': True,
-            'CREATED_DATE': datetime.now()
+            'CREATED_DATE': REFERENCE_DATE
         })
     
     # Add 240 more random countries
@@ -718,11 +832,11 @@ def generate_country_codes():
             'REGION': random.choice(['Asia', 'Europe', 'Americas', 'Africa', 'Oceania']),
             'CURRENCY': random.choice(['USD', 'EUR', 'GBP', 'SGD']),
             'ACTIVE': True,
-            'CREATED_DATE': datetime.now()
+            'CREATED_DATE': REFERENCE_DATE
         })
     
     df = pd.DataFrame(all_countries)
-    df.to_csv(f'{OUTPUT_DIR}/country_code.csv', index=False)
+    write_table(df, 'country_code.csv')
     print(f"✓ Created {len(df):,} country codes")
     return df
 
@@ -749,7 +863,7 @@ def generate_currency_codes():
             'SYMBOL': symbol,
             'DECIMAL_PLACES': decimals,
             'ACTIVE': True,
-            'CREATED_DATE': datetime.now()
+            'CREATED_DATE': REFERENCE_DATE
         })
     
     # Add 142 more currencies
@@ -760,11 +874,11 @@ def generate_currency_codes():
             'SYMBOL': fake.currency_code(),
             'DECIMAL_PLACES': 2,
             'ACTIVE': random.choice([True, False]),
-            'CREATED_DATE': datetime.now()
+            'CREATED_DATE': REFERENCE_DATE
         })
     
     df = pd.DataFrame(currencies)
-    df.to_csv(f'{OUTPUT_DIR}/currency_code.csv', index=False)
+    write_table(df, 'currency_code.csv')
     print(f"✓ Created {len(df):,} currency codes")
     return df
 
@@ -798,7 +912,7 @@ def generate_product_catalog():
             'MAX_AMOUNT': min_amount * 100 if category == 'LOAN' else 0,
             'ACTIVE': True,
             'DESCRIPTION': f'{name} - competitive rates and flexible terms',
-            'CREATED_DATE': datetime.now()
+            'CREATED_DATE': REFERENCE_DATE
         })
     
     # Add more products
@@ -812,11 +926,11 @@ def generate_product_catalog():
             'MAX_AMOUNT': random.choice([50000, 100000, 500000, 1000000]),
             'ACTIVE': True,
             'DESCRIPTION': fake.catch_phrase(),
-            'CREATED_DATE': datetime.now()
+            'CREATED_DATE': REFERENCE_DATE
         })
     
     df = pd.DataFrame(products)
-    df.to_csv(f'{OUTPUT_DIR}/product_catalog.csv', index=False)
+    write_table(df, 'product_catalog.csv')
     print(f"✓ Created {len(df):,} products")
     return df
 
@@ -836,13 +950,13 @@ def generate_branches():
             'PHONE': fake.phone_number(),
             'EMAIL': f'branch{i:03d}@bank.com',
             'MANAGER': fake.name(),
-            'OPENED_DATE': fake.date_between(start_date='-20y', end_date='-1y'),
+            'OPENED_DATE': fake.date_between(start_date=REFERENCE_DATE - timedelta(days=20*365), end_date=REFERENCE_DATE - timedelta(days=365)),
             'ACTIVE': True,
-            'CREATED_DATE': datetime.now()
+            'CREATED_DATE': REFERENCE_DATE
         })
     
     df = pd.DataFrame(branches)
-    df.to_csv(f'{OUTPUT_DIR}/branch_directory.csv', index=False)
+    write_table(df, 'branch_directory.csv')
     print(f"✓ Created {len(df):,} branches")
     return df
 
@@ -861,67 +975,265 @@ def generate_relationship_managers():
             'SPECIALIZATION': random.choice(['RETAIL', 'WEALTH', 'CORPORATE', 'SME']),
             'ACTIVE_CUSTOMERS': random.randint(50, 200),
             'PORTFOLIO_VALUE': round(random.uniform(5000000, 50000000), 2),
-            'HIRE_DATE': fake.date_between(start_date='-15y', end_date='-1y'),
+            'HIRE_DATE': fake.date_between(start_date=REFERENCE_DATE - timedelta(days=15*365), end_date=REFERENCE_DATE - timedelta(days=365)),
             'ACTIVE': True,
-            'CREATED_DATE': datetime.now()
+            'CREATED_DATE': REFERENCE_DATE
         })
     
     df = pd.DataFrame(rms)
-    df.to_csv(f'{OUTPUT_DIR}/relationship_manager.csv', index=False)
+    write_table(df, 'relationship_manager.csv')
     print(f"✓ Created {len(df):,} relationship managers")
     return df
 
 # ============================================
-# MAIN EXECUTION
+# 5. VECTORIZED ENGINE
 # ============================================
 
-def main():
-    """Main execution flow"""
+# Row volume per sharded table; each shard gets its share in proportion to its customers
+SHARDED_VOLUMES = {
+    'accounts': NUM_ACCOUNTS,
+    'loans': NUM_LOANS,
+    'transactions': NUM_TRANSACTIONS,
+    'payment_schedules': NUM_PAYMENT_SCHEDULES,
+    'sessions': NUM_DIGITAL_SESSIONS,
+    'events': NUM_DIGITAL_EVENTS,
+    'inquiries': NUM_CREDIT_INQUIRIES,
+    'tradelines': NUM_TRADELINES,
+}
+
+def save_csv(df, filename, label):
+    """Write a generated table to OUTPUT_DIR"""
+    write_table(df, filename)
+    print(f"✓ Created {len(df):,} {label}")
+    return df
+
+def plan_shards(num_customers, customers_per_shard):
+    """Partition the customer key space into contiguous, evenly sized shards
+    
+    Every shard records its customer range plus, for each child table, the
+    (id offset, row count) slice it owns. The plan depends only on the
+    volumes and shard size, never on the number of workers.
+    """
+    num_shards = max(1, -(-num_customers // customers_per_shard))
+    shards = []
+    for shard_id in range(num_shards):
+        start = num_customers * shard_id // num_shards
+        end = num_customers * (shard_id + 1) // num_shards
+        shard = {'shard_id': shard_id, 'num_shards': num_shards,
+                 'customer_start': start, 'customer_count': end - start}
+        for table, total in SHARDED_VOLUMES.items():
+            lo = total * start // num_customers
+            hi = total * end // num_customers
+            shard[table] = (lo, hi - lo)
+        shards.append(shard)
+    return shards
+
+def shard_filename(filename, shard):
+    """t24_customer.csv -> t24_customer_00003.csv when there is more than one shard"""
+    if shard['num_shards'] == 1:
+        return filename
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}_{shard['shard_id']:05d}{ext}"
+
+def generate_shard(shard, now):
+    """Generate and write every transactional table for one shard of customers"""
+    # Loaded once per worker process (and from the disk cache after the first run)
+    pools = faker_pools.load_pools(SEED)
+    
+    # Per-shard deterministic seed: same output whatever the worker count
+    rng = np.random.default_rng([SEED, shard['shard_id']])
+    customer_numbers = shard['customer_start'] + np.arange(shard['customer_count'])
+    
+    # Every parent key of the shard; child tables index into it
+    keys = KeyRegistry(customer_numbers, ve.uuid4_array(rng, len(customer_numbers)))
+    
+    written = {}
+    def write(df, filename):
+        writer = table_writer(shard_filename(filename, shard))
+        written.update(writer.write(df).close())
+        return df
+    
+    def write_chunks(filename, table, build):
+        """Build a child table CHUNK_SIZE rows at a time, appending each chunk"""
+        offset, count = shard[table]
+        writer = table_writer(shard_filename(filename, shard))
+        for start in range(0, count or 1, CHUNK_SIZE):
+            writer.write(build(min(CHUNK_SIZE, count - start), offset + start))
+        written.update(writer.close())
+    
+    # 1. Digital Banking Data
+    digital_df = write(ve.build_digital_customer_profile(rng, pools, now, keys),
+                       'digital_customer_profile.csv')
+    write(ve.build_digital_sessions(rng, pools, now, shard['sessions'][1], keys), 'digital_session.csv')
+    write_chunks('digital_event.csv', 'events',
+                 lambda n, offset: ve.build_digital_events(rng, pools, now, n, keys))
+    write(ve.build_digital_kyc(rng, pools, now, digital_df), 'digital_kyc_document.csv')
+    
+    # 2. T24 Core Banking Data
+    customers_df = write(ve.build_t24_customers(rng, pools, now, keys), 't24_customer.csv')
+    keys.assign_accounts(rng, shard['accounts'][1], account_offset=shard['accounts'][0])
+    write(ve.build_t24_accounts(rng, pools, now, customers_df, keys), 't24_account.csv')
+    keys.assign_loans(rng, shard['loans'][1], loan_offset=shard['loans'][0])
+    loans_df = write(ve.build_t24_loans(rng, pools, now, customers_df, keys), 't24_loan.csv')
+    write_chunks('t24_transaction.csv', 'transactions',
+                 lambda n, offset: ve.build_t24_transactions(rng, pools, now, n, keys,
+                                                             transaction_offset=offset))
+    write_chunks('t24_payment_schedule.csv', 'payment_schedules',
+                 lambda n, offset: ve.build_t24_payment_schedule(rng, pools, now, n, loans_df, keys,
+                                                                 schedule_offset=offset))
+    # At most one collateral per loan, so the loan offset keeps IDs unique across shards
+    write(ve.build_t24_collateral(rng, pools, now, loans_df, collateral_offset=keys.loan_offset),
+          't24_collateral.csv')
+    
+    # 3. Credit Bureau Data
+    write(ve.build_credit_scores(rng, pools, now, customers_df, score_offset=shard['customer_start']),
+          'credit_score.csv')
+    write_chunks('credit_inquiry.csv', 'inquiries',
+                 lambda n, offset: ve.build_credit_inquiries(rng, pools, now, n, keys,
+                                                             inquiry_offset=offset))
+    write_chunks('tradeline.csv', 'tradelines',
+                 lambda n, offset: ve.build_tradelines(rng, pools, now, n, keys,
+                                                       tradeline_offset=offset))
+    write(ve.build_public_records(rng, pools, now, customers_df, record_offset=shard['customer_start']),
+          'public_record.csv')
+    
+    keys.validate()
+    return written
+
+def generate_vectorized():
+    """Generate all transactional tables with the columnar NumPy engine, one shard per task"""
+    now = datetime.fromisoformat(AS_OF) if AS_OF else datetime.now()
+    shards = plan_shards(NUM_CUSTOMERS, CUSTOMERS_PER_SHARD)
+    workers = max(1, min(WORKERS, len(shards)))
+    print(f"\n⚙️  Generating {len(shards):,} shard(s) of ~{CUSTOMERS_PER_SHARD:,} customers "
+          f"on {workers} worker(s) (vectorized)...")
+    
+    totals = {}
+    if workers == 1:
+        results = (generate_shard(shard, now) for shard in shards)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(generate_shard, shards, [now] * len(shards))
+    
+    for written in tqdm(results, total=len(shards), desc="Shards"):
+        written_rows.update(written)
+        for filename, rows in written.items():
+            table = table_for_file(filename)
+            totals[table] = totals.get(table, 0) + rows
+    
+    if workers > 1:
+        executor.shutdown()
+    
+    for table, rows in sorted(totals.items()):
+        print(f"✓ Created {rows:,} rows for {table}")
+
+def generate_loop():
+    """Generate all transactional tables row by row"""
     
     # 1. Digital Banking Data
     digital_df = generate_digital_customer_profile(NUM_CUSTOMERS)
-    sessions_df = generate_digital_sessions(digital_df)
-    generate_digital_events(sessions_df)
+    # Every parent key of the run; child tables index into it
+    keys = KeyRegistry(np.arange(NUM_CUSTOMERS), digital_df['DIGITAL_ID'].to_numpy())
+    generate_digital_sessions(keys)
+    generate_digital_events(keys)
     generate_digital_kyc(digital_df)
     
     # 2. T24 Core Banking Data
     t24_customers_df = generate_t24_customers(NUM_CUSTOMERS)
-    accounts_df = generate_t24_accounts(t24_customers_df)
-    loans_df = generate_t24_loans(t24_customers_df)
-    generate_t24_transactions(accounts_df)
-    generate_t24_payment_schedule(loans_df)
+    keys.assign_accounts(pool_rng, NUM_ACCOUNTS)
+    generate_t24_accounts(t24_customers_df, keys)
+    keys.assign_loans(pool_rng, NUM_LOANS)
+    loans_df = generate_t24_loans(t24_customers_df, keys)
+    generate_t24_transactions(keys)
+    generate_t24_payment_schedule(loans_df, keys)
     generate_t24_collateral(loans_df)
     
     # 3. Credit Bureau Data
     generate_credit_scores(t24_customers_df)
-    generate_credit_inquiries(t24_customers_df)
-    generate_tradelines(t24_customers_df)
+    generate_credit_inquiries(keys)
+    generate_tradelines(keys)
     generate_public_records(t24_customers_df)
     
+    keys.validate()
+
+# ============================================
+# MAIN EXECUTION
+# ============================================
+
+def main():
+    """Main execution flow"""
+    print("=" * 80)
+    print("🏦 SNOWFLAKE CREDIT DECISIONING - DATA GENERATOR")
+    print("=" * 80)
+    print(f"Generating {NUM_CUSTOMERS:,} customers with ALL related data (SF={SCALE_FACTOR:g})")
+    if OUTPUT_TARGET == 'snowflake':
+        print("Output: Parquet streamed straight into Snowflake (no CSV)")
+    else:
+        print(f"Output directory: {OUTPUT_DIR}")
+        print(f"Output format: {OUTPUT_FORMAT}")
+    print(f"Generation engine: {GENERATION_ENGINE}")
+    print("=" * 80)
+    
+    if OUTPUT_TARGET == 'snowflake':
+        from upload_to_snowflake import SNOWFLAKE_STAGE, TABLE_MAPPINGS
+        direct_loader.clear_stage(snowflake_connection(), SNOWFLAKE_STAGE)
+    else:
+        # Earlier shard / part / format layouts would otherwise be uploaded alongside this run's files
+        removed = clear_outputs(OUTPUT_DIR)
+        if removed:
+            print(f"\n🧹 Removed {len(removed):,} output file(s) from earlier runs")
+    
+    # 1-3. Digital Banking, T24 Core Banking and Credit Bureau Data
+    if GENERATION_ENGINE == 'vectorized':
+        generate_vectorized()
+    else:
+        generate_loop()
+    
     # 4. Reference Data
+    # Reseeded so the reference tables do not depend on the volumes or engine above
+    Faker.seed(SEED)
+    random.seed(SEED)
     generate_country_codes()
     generate_currency_codes()
     generate_product_catalog()
     generate_branches()
     generate_relationship_managers()
     
+    if OUTPUT_TARGET == 'snowflake':
+        print("\n📥 Loading staged Parquet parts into Snowflake...")
+        conn = snowflake_connection()
+        load_results = direct_loader.load_staged(conn, SNOWFLAKE_STAGE, written_rows, TABLE_MAPPINGS)
+        direct_loader.clear_stage(conn, SNOWFLAKE_STAGE)
+        conn.close()
+    
     # Summary
     print("\n" + "=" * 80)
     print("✅ DATA GENERATION COMPLETE!")
     print("=" * 80)
-    print(f"\n📁 All CSV files saved to: {OUTPUT_DIR}")
+    if OUTPUT_TARGET != 'snowflake':
+        print(f"\n📁 All {OUTPUT_FORMAT} files saved to: {OUTPUT_DIR}")
     print(f"\n📊 Generated Tables:")
     
-    csv_files = sorted([f for f in os.listdir(OUTPUT_DIR) if f.endswith('.csv')])
+    # Row counts come from the writers, so nothing is re-read from disk
+    table_rows = {}
+    for filename, rows in written_rows.items():
+        table = table_for_file(filename)
+        table_rows[table] = table_rows.get(table, 0) + rows
+    
     total_rows = 0
-    for csv_file in csv_files:
-        df = pd.read_csv(f'{OUTPUT_DIR}/{csv_file}')
-        rows = len(df)
+    for table, rows in sorted(table_rows.items()):
         total_rows += rows
-        print(f"   • {csv_file:<35} {rows:>10,} rows")
+        print(f"   • {table:<35} {rows:>10,} rows")
+    print(f"\n📄 Output files: {len(written_rows):,} (max {ROWS_PER_FILE:,} rows each)" if ROWS_PER_FILE
+          else f"\n📄 Output files: {len(written_rows):,}")
     
     print(f"\n🎯 Total Records: {total_rows:,}")
-    print("\n✨ Ready to upload to Snowflake!")
+    if OUTPUT_TARGET != 'snowflake':
+        print("\n✨ Ready to upload to Snowflake!")
+    elif any(r['error'] for r in load_results):
+        print("\n⚠️  Some tables failed to load - see the errors above")
+    else:
+        print("\n✨ All data loaded into Snowflake!")
     print("=" * 80)
 
 if __name__ == "__main__":
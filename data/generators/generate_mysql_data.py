@@ -13,10 +13,14 @@ import random
 from tqdm import tqdm
 import os
 
+import faker_pools
+from loaders import MySQLLoader, print_load_summary, run_pipeline
+
 fake = Faker()
 Faker.seed(42)
 np.random.seed(42)
 random.seed(42)
+pool_rng = np.random.default_rng(42)
 
 # Configuration
 NUM_CUSTOMERS = 100000
@@ -30,13 +34,27 @@ MYSQL_DATABASE = os.getenv('MYSQL_DATABASE', 'digital_banking')
 MYSQL_USER = os.getenv('MYSQL_USER', 'digitaluser')
 MYSQL_PASSWORD = os.getenv('MYSQL_PASSWORD', 'DigitalPass!')
 
-print("=" * 70)
-print("MySQL Digital Banking Data Generator")
-print("=" * 70)
-print(f"Host: {MYSQL_HOST}:{MYSQL_PORT}")
-print(f"Database: {MYSQL_DATABASE}")
-print("=" * 70)
-print()
+# Load method: 'infile' (LOAD DATA LOCAL INFILE, see loaders/mysql.py), 'insert'
+# (multi-row INSERTs sized to max_allowed_packet) or 'executemany'
+LOAD_METHOD = os.getenv('LOAD_METHOD', 'infile')
+# Commits: 0 = once per table (per generated batch for events), otherwise every LOAD_COMMIT_ROWS rows
+LOAD_COMMIT_ROWS = int(os.getenv('LOAD_COMMIT_ROWS', '0'))
+# Events generated (and committed) per batch
+EVENT_BATCH_ROWS = 100000
+# Sessions generated per batch
+SESSION_BATCH_ROWS = 100000
+# Load while generating: batches are loaded over PIPELINE_LOAD_WORKERS connections (loaders/pipeline.py)
+PIPELINE = os.getenv('PIPELINE', 'true').lower() == 'true'
+
+def print_banner():
+    print("=" * 70)
+    print("MySQL Digital Banking Data Generator")
+    print("=" * 70)
+    print(f"Host: {MYSQL_HOST}:{MYSQL_PORT}")
+    print(f"Database: {MYSQL_DATABASE}")
+    print(f"Load method: {LOAD_METHOD}{' (pipelined)' if PIPELINE and LOAD_METHOD != 'executemany' else ''}")
+    print("=" * 70)
+    print()
 
 def get_mysql_connection():
     """Connect to MySQL database"""
@@ -46,7 +64,8 @@ def get_mysql_connection():
             port=MYSQL_PORT,
             database=MYSQL_DATABASE,
             user=MYSQL_USER,
-            password=MYSQL_PASSWORD
+            password=MYSQL_PASSWORD,
+            allow_local_infile=LOAD_METHOD == 'infile'
         )
         print("✅ Connected to MySQL database")
         
@@ -72,6 +91,15 @@ def generate_digital_profiles(num_customers):
     print(f"\n👥 Generating {num_customers:,} digital customer profiles...")
     
     profiles = []
+    
+    # Faker-backed columns are sampled from the pre-generated value pools;
+    # usernames get a _<customer index:06d> suffix for the UNIQUE constraint
+    pools = faker_pools.load_pools(42)
+    customer_numbers = np.arange(num_customers)
+    emails = faker_pools.perturb_emails(pool_rng, pools, num_customers)
+    mobile_numbers = faker_pools.truncate(faker_pools.sample(pool_rng, pools['phone_number'], num_customers), 20)
+    usernames = faker_pools.unique_usernames(pool_rng, pools, customer_numbers, max_length=50)
+    
     for i in tqdm(range(num_customers)):
         # Registration date (last 5 years)
         reg_date = datetime.now() - timedelta(days=random.randint(0, 1825))
@@ -85,16 +113,12 @@ def generate_digital_profiles(num_customers):
             last_login = datetime.now() - timedelta(days=random.randint(91, 365))
             login_count = random.randint(5, 50)
         
-        # Ensure unique username by appending customer index
-        base_username = fake.user_name()[:40]  # Leave room for suffix
-        unique_username = f"{base_username}_{i:06d}"[:50]  # Max 50 chars
-        
         profiles.append({
             'DIGITAL_ID': fake.uuid4(),
             'CUSTOMER_ID': f'CUS-{i:06d}',
-            'EMAIL': fake.email(),
-            'MOBILE_NUMBER': fake.phone_number()[:20],
-            'USERNAME': unique_username,
+            'EMAIL': emails[i],
+            'MOBILE_NUMBER': mobile_numbers[i],
+            'USERNAME': usernames[i],
             'REGISTRATION_DATE': reg_date,
             'LAST_LOGIN': last_login,
             'LOGIN_COUNT': login_count,
@@ -119,6 +143,11 @@ def generate_digital_profiles(num_customers):
 
 def generate_sessions(num_customers, avg_sessions_per_customer, profiles_df):
     """Generate session data"""
+    return pd.concat(generate_session_batches(num_customers, avg_sessions_per_customer, profiles_df),
+                     ignore_index=True)
+
+def generate_session_batches(num_customers, avg_sessions_per_customer, profiles_df, batch_size=SESSION_BATCH_ROWS):
+    """Generate session data, yielding one DataFrame per batch"""
     total_sessions = num_customers * avg_sessions_per_customer
     print(f"\n🔐 Generating {total_sessions:,} sessions...")
     
@@ -188,15 +217,18 @@ def generate_sessions(num_customers, avg_sessions_per_customer, profiles_df):
             'EXIT_REASON': random.choice(['NORMAL', 'TIMEOUT', 'ERROR', 'USER_CLOSE', None]),
             'CREATED_DATE': start_time
         })
+        if len(sessions) == batch_size:
+            yield pd.DataFrame(sessions)
+            sessions = []
     
-    return pd.DataFrame(sessions)
+    if sessions:
+        yield pd.DataFrame(sessions)
 
-def generate_events(sessions_df, avg_events_per_session):
-    """Generate event data"""
+def generate_events(sessions_df, avg_events_per_session, batch_size=100000):
+    """Generate event data, yielding one DataFrame per batch so memory stays flat"""
     total_events = int(len(sessions_df) * avg_events_per_session)
     print(f"\n📱 Generating {total_events:,} digital events...")
     
-    events = []
     event_types = [
         'PAGE_VIEW', 'BUTTON_CLICK', 'FORM_SUBMIT', 'SEARCH', 
         'BALANCE_CHECK', 'TRANSACTION_INIT', 'TRANSACTION_CONFIRM',
@@ -224,8 +256,7 @@ def generate_events(sessions_df, avg_events_per_session):
     # Create list of session IDs to reference
     session_list = sessions_df[['SESSION_ID', 'DIGITAL_ID', 'CUSTOMER_ID']].to_dict('records')
     
-    # Generate in batches for better performance
-    batch_size = 100000
+    # Generate in batches; each batch is loaded and released before the next one
     for batch_start in tqdm(range(0, total_events, batch_size)):
         batch_end = min(batch_start + batch_size, total_events)
         batch_events = []
@@ -262,9 +293,7 @@ def generate_events(sessions_df, avg_events_per_session):
                 'CREATED_DATE': event_time
             })
         
-        events.extend(batch_events)
-    
-    return pd.DataFrame(events)
+        yield pd.DataFrame(batch_events)
 
 def bulk_insert(connection, table_name, df, batch_size=1000):
     """Bulk insert data into MySQL"""
@@ -293,26 +322,72 @@ def bulk_insert(connection, table_name, df, batch_size=1000):
     cursor.close()
     print(f"✅ Inserted {total_rows:,} rows\n")
 
-def main():
-    # Connect
-    conn = get_mysql_connection()
-    if not conn:
-        return
-    
+def generate_then_load(connection):
+    """Generate profiles and sessions, then load them and stream the events on one connection"""
     # Generate data
     print("\n🎲 Generating sample data...\n")
     
     profiles_df = generate_digital_profiles(NUM_CUSTOMERS)
     sessions_df = generate_sessions(NUM_CUSTOMERS, SESSIONS_PER_CUSTOMER, profiles_df)
     
-    # For events, generate fewer to keep it manageable
-    events_df = generate_events(sessions_df, 5)  # 5 events per session
-    
     # Load data
     print("\n📤 Loading data to MySQL...\n")
-    bulk_insert(conn, 'DIGITAL_CUSTOMER_PROFILE', profiles_df)
-    bulk_insert(conn, 'DIGITAL_SESSION', sessions_df)
-    bulk_insert(conn, 'DIGITAL_EVENT', events_df)
+    # Events are streamed: each generated batch is loaded straight away
+    # (5 events per session to keep it manageable)
+    events = generate_events(sessions_df, 5, batch_size=EVENT_BATCH_ROWS)
+    if LOAD_METHOD == 'executemany':
+        bulk_insert(connection, 'DIGITAL_CUSTOMER_PROFILE', profiles_df)
+        bulk_insert(connection, 'DIGITAL_SESSION', sessions_df)
+        for events_df in events:
+            bulk_insert(connection, 'DIGITAL_EVENT', events_df)
+    else:
+        loader = MySQLLoader(connection, commit_rows=LOAD_COMMIT_ROWS, method=LOAD_METHOD)
+        results = [loader.load('DIGITAL_CUSTOMER_PROFILE', profiles_df),
+                   loader.load('DIGITAL_SESSION', sessions_df)]
+        # The next batch is generated while the current one loads
+        loader.commit_rows = LOAD_COMMIT_ROWS or EVENT_BATCH_ROWS
+        results.append(loader.load('DIGITAL_EVENT', events))
+        print_load_summary(results)
+
+def pipeline_stages():
+    """Tables in load order as lazy batch generators (same random draws as generating up front)"""
+    generated = {}
+    
+    def profiles():
+        generated['profiles'] = generate_digital_profiles(NUM_CUSTOMERS)
+        yield generated['profiles']
+    
+    def sessions():
+        generated['sessions'] = []
+        for batch in generate_session_batches(NUM_CUSTOMERS, SESSIONS_PER_CUSTOMER, generated['profiles']):
+            generated['sessions'].append(batch)
+            yield batch
+    
+    def events():
+        sessions_df = pd.concat(generated['sessions'], ignore_index=True)
+        # 5 events per session to keep it manageable
+        yield from generate_events(sessions_df, 5, batch_size=EVENT_BATCH_ROWS)
+    
+    return [('DIGITAL_CUSTOMER_PROFILE', profiles()),
+            ('DIGITAL_SESSION', sessions()),
+            ('DIGITAL_EVENT', events())]
+
+def main():
+    print_banner()
+    
+    # Connect
+    conn = get_mysql_connection()
+    if not conn:
+        return
+    
+    if PIPELINE and LOAD_METHOD != 'executemany':
+        # Generate and load at once: batches are loaded while the next ones are generated
+        print("\n🎲 Generating sample data and 📤 loading it to MySQL...\n")
+        results = run_pipeline(pipeline_stages(), get_mysql_connection,
+                               lambda connection: MySQLLoader(connection, method=LOAD_METHOD))
+        print_load_summary(results)
+    else:
+        generate_then_load(conn)
     
     # Verify
     cursor = conn.cursor()
@@ -14,10 +14,14 @@ import random
 from tqdm import tqdm
 import os
 
+from loaders import Checkpoint, PostgresCopyLoader, print_load_summary, run_pipeline
+
+SEED = 42
+
 fake = Faker()
-Faker.seed(42)
-np.random.seed(42)
-random.seed(42)
+Faker.seed(SEED)
+np.random.seed(SEED)
+random.seed(SEED)
 
 # Configuration (Scaled down)
 NUM_CUSTOMERS = 10000  # Reduced from 100,000
@@ -25,25 +29,39 @@ SESSIONS_PER_CUSTOMER = 10  # Average
 EVENTS_PER_SESSION = 5  # Average (reduced from 15)
 KYC_DOC_RATE = 0.8  # 80% of customers have KYC docs
 
-# PostgreSQL RDS connection
-POSTGRES_HOST = "snowflake-credit-demo-postgres.c7yg0uyimv09.ap-southeast-1.rds.amazonaws.com"
-POSTGRES_PORT = 5432
-POSTGRES_DATABASE = "digital_banking"
-POSTGRES_USER = "digitaluser"
-POSTGRES_PASSWORD = "DigitalPass123!"
+# PostgreSQL RDS connection (override POSTGRES_HOST etc. for the local container in infrastructure/docker)
+POSTGRES_HOST = os.getenv('POSTGRES_HOST', "snowflake-credit-demo-postgres.c7yg0uyimv09.ap-southeast-1.rds.amazonaws.com")
+POSTGRES_PORT = int(os.getenv('POSTGRES_PORT', '5432'))
+POSTGRES_DATABASE = os.getenv('POSTGRES_DATABASE', "digital_banking")
+POSTGRES_USER = os.getenv('POSTGRES_USER', "digitaluser")
+POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', "DigitalPass123!")
 
-print("=" * 70)
-print("PostgreSQL Digital Banking Data Generator")
-print("=" * 70)
-print(f"Host: {POSTGRES_HOST}:{POSTGRES_PORT}")
-print(f"Database: {POSTGRES_DATABASE}")
-print(f"Target Records:")
-print(f"  - Customers: {NUM_CUSTOMERS:,}")
-print(f"  - Sessions: ~{NUM_CUSTOMERS * SESSIONS_PER_CUSTOMER:,}")
-print(f"  - Events: ~{NUM_CUSTOMERS * SESSIONS_PER_CUSTOMER * EVENTS_PER_SESSION:,}")
-print(f"  - KYC Docs: ~{int(NUM_CUSTOMERS * KYC_DOC_RATE):,}")
-print("=" * 70)
-print()
+# Load method: 'copy' (COPY FROM STDIN, see loaders/postgres.py) or 'insert' (execute_batch)
+LOAD_METHOD = os.getenv('LOAD_METHOD', 'copy')
+# Drop secondary indexes during COPY and rebuild them afterwards
+DROP_INDEXES = os.getenv('DROP_INDEXES', 'true').lower() == 'true'
+# COPY while generating: batches are loaded over PIPELINE_LOAD_WORKERS connections (loaders/pipeline.py)
+PIPELINE = os.getenv('PIPELINE', 'true').lower() == 'true'
+# Rows generated (from their own seed), committed and checkpointed together
+CHUNK_ROWS = int(os.getenv('CHUNK_ROWS', '50000'))
+# Continue an interrupted COPY run from its checkpoint (loaders/checkpoint.py) instead of starting over
+RESUME = os.getenv('RESUME', 'true').lower() == 'true'
+
+def print_banner():
+    print("=" * 70)
+    print("PostgreSQL Digital Banking Data Generator")
+    print("=" * 70)
+    print(f"Host: {POSTGRES_HOST}:{POSTGRES_PORT}")
+    print(f"Database: {POSTGRES_DATABASE}")
+    print(f"Load method: {LOAD_METHOD}{' (pipelined)' if PIPELINE and LOAD_METHOD == 'copy' else ''}, "
+          f"{CHUNK_ROWS:,}-row chunks")
+    print(f"Target Records:")
+    print(f"  - Customers: {NUM_CUSTOMERS:,}")
+    print(f"  - Sessions: ~{NUM_CUSTOMERS * SESSIONS_PER_CUSTOMER:,}")
+    print(f"  - Events: ~{NUM_CUSTOMERS * SESSIONS_PER_CUSTOMER * EVENTS_PER_SESSION:,}")
+    print(f"  - KYC Docs: ~{int(NUM_CUSTOMERS * KYC_DOC_RATE):,}")
+    print("=" * 70)
+    print()
 
 def get_postgres_connection():
     """Connect to PostgreSQL database"""
@@ -211,12 +229,35 @@ def create_tables(connection):
     cursor.close()
     print("✅ Tables created\n")
 
-def generate_digital_profiles(num_customers):
-    """Generate digital customer profiles"""
+def seed_generators(seed):
+    """Reseed every random source, so what follows comes out the same on every run"""
+    Faker.seed(seed)
+    np.random.seed(seed)
+    random.seed(seed)
+
+def planned_rows(total_rows, batch_size, seeds=None):
+    """Row numbers to generate: all of them, or only the batches in seeds ({batch index: seed}),
+    each generated from its own seed"""
+    if seeds is None:
+        return range(total_rows)
+    
+    def seeded_rows():
+        for batch, seed in sorted(seeds.items()):
+            seed_generators(seed)
+            yield from range(batch * batch_size, min((batch + 1) * batch_size, total_rows))
+    return seeded_rows()
+
+def run_config():
+    """Settings that shape the generated rows; a checkpoint only resumes a run with the same ones"""
+    return (f"customers={NUM_CUSTOMERS} sessions={SESSIONS_PER_CUSTOMER} events={EVENTS_PER_SESSION} "
+            f"kyc={KYC_DOC_RATE} chunk={CHUNK_ROWS} seed={SEED}")
+
+def generate_digital_profiles(num_customers, seeds=None):
+    """Generate digital customer profiles (seeds: per-chunk seeds, see planned_rows)"""
     print(f"👥 Generating {num_customers:,} digital customer profiles...")
     
     profiles = []
-    for i in tqdm(range(num_customers)):
+    for i in tqdm(planned_rows(num_customers, CHUNK_ROWS, seeds)):
         # Registration date (last 5 years)
         reg_date = datetime.now() - timedelta(days=random.randint(0, 1825))
         
@@ -263,6 +304,11 @@ def generate_digital_profiles(num_customers):
 
 def generate_sessions(num_customers, avg_sessions_per_customer, profiles_df):
     """Generate session data"""
+    return pd.concat(generate_session_batches(num_customers, avg_sessions_per_customer, profiles_df),
+                     ignore_index=True)
+
+def generate_session_batches(num_customers, avg_sessions_per_customer, profiles_df, batch_size=CHUNK_ROWS, seeds=None):
+    """Generate session data, yielding one DataFrame per batch (seeds: see planned_rows)"""
     total_sessions = num_customers * avg_sessions_per_customer
     print(f"\n🔐 Generating {total_sessions:,} sessions...")
     
@@ -271,7 +317,7 @@ def generate_sessions(num_customers, avg_sessions_per_customer, profiles_df):
     cities = ['Singapore', 'Kuala Lumpur', 'Jakarta', 'Bangkok', 'Manila']
     countries = ['SG', 'MY', 'ID', 'TH', 'PH']
     
-    for i in tqdm(range(total_sessions)):
+    for i in tqdm(planned_rows(total_sessions, batch_size, seeds)):
         customer_idx = random.randint(0, num_customers - 1)
         digital_id = profiles_df.iloc[customer_idx]['digital_id']
         
@@ -332,11 +378,19 @@ def generate_sessions(num_customers, avg_sessions_per_customer, profiles_df):
             'exit_reason': random.choice(['NORMAL', 'TIMEOUT', 'ERROR', 'USER_CLOSE', None]),
             'created_date': start_time
         })
+        if len(sessions) == batch_size:
+            yield pd.DataFrame(sessions)
+            sessions = []
     
-    return pd.DataFrame(sessions)
+    if sessions:
+        yield pd.DataFrame(sessions)
 
 def generate_events(sessions_df, avg_events_per_session):
     """Generate event data"""
+    return pd.concat(generate_event_batches(sessions_df, avg_events_per_session), ignore_index=True)
+
+def generate_event_batches(sessions_df, avg_events_per_session, batch_size=CHUNK_ROWS, seeds=None):
+    """Generate event data, yielding one DataFrame per batch (seeds: see planned_rows)"""
     total_events = int(len(sessions_df) * avg_events_per_session)
     print(f"\n📱 Generating {total_events:,} digital events...")
     
@@ -366,7 +420,7 @@ def generate_events(sessions_df, avg_events_per_session):
     # Create list of session IDs to reference
     session_list = sessions_df[['session_id', 'digital_id', 'customer_id']].to_dict('records')
     
-    for i in tqdm(range(total_events)):
+    for i in tqdm(planned_rows(total_events, batch_size, seeds)):
         # Pick random session
         session = random.choice(session_list)
         
@@ -397,8 +451,12 @@ def generate_events(sessions_df, avg_events_per_session):
             'error_message': None if is_success else random.choice(['Network timeout', 'Invalid input', 'Server error', 'Authentication failed']),
             'created_date': event_time
         })
+        if len(events) == batch_size:
+            yield pd.DataFrame(events)
+            events = []
     
-    return pd.DataFrame(events)
+    if events:
+        yield pd.DataFrame(events)
 
 def generate_kyc_documents(profiles_df, kyc_rate):
     """Generate KYC document data"""
@@ -477,29 +535,104 @@ def bulk_insert_postgres(connection, table_name, df, batch_size=1000):
     cursor.close()
     print(f"✅ Inserted {total_rows:,} rows\n")
 
+def checkpointed_stages(checkpoint):
+    """Tables in load order; each yields its (chunk_index, seed, DataFrame) chunks not committed yet
+
+    Profiles and sessions are regenerated in full when resuming (the tables after
+    them draw from every row), but only their missing chunks are loaded again.
+    """
+    generated = {}
+    
+    def profiles():
+        chunks = checkpoint.chunks('digital_customer_profile', NUM_CUSTOMERS, CHUNK_ROWS)
+        generated['profiles'] = generate_digital_profiles(NUM_CUSTOMERS, {c.index: c.seed for c in chunks})
+        for c in chunks:
+            if not c.committed:
+                yield c.index, c.seed, generated['profiles'].iloc[c.first:c.first + c.count]
+    
+    def sessions():
+        chunks = checkpoint.chunks('digital_session', NUM_CUSTOMERS * SESSIONS_PER_CUSTOMER, CHUNK_ROWS)
+        batches = generate_session_batches(NUM_CUSTOMERS, SESSIONS_PER_CUSTOMER, generated['profiles'],
+                                           seeds={c.index: c.seed for c in chunks})
+        generated['sessions'] = []
+        for c, batch in zip(chunks, batches):
+            generated['sessions'].append(batch)
+            if not c.committed:
+                yield c.index, c.seed, batch
+    
+    def events():
+        sessions_df = pd.concat(generated['sessions'], ignore_index=True)
+        chunks = checkpoint.chunks('digital_event', int(len(sessions_df) * EVENTS_PER_SESSION), CHUNK_ROWS)
+        pending = [c for c in chunks if not c.committed]
+        batches = generate_event_batches(sessions_df, EVENTS_PER_SESSION, seeds={c.index: c.seed for c in pending})
+        for c, batch in zip(pending, batches):
+            yield c.index, c.seed, batch
+    
+    def kyc_documents():
+        # One chunk: the documents are a sample over all profiles
+        num_docs = int(NUM_CUSTOMERS * KYC_DOC_RATE)
+        for c in checkpoint.chunks('digital_kyc_document', num_docs, max(num_docs, 1)):
+            if not c.committed:
+                seed_generators(c.seed)
+                yield c.index, c.seed, generate_kyc_documents(generated['profiles'], KYC_DOC_RATE)
+    
+    return [('digital_customer_profile', profiles(), checkpoint),
+            ('digital_session', sessions(), checkpoint),
+            ('digital_event', events(), checkpoint),
+            ('digital_kyc_document', kyc_documents(), checkpoint)]
+
+def copy_load(connection):
+    """Generate and COPY every table chunk by chunk, resuming from the checkpoint of an interrupted run"""
+    checkpoint = Checkpoint(connection, 'postgres', 'generate_postgres_data', run_config(), SEED)
+    if RESUME and checkpoint.resumable:
+        print(f"♻️  Resuming from checkpoint: {checkpoint.describe()}\n")
+    else:
+        create_tables(connection)
+        checkpoint.reset()
+    
+    stages = checkpointed_stages(checkpoint)
+    make_loader = lambda conn: PostgresCopyLoader(conn, rebuild_indexes=DROP_INDEXES)
+    if PIPELINE:
+        # Batches are loaded over several connections while the next ones are generated
+        print("🎲 Generating sample data and 📤 loading it to PostgreSQL RDS...\n")
+        results = run_pipeline(stages, get_postgres_connection, make_loader)
+    else:
+        print("🎲 Generating sample data and 📤 loading it to PostgreSQL RDS, chunk by chunk...\n")
+        loader = make_loader(connection)
+        results = [loader.load(table_name, chunks, checkpoint=table_checkpoint)
+                   for table_name, chunks, table_checkpoint in stages]
+    print_load_summary(results)
+    # Complete: the next run starts over
+    checkpoint.reset()
+
 def main():
+    print_banner()
+    
     # Connect
     conn = get_postgres_connection()
     if not conn:
         return
     
-    # Create tables
-    create_tables(conn)
-    
-    # Generate data
-    print("🎲 Generating sample data...\n")
-    
-    profiles_df = generate_digital_profiles(NUM_CUSTOMERS)
-    sessions_df = generate_sessions(NUM_CUSTOMERS, SESSIONS_PER_CUSTOMER, profiles_df)
-    events_df = generate_events(sessions_df, EVENTS_PER_SESSION)
-    kyc_df = generate_kyc_documents(profiles_df, KYC_DOC_RATE)
-    
-    # Load data
-    print("\n📤 Loading data to PostgreSQL RDS...\n")
-    bulk_insert_postgres(conn, 'digital_customer_profile', profiles_df)
-    bulk_insert_postgres(conn, 'digital_session', sessions_df)
-    bulk_insert_postgres(conn, 'digital_event', events_df)
-    bulk_insert_postgres(conn, 'digital_kyc_document', kyc_df)
+    if LOAD_METHOD == 'copy':
+        copy_load(conn)
+    else:
+        # Create tables
+        create_tables(conn)
+        
+        # Generate data
+        print("🎲 Generating sample data...\n")
+        
+        profiles_df = generate_digital_profiles(NUM_CUSTOMERS)
+        sessions_df = generate_sessions(NUM_CUSTOMERS, SESSIONS_PER_CUSTOMER, profiles_df)
+        events_df = generate_events(sessions_df, EVENTS_PER_SESSION)
+        kyc_df = generate_kyc_documents(profiles_df, KYC_DOC_RATE)
+        
+        # Load data
+        print("\n📤 Loading data to PostgreSQL RDS...\n")
+        bulk_insert_postgres(conn, 'digital_customer_profile', profiles_df)
+        bulk_insert_postgres(conn, 'digital_session', sessions_df)
+        bulk_insert_postgres(conn, 'digital_event', events_df)
+        bulk_insert_postgres(conn, 'digital_kyc_document', kyc_df)
     
     # Verify
     cursor = conn.cursor()
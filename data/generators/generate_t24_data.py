@@ -12,11 +12,17 @@ from datetime import datetime, timedelta
 import random
 from tqdm import tqdm
 
+from key_registry import KeyRegistry
+from loaders import OracleArrayLoader, print_load_summary
+
 fake = Faker()
 Faker.seed(42)
 np.random.seed(42)
 random.seed(42)
 
+# Generator for the parent keys (see key_registry.py)
+key_rng = np.random.default_rng(42)
+
 # Configuration
 NUM_CUSTOMERS = 100000
 NUM_ACCOUNTS = 180000  # 1.8 per customer
@@ -95,15 +101,24 @@ def generate_customers(num_customers):
     
     return pd.DataFrame(customers)
 
-def generate_accounts(customers_df, num_accounts):
-    """Generate account data"""
-    print(f"\nGenerating {num_accounts:,} accounts...")
+def assign_keys(num_customers, num_accounts, num_loans):
+    """Key registry giving the accounts and loans their customers (and each loan an account of its own customer)"""
+    keys = KeyRegistry(np.arange(num_customers))
+    keys.assign_accounts(key_rng, num_accounts)
+    keys.assign_loans(key_rng, num_loans)
+    keys.validate()
+    return keys
+
+def generate_accounts(customers_df, keys):
+    """Generate account data for the accounts assigned in keys"""
+    print(f"\nGenerating {keys.num_accounts:,} accounts...")
     
     accounts = []
-    customer_ids = customers_df['CUSTOMER_ID'].tolist()
+    account_ids = keys.account_ids(np.arange(keys.num_accounts))
+    customer_ids = keys.customer_ids[keys.account_owner]
+    segments = customers_df['TARGET_MARKET'].to_numpy()[keys.account_owner]
     
-    for i in tqdm(range(num_accounts)):
-        customer_id = random.choice(customer_ids)
+    for i in tqdm(range(keys.num_accounts)):
         
         # Account types
         product_type = random.choices(
@@ -112,7 +127,7 @@ def generate_accounts(customers_df, num_accounts):
         )[0]
         
         # Balance based on customer segment
-        customer_segment = customers_df[customers_df['CUSTOMER_ID'] == customer_id]['TARGET_MARKET'].values[0]
+        customer_segment = segments[i]
         if customer_segment == 'WEALTH':
             balance = random.uniform(50000, 500000)
         elif customer_segment == 'RETAIL':
@@ -123,8 +138,8 @@ def generate_accounts(customers_df, num_accounts):
         opening_date = fake.date_between(start_date='-10y', end_date='today')
         
         accounts.append({
-            'ACCOUNT_ID': f'ACC-{i:07d}',
-            'CUSTOMER_ID': customer_id,
+            'ACCOUNT_ID': account_ids[i],
+            'CUSTOMER_ID': customer_ids[i],
             'ACCOUNT_TITLE': f'{product_type} Account',
             'CATEGORY': product_type[:4],
             'PRODUCT_CODE': f'PRD{random.randint(100, 999)}',
@@ -147,16 +162,18 @@ def generate_accounts(customers_df, num_accounts):
     
     return pd.DataFrame(accounts)
 
-def generate_loans(customers_df, num_loans):
-    """Generate loan data"""
-    print(f"\nGenerating {num_loans:,} loans...")
+def generate_loans(customers_df, keys):
+    """Generate loan data for the loans assigned in keys"""
+    print(f"\nGenerating {keys.num_loans:,} loans...")
     
     loans = []
-    customer_ids = customers_df['CUSTOMER_ID'].tolist()
+    loan_ids = keys.loan_ids(np.arange(keys.num_loans))
+    customer_ids = keys.customer_ids[keys.loan_owner]
+    account_ids = keys.account_ids(keys.loan_account)
+    risk_categories = customers_df['RISK_CATEGORY'].to_numpy()[keys.loan_owner]
     
-    for i in tqdm(range(num_loans)):
-        customer_id = random.choice(customer_ids)
-        risk_cat = customers_df[customers_df['CUSTOMER_ID'] == customer_id]['RISK_CATEGORY'].values[0]
+    for i in tqdm(range(keys.num_loans)):
+        risk_cat = risk_categories[i]
         
         # Loan parameters based on risk
         loan_type = random.choices(
@@ -214,9 +231,9 @@ def generate_loans(customers_df, num_loans):
             loan_status = 'CLOSED'
         
         loans.append({
-            'LOAN_ID': f'LN-{i:08d}',
-            'CUSTOMER_ID': customer_id,
-            'ACCOUNT_ID': f'ACC-{random.randint(0, 180000):07d}',
+            'LOAN_ID': loan_ids[i],
+            'CUSTOMER_ID': customer_ids[i],
+            'ACCOUNT_ID': account_ids[i],
             'LOAN_TYPE': loan_type,
             'PRODUCT_CODE': f'LN{random.randint(100, 999)}',
             'PRODUCT_NAME': f'{loan_type} Loan',
@@ -247,48 +264,16 @@ def generate_loans(customers_df, num_loans):
     return pd.DataFrame(loans)
 
 def insert_data_to_oracle(connection, customers_df, accounts_df, loans_df):
-    """Insert generated data into Oracle"""
-    cursor = connection.cursor()
-    
+    """Insert generated data into Oracle (array DML, one commit per table)"""
+    loader = OracleArrayLoader(connection)
     try:
-        # Insert customers
-        print("\nInserting customers into Oracle...")
-        for _, row in tqdm(customers_df.iterrows(), total=len(customers_df)):
-            cursor.execute("""
-                INSERT INTO T24_CUSTOMER VALUES 
-                (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22)
-            """, tuple(row))
-        
-        connection.commit()
-        print(f"✓ Inserted {len(customers_df):,} customers")
-        
-        # Insert accounts
-        print("\nInserting accounts into Oracle...")
-        for _, row in tqdm(accounts_df.iterrows(), total=len(accounts_df)):
-            cursor.execute("""
-                INSERT INTO T24_ACCOUNT VALUES 
-                (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20)
-            """, tuple(row))
-        
-        connection.commit()
-        print(f"✓ Inserted {len(accounts_df):,} accounts")
-        
-        # Insert loans
-        print("\nInserting loans into Oracle...")
-        for _, row in tqdm(loans_df.iterrows(), total=len(loans_df)):
-            cursor.execute("""
-                INSERT INTO T24_LOAN VALUES 
-                (:1, :2, :3, :4, :5, :6, :7, :8, :9, :10, :11, :12, :13, :14, :15, :16, :17, :18, :19, :20, :21, :22, :23, :24, :25, :26, :27, :28)
-            """, tuple(row))
-        
-        connection.commit()
-        print(f"✓ Inserted {len(loans_df):,} loans")
-        
+        # Parents first so the foreign keys resolve
+        print()
+        print_load_summary([loader.load('T24_CUSTOMER', customers_df),
+                            loader.load('T24_ACCOUNT', accounts_df),
+                            loader.load('T24_LOAN', loans_df)])
     except Exception as e:
         print(f"✗ Error inserting data: {e}")
-        connection.rollback()
-    finally:
-        cursor.close()
 
 def main():
     print("=" * 60)
@@ -302,8 +287,9 @@ def main():
     
     # Generate data
     customers_df = generate_customers(NUM_CUSTOMERS)
-    accounts_df = generate_accounts(customers_df, NUM_ACCOUNTS)
-    loans_df = generate_loans(customers_df, NUM_LOANS)
+    keys = assign_keys(NUM_CUSTOMERS, NUM_ACCOUNTS, NUM_LOANS)
+    accounts_df = generate_accounts(customers_df, keys)
+    loans_df = generate_loans(customers_df, keys)
     
     # Insert into Oracle
     insert_data_to_oracle(conn, customers_df, accounts_df, loans_df)
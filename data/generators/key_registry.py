@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Array-backed key registry shared by the generators
+Holds the parent keys of a contiguous block of customers (a whole run, or
+one shard of it) as NumPy arrays, so child tables pick their parents by
+index arithmetic instead of random.choice over lists and dict lookups.
+
+Customers are addressed by their position in the block. Accounts and loans
+are numbered contiguously per customer, CSR style: customer c owns the
+accounts account_offsets[c] to account_offsets[c + 1] - 1 (and the loans
+loan_offsets[c] to loan_offsets[c + 1] - 1), counted from the block's
+account_offset / loan_offset. Every child key is read out of these arrays,
+so it always names a row its parent table has; validate() re-checks that.
+
+    keys = KeyRegistry(customer_numbers, digital_ids)  # digital_ids=None when T24 only
+    keys.assign_accounts(rng, num_accounts, account_offset)
+    keys.assign_loans(rng, num_loans, loan_offset)
+    parent = keys.sample_accounts(rng, n)
+    account_ids = keys.account_ids(parent)
+    customer_ids = keys.customer_ids[keys.account_owner[parent]]
+"""
+
+import numpy as np
+
+from vectorized_engine import format_ids
+
+def _offsets(owner, num_customers):
+    """CSR offsets of children sorted by owner: owner c's children are offsets[c]:offsets[c + 1]"""
+    return np.concatenate([[0], np.cumsum(np.bincount(owner, minlength=num_customers))])
+
+class KeyRegistry:
+    """Customer, digital, account, loan and session keys of one block of customers"""
+
+    def __init__(self, customer_numbers, digital_ids=None):
+        self.customer_numbers = np.asarray(customer_numbers, dtype=np.int64)
+        self.customer_ids = format_ids('CUS-', self.customer_numbers, 6)
+        self.digital_ids = None if digital_ids is None else np.asarray(digital_ids, dtype=object)
+
+        self.account_offset = 0
+        self.account_owner = None
+        self.account_offsets = None
+
+        self.loan_offset = 0
+        self.loan_owner = None
+        self.loan_offsets = None
+        self.loan_account = None
+
+        self.session_ids = None
+        self.session_customer = None
+        self.session_start = None
+
+    @property
+    def num_customers(self):
+        return len(self.customer_numbers)
+
+    @property
+    def num_accounts(self):
+        return 0 if self.account_owner is None else len(self.account_owner)
+
+    @property
+    def num_loans(self):
+        return 0 if self.loan_owner is None else len(self.loan_owner)
+
+    # ============================================
+    # ASSIGNMENT
+    # ============================================
+
+    def assign_accounts(self, rng, num_accounts, account_offset=0):
+        """Give num_accounts accounts to uniformly drawn customers, numbered per customer"""
+        self.account_offset = account_offset
+        self.account_owner = np.sort(rng.integers(0, self.num_customers, num_accounts))
+        self.account_offsets = _offsets(self.account_owner, self.num_customers)
+        return self.account_owner
+
+    def assign_loans(self, rng, num_loans, loan_offset=0):
+        """Give num_loans loans to customers holding an account, each paid into one of theirs"""
+        account_counts = np.diff(self.account_offsets)
+        holders = np.flatnonzero(account_counts)
+        if num_loans and not len(holders):
+            raise ValueError("loans need at least one customer with an account")
+
+        self.loan_offset = loan_offset
+        self.loan_owner = np.sort(holders[rng.integers(0, len(holders), num_loans)])
+        self.loan_offsets = _offsets(self.loan_owner, self.num_customers)
+        self.loan_account = (self.account_offsets[self.loan_owner] +
+                             (rng.random(num_loans) * account_counts[self.loan_owner]).astype(np.int64))
+        return self.loan_owner
+
+    def register_sessions(self, session_ids, customers, session_start):
+        """Record the sessions generated for this block; customers are positions in the block"""
+        self.session_ids = np.asarray(session_ids, dtype=object)
+        self.session_customer = np.asarray(customers, dtype=np.int64)
+        self.session_start = np.asarray(session_start)
+
+    # ============================================
+    # PARENT SAMPLING
+    # ============================================
+
+    def sample_customers(self, rng, n):
+        """n uniformly drawn customer positions"""
+        return rng.integers(0, self.num_customers, n)
+
+    def sample_accounts(self, rng, n):
+        """n uniformly drawn account positions"""
+        return rng.integers(0, self.num_accounts, n)
+
+    def sample_loans(self, rng, n):
+        """n uniformly drawn loan positions"""
+        return rng.integers(0, self.num_loans, n)
+
+    def sample_sessions(self, rng, n):
+        """n uniformly drawn session positions"""
+        return rng.integers(0, len(self.session_ids), n)
+
+    def account_ids(self, accounts):
+        """ACC- keys for account positions"""
+        return format_ids('ACC-', self.account_offset + np.asarray(accounts), 7)
+
+    def loan_ids(self, loans):
+        """LN- keys for loan positions"""
+        return format_ids('LN-', self.loan_offset + np.asarray(loans), 8)
+
+    # ============================================
+    # VALIDATION
+    # ============================================
+
+    def validate(self):
+        """Raise ValueError if any registered key points outside its parent"""
+        n = self.num_customers
+        problems = []
+        if self.digital_ids is not None:
+            if len(self.digital_ids) != n:
+                problems.append(f"{len(self.digital_ids):,} digital ids for {n:,} customers")
+            elif len(np.unique(self.digital_ids)) != n:
+                problems.append("duplicate digital ids")
+
+        for table, owner, offsets in (('account', self.account_owner, self.account_offsets),
+                                      ('loan', self.loan_owner, self.loan_offsets)):
+            if owner is None:
+                continue
+            if len(owner) and (owner.min() < 0 or owner.max() >= n):
+                problems.append(f"{table} owner outside the {n:,} customers")
+            elif not np.array_equal(offsets, _offsets(owner, n)) or np.any(np.diff(owner) < 0):
+                problems.append(f"{table}s are not numbered contiguously per customer")
+
+        if self.loan_account is not None and not problems:
+            first = self.account_offsets[self.loan_owner]
+            last = self.account_offsets[self.loan_owner + 1]
+            if np.any((self.loan_account < first) | (self.loan_account >= last)):
+                problems.append("loan paid into an account its customer does not hold")
+
+        if self.session_customer is not None:
+            if len(self.session_customer) != len(self.session_ids):
+                problems.append("session ids and customers differ in length")
+            elif len(self.session_customer) and (self.session_customer.min() < 0 or self.session_customer.max() >= n):
+                problems.append(f"session customer outside the {n:,} customers")
+
+        if problems:
+            raise ValueError(f"key registry: {'; '.join(problems)}")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Load report for Snowflake COPY INTO runs
+Built from the per-file COPY results (rows parsed / loaded / errors, first
+error) plus ONE batched row-count query over INFORMATION_SCHEMA.TABLES, so
+validation costs a single round trip instead of a COUNT(*) per table.
+
+With ON_ERROR = 'CONTINUE', rows_parsed - rows_loaded is the number of rows
+COPY silently dropped; the report surfaces it per file and per table and is
+saved as JSON for monitoring.
+"""
+
+import json
+import os
+from datetime import datetime
+
+# ============================================
+# VALIDATION
+# ============================================
+
+def row_counts_sql(database, targets):
+    """One INFORMATION_SCHEMA.TABLES query for every (schema, table) target"""
+    schemas = ', '.join(sorted({f"'{schema}'" for schema, _ in targets}))
+    tables = ', '.join(sorted({f"'{table}'" for _, table in targets}))
+    return f"""
+        SELECT TABLE_SCHEMA, TABLE_NAME, ROW_COUNT
+        FROM {database}.INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA IN ({schemas})
+          AND TABLE_NAME IN ({tables})
+        """
+
+def fetch_row_counts(conn, database, targets):
+    """{(schema, table): row_count} for the targets, None for tables that do not exist"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(row_counts_sql(database, targets))
+        found = {(schema, table): row_count for schema, table, row_count in cursor.fetchall()}
+    finally:
+        cursor.close()
+    return {target: found.get(target) for target in targets}
+
+# ============================================
+# REPORT
+# ============================================
+
+def build_load_report(table_results, file_results, row_counts, source_rows=None, skipped=()):
+    """Combine COPY results, upload results and table row counts into one report dict
+
+    source_rows optionally maps (schema, table) to the rows in the local files,
+    so rows that never made it into a COPY are counted as dropped too.
+    skipped lists the (schema, table) targets left untouched this run.
+    """
+    source_rows = source_rows or {}
+    tables = []
+    for r in sorted(table_results, key=lambda r: (r['schema'], r['table'])):
+        target = (r['schema'], r['table'])
+        loaded = r['rows'] or 0
+        expected = max(source_rows.get(target) or 0, r['rows_parsed'])
+        tables.append({
+            'schema': r['schema'],
+            'table': r['table'],
+            'status': 'FAILED' if r['error'] else ('PARTIAL' if expected > loaded else 'LOADED'),
+            'action': 'reload' if r['truncated'] else 'append',
+            'source_rows': source_rows.get(target),
+            'rows_parsed': r['rows_parsed'],
+            'rows_loaded': loaded,
+            'rows_dropped': max(expected - loaded, 0),
+            'errors_seen': r['errors_seen'],
+            'table_row_count': row_counts.get(target),
+            'seconds': round(r['seconds'], 3),
+            'error': r['error'],
+            'files': r['copy_results'],
+        })
+    for schema, table in sorted(skipped):
+        tables.append({'schema': schema, 'table': table, 'status': 'UNCHANGED', 'action': 'skip',
+                       'table_row_count': row_counts.get((schema, table))})
+
+    loaded = [t for t in tables if t['action'] != 'skip']
+    return {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'summary': {
+            'tables_loaded': sum(t['status'] != 'FAILED' for t in loaded),
+            'tables_failed': sum(t['status'] == 'FAILED' for t in loaded),
+            'tables_with_dropped_rows': sum(t['rows_dropped'] > 0 for t in loaded),
+            'tables_unchanged': len(tables) - len(loaded),
+            'rows_loaded': sum(t['rows_loaded'] for t in loaded),
+            'rows_dropped': sum(t['rows_dropped'] for t in loaded),
+            'errors_seen': sum(t['errors_seen'] for t in loaded),
+            'bytes_uploaded': sum(f['bytes'] for f in file_results if not f['error']),
+            'upload_failures': [f['file'] for f in file_results if f['error']],
+        },
+        'tables': tables,
+    }
+
+def save_load_report(path, report):
+    """Write the report as JSON (atomically, so monitoring never reads half a file)"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(report, f, indent=2, default=str)
+    os.replace(tmp_path, path)
+
+def print_load_report(report):
+    """Per-table load summary with dropped rows and first errors"""
+    print("\n📊 Load Summary:")
+    for t in report['tables']:
+        name = f"{t['schema']:20s}.{t['table']:35s}"
+        count = t['table_row_count']
+        count = f"{count:>10,} rows" if count is not None else f"{'?':>10} rows"
+        if t['action'] == 'skip':
+            print(f"   • {name} {count}  (unchanged)")
+        elif t['status'] == 'FAILED':
+            print(f"   • {name} FAILED: {t['error']}")
+        else:
+            print(f"   • {name} {count}  (+{t['rows_loaded']:,} loaded)")
+            if t['rows_dropped']:
+                first = next((f for f in t['files'] if f['first_error']), None)
+                print(f"     ⚠️  {t['rows_dropped']:,} rows dropped ({t['errors_seen']:,} errors)"
+                      + (f": {first['file']} line {first['first_error_line']}: {first['first_error']}"
+                         if first else ""))
+
+    summary = report['summary']
+    print(f"\n🎯 Rows loaded this run: {summary['rows_loaded']:,}  |  dropped: {summary['rows_dropped']:,}  |  "
+          f"failed tables: {summary['tables_failed']}")
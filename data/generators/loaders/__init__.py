@@ -0,0 +1,43 @@
+"""
+Bulk loaders for the source databases
+One chunked pipeline (loaders.base.BulkLoader) with a native fast path per
+dialect:
+
+    postgres    COPY FROM STDIN (optionally dropping indexes / foreign keys)
+    mysql       LOAD DATA LOCAL INFILE, multi-row INSERT fallback
+    oracle      array DML (executemany + setinputsizes + batch errors)
+    databricks  Parquet in a volume + COPY INTO, multi-row INSERT ... VALUES
+
+    loader = get_loader('postgres', connection, commit_rows=0)
+    result = loader.load('digital_event', events_df)   # or a generator of DataFrames
+    print(result['rows_per_second'])
+
+A new source system only needs a BulkLoader subclass with serialize() and
+send(); chunking, overlap, commits and metrics come from the base class.
+Database drivers are imported by the callers, not here.
+
+run_pipeline() (loaders.pipeline) generates and loads several tables at
+once: a generator thread feeds a bounded queue that loaders on separate
+connections drain, one table at a time in foreign key order. With a
+Checkpoint (loaders.checkpoint) each chunk commits with a checkpoint row, so
+an interrupted load resumes at the first missing chunk.
+"""
+
+from .base import BulkLoader, print_load_metrics, print_load_summary
+from .checkpoint import Checkpoint
+from .databricks import DatabricksLoader, DatabricksVolumeLoader
+from .mysql import MySQLLoader
+from .oracle import OracleArrayLoader
+from .pipeline import run_pipeline
+from .postgres import PostgresCopyLoader
+
+LOADERS = {
+    'postgres': PostgresCopyLoader,
+    'mysql': MySQLLoader,
+    'oracle': OracleArrayLoader,
+    'databricks': DatabricksLoader,
+}
+
+def get_loader(dialect, connection, **options):
+    """The BulkLoader for a dialect, bound to an open connection"""
+    return LOADERS[dialect](connection, **options)
@@ -0,0 +1,207 @@
+"""
+Common bulk-load pipeline for the source-database loaders
+A BulkLoader takes a DataFrame, a pyarrow Table/RecordBatch, a list of row
+tuples, or an iterable of any of those (e.g. a generator yielding batches),
+cuts it into chunks and, on a background thread, pulls and serializes the
+next chunk while the current one is sent. Commit policy and rows/s metrics
+are the same for every dialect; subclasses only supply the native path.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import pandas as pd
+from tqdm import tqdm
+
+# Rejected rows printed per table (all of them are counted)
+MAX_ERRORS_SHOWN = 5
+
+# ============================================
+# CHUNKS
+# ============================================
+
+def column_names(df):
+    """The chunk's column names, or None for positional rows (statements then omit the column list)"""
+    columns = df.columns.tolist()
+    return columns if all(isinstance(column, str) for column in columns) else None
+
+def _frames(data, columns):
+    """DataFrames from any supported input"""
+    if isinstance(data, pd.DataFrame):
+        yield data
+    elif hasattr(data, 'to_batches'):  # pyarrow.Table
+        for batch in data.to_batches():
+            yield batch.to_pandas()
+    elif hasattr(data, 'to_pandas'):  # pyarrow.RecordBatch
+        yield data.to_pandas()
+    elif isinstance(data, list) and (not data or isinstance(data[0], tuple)):
+        yield pd.DataFrame.from_records(data, columns=columns)
+    else:
+        for item in data:
+            yield from _frames(item, columns)
+
+def iter_chunks(data, chunk_rows, columns=None):
+    """Chunks of at most chunk_rows rows"""
+    for frame in _frames(data, columns):
+        for offset in range(0, len(frame), chunk_rows):
+            yield frame.iloc[offset:offset + chunk_rows]
+
+# ============================================
+# LOADER
+# ============================================
+
+class BulkLoader:
+    """Chunked bulk loader; subclasses implement serialize() and send()
+
+    commit_rows=0 commits once per load_rows() call; otherwise every
+    commit_rows rows (rounded up to whole chunks). load() returns a metrics
+    dict.
+    """
+
+    dialect = None
+    chunk_rows = 100000
+
+    def __init__(self, connection, chunk_rows=None, commit_rows=0):
+        self.connection = connection
+        self.chunk_rows = chunk_rows or self.chunk_rows
+        self.commit_rows = commit_rows
+        self.errors = []
+
+    @property
+    def method(self):
+        """Name of the native path, reported in the metrics"""
+        return self.dialect
+
+    @contextmanager
+    def table_session(self, table_name):
+        """Set-up and tear-down once per table, around all of its rows (index drops, ...)
+
+        Runs on this loader's connection while other loaders may be loading
+        the table (see loaders.pipeline), so anything it changes must be
+        committed before it yields.
+        """
+        yield
+
+    @contextmanager
+    def session(self, table_name):
+        """Set-up and tear-down around each load_rows() on this connection (session flags, ...)"""
+        yield
+
+    def serialize(self, chunk):
+        """Turn a DataFrame chunk into the payload send() takes (runs on the serializer thread)"""
+        raise NotImplementedError
+
+    def send(self, table_name, payload):
+        """Load one serialized chunk; returns the rows the database accepted"""
+        raise NotImplementedError
+
+    def commit(self):
+        self.connection.commit()
+
+    def rollback(self):
+        self.connection.rollback()
+
+    def _prepare(self, chunks):
+        chunk = next(chunks, None)
+        return None if chunk is None else (len(chunk), self.serialize(chunk))
+
+    def load(self, table_name, data, columns=None, checkpoint=None):
+        """Load data into table_name; columns names positional row tuples
+
+        With a checkpoint (loaders.checkpoint), data yields (chunk_index, seed,
+        chunk) and each chunk is committed together with its checkpoint row.
+        """
+        total = len(data) if isinstance(data, (pd.DataFrame, list)) else None
+        print(f"📥 Loading {table_name} ({self.dialect} {self.method})...")
+        start = time.perf_counter()
+        with self.table_session(table_name), tqdm(total=total, unit='rows', leave=False) as progress:
+            if checkpoint is None:
+                rows, loaded = self.load_rows(table_name, data, columns, progress)
+                errors = self.errors
+            else:
+                rows = loaded = 0
+                errors = []
+                for chunk_index, seed, chunk in data:
+                    chunk_rows, chunk_loaded = self.load_rows(table_name, chunk, columns, progress,
+                                                              checkpoint.recorder(table_name, chunk_index, seed))
+                    rows += chunk_rows
+                    loaded += chunk_loaded
+                    errors += self.errors
+        result = load_metrics(self, table_name, rows, loaded, errors, time.perf_counter() - start)
+        print_load_metrics(result)
+        return result
+
+    def load_rows(self, table_name, data, columns=None, progress=None, before_commit=None):
+        """Send data through this loader's connection; returns (rows, rows_loaded)
+
+        Rejected rows are left in self.errors. Does not run table_session().
+        before_commit(connection, rows_loaded) runs in the transaction of the
+        final commit, e.g. to record a checkpoint, so it needs commit_rows=0.
+        """
+        if before_commit is not None and self.commit_rows:
+            raise ValueError("before_commit needs a single commit per load_rows() (commit_rows=0)")
+        self.errors = []
+        chunks = iter_chunks(data, self.chunk_rows, columns)
+        rows = loaded = uncommitted = 0
+        with self.session(table_name):
+            try:
+                with ThreadPoolExecutor(max_workers=1) as serializer:
+                    # Generating / serializing chunk n+1 overlaps sending chunk n
+                    pending = serializer.submit(self._prepare, chunks)
+                    while (prepared := pending.result()) is not None:
+                        pending = serializer.submit(self._prepare, chunks)
+                        chunk_rows, payload = prepared
+                        loaded += self.send(table_name, payload)
+                        rows += chunk_rows
+                        uncommitted += chunk_rows
+                        if progress is not None:
+                            progress.update(chunk_rows)
+                        if self.commit_rows and uncommitted >= self.commit_rows:
+                            self.commit()
+                            uncommitted = 0
+                if before_commit is not None:
+                    before_commit(self.connection, loaded)
+                self.commit()
+            except Exception:
+                self.rollback()
+                raise
+        return rows, loaded
+
+# ============================================
+# METRICS
+# ============================================
+
+def load_metrics(loader, table_name, rows, loaded, errors, seconds):
+    """The metrics dict every load returns"""
+    return {
+        'dialect': loader.dialect,
+        'method': loader.method,
+        'table': table_name,
+        'rows': rows,
+        'rows_loaded': loaded,
+        'rows_rejected': rows - loaded,
+        'errors': list(errors)[:MAX_ERRORS_SHOWN],
+        'seconds': seconds,
+        'rows_per_second': loaded / max(seconds, 1e-9),
+    }
+
+def print_load_metrics(result):
+    """One-line rows/s summary for a load, plus the first rejected rows"""
+    print(f"✅ {result['table']}: {result['rows_loaded']:,} rows in {result['seconds']:.1f}s "
+          f"({result['rows_per_second']:,.0f} rows/s, {result['dialect']} {result['method']})")
+    if result['rows_rejected']:
+        print(f"⚠️  {result['rows_rejected']:,} rows rejected")
+        for row_number, message in result['errors']:
+            print(f"   row {row_number:,}: {message}")
+    print()
+
+def print_load_summary(results):
+    """Per-table rows/s for a set of loads"""
+    print("\n⏱️  Load throughput (per table):")
+    for r in results:
+        print(f"   • {r['table']:<45} {r['rows_loaded']:>12,} rows {r['seconds']:>8.1f}s "
+              f"{r['rows_per_second']:>12,.0f} rows/s")
+    rows = sum(r['rows_loaded'] for r in results)
+    seconds = max(sum(r['seconds'] for r in results), 1e-9)
+    print(f"\n   Total: {rows:,} rows in {seconds:.1f}s  |  {rows / seconds:,.0f} rows/s")
@@ -0,0 +1,155 @@
+"""
+Resumable loads: which generated chunks of which tables are committed
+A table is generated in fixed chunks, each from its own seed (chunk_seed), and
+a chunk's checkpoint row is written in the same transaction as its rows. After
+a failure a rerun with the same settings skips exactly the committed chunks and
+regenerates the missing ones identically - no gaps and no duplicates.
+
+    checkpoint = Checkpoint(connection, 'postgres', 'generate_postgres_data', run_config, SEED)
+    if not checkpoint.resumable:
+        create_tables(connection)
+        checkpoint.reset()
+    loader.load('digital_event', pending_chunks(), checkpoint=checkpoint)
+    checkpoint.reset()   # the run is complete
+
+The checkpoint table lives next to the loaded tables and survives their drops.
+"""
+
+import hashlib
+from collections import namedtuple
+
+CHECKPOINT_TABLE = 'load_checkpoint'
+
+CHECKPOINT_DDL = {
+    'postgres': f"""
+        CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (
+            load_name VARCHAR(100) NOT NULL,
+            run_config VARCHAR(500) NOT NULL,
+            table_name VARCHAR(128) NOT NULL,
+            chunk_index INTEGER NOT NULL,
+            seed BIGINT NOT NULL,
+            row_count INTEGER NOT NULL,
+            committed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (load_name, table_name, chunk_index)
+        )
+    """,
+    'mysql': f"""
+        CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (
+            LOAD_NAME VARCHAR(100) NOT NULL,
+            RUN_CONFIG VARCHAR(500) NOT NULL,
+            TABLE_NAME VARCHAR(128) NOT NULL,
+            CHUNK_INDEX INT NOT NULL,
+            SEED BIGINT NOT NULL,
+            ROW_COUNT INT NOT NULL,
+            COMMITTED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (LOAD_NAME, TABLE_NAME, CHUNK_INDEX)
+        )
+    """,
+    # No IF NOT EXISTS before 23ai; create() checks USER_TABLES first
+    'oracle': f"""
+        CREATE TABLE {CHECKPOINT_TABLE.upper()} (
+            LOAD_NAME VARCHAR2(100) NOT NULL,
+            RUN_CONFIG VARCHAR2(500) NOT NULL,
+            TABLE_NAME VARCHAR2(128) NOT NULL,
+            CHUNK_INDEX NUMBER(10) NOT NULL,
+            SEED NUMBER(12) NOT NULL,
+            ROW_COUNT NUMBER(12) NOT NULL,
+            COMMITTED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (LOAD_NAME, TABLE_NAME, CHUNK_INDEX)
+        )
+    """,
+}
+
+Chunk = namedtuple('Chunk', ['index', 'first', 'count', 'seed', 'committed'])
+
+def chunk_seed(run_seed, table_name, chunk_index):
+    """Seed for one chunk: set by the run seed, table and position, not by the chunks before it"""
+    digest = hashlib.sha256(f'{run_seed}:{table_name}:{chunk_index}'.encode()).digest()
+    return int.from_bytes(digest[:4], 'big')
+
+class Checkpoint:
+    """Committed chunks of one load (load_name), kept in the target database
+
+    run_config describes every setting that shapes the generated rows (row
+    counts, chunk size, seed); checkpoints written under a different
+    run_config are ignored, so changing the scale starts a fresh load.
+    """
+
+    def __init__(self, connection, dialect, load_name, run_config, run_seed):
+        self.connection = connection
+        self.dialect = dialect
+        self.load_name = load_name
+        self.run_config = run_config
+        self.run_seed = run_seed
+        self.create()
+        self.committed = self._read()
+
+    def params(self, count):
+        """Bind placeholders in the driver's paramstyle"""
+        if self.dialect == 'oracle':
+            return [f':{i + 1}' for i in range(count)]
+        return ['%s'] * count
+
+    def create(self):
+        cursor = self.connection.cursor()
+        if self.dialect == 'oracle':
+            cursor.execute("SELECT COUNT(*) FROM USER_TABLES WHERE TABLE_NAME = :1", [CHECKPOINT_TABLE.upper()])
+            exists = cursor.fetchone()[0] > 0
+        else:
+            exists = False
+        if not exists:
+            cursor.execute(CHECKPOINT_DDL[self.dialect])
+        self.connection.commit()
+        cursor.close()
+
+    def _read(self):
+        """{table: {chunk index: rows}} committed under this run_config"""
+        cursor = self.connection.cursor()
+        load_name, run_config = self.params(2)
+        cursor.execute(f"SELECT table_name, chunk_index, row_count FROM {CHECKPOINT_TABLE} "
+                       f"WHERE load_name = {load_name} AND run_config = {run_config}",
+                       [self.load_name, self.run_config])
+        committed = {}
+        for table_name, chunk_index, rows in cursor.fetchall():
+            committed.setdefault(table_name, {})[int(chunk_index)] = int(rows)
+        self.connection.commit()
+        cursor.close()
+        return committed
+
+    @property
+    def resumable(self):
+        """Whether an earlier run with the same settings committed any chunks"""
+        return any(self.committed.values())
+
+    def describe(self):
+        """What is already committed, per table"""
+        return ', '.join(f"{table} {len(chunks):,} chunks ({sum(chunks.values()):,} rows)"
+                         for table, chunks in self.committed.items())
+
+    def reset(self):
+        """Forget every checkpoint of this load (a fresh start, or a finished run)"""
+        cursor = self.connection.cursor()
+        cursor.execute(f"DELETE FROM {CHECKPOINT_TABLE} WHERE load_name = {self.params(1)[0]}", [self.load_name])
+        self.connection.commit()
+        cursor.close()
+        self.committed = {}
+
+    def chunks(self, table_name, total_rows, chunk_rows):
+        """Every chunk of a table, in order, with its seed and whether it is committed"""
+        done = self.committed.get(table_name, {})
+        return [Chunk(index, first, min(chunk_rows, total_rows - first),
+                      chunk_seed(self.run_seed, table_name, index), index in done)
+                for index, first in enumerate(range(0, total_rows, chunk_rows))]
+
+    def record(self, connection, table_name, chunk_index, seed, rows):
+        """Mark a chunk committed - inside the transaction that commits its rows"""
+        cursor = connection.cursor()
+        cursor.execute(f"INSERT INTO {CHECKPOINT_TABLE} "
+                       f"(load_name, run_config, table_name, chunk_index, seed, row_count) "
+                       f"VALUES ({', '.join(self.params(6))})",
+                       [self.load_name, self.run_config, table_name, chunk_index, seed, rows])
+        cursor.close()
+
+    def recorder(self, table_name, chunk_index, seed):
+        """record() for one chunk, as the before_commit hook of BulkLoader.load_rows()"""
+        return lambda connection, rows: self.record(connection, table_name, chunk_index, seed, rows)
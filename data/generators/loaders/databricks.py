@@ -0,0 +1,246 @@
+"""
+Databricks SQL loaders: Parquet + COPY INTO, or multi-row INSERT ... VALUES
+The connector's executemany() sends one statement per row. DatabricksVolumeLoader
+writes each chunk as a Parquet file, uploads it to a Unity Catalog volume with
+PUT and loads the files with one COPY INTO per commit. DatabricksLoader, for
+warehouses without a volume, renders each chunk as SQL literals and packs as
+many rows into one INSERT as fit in DATABRICKS_STATEMENT_BYTES.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .base import BulkLoader, column_names
+
+# Rows rendered per chunk
+DATABRICKS_CHUNK_ROWS = int(os.getenv('DATABRICKS_CHUNK_ROWS', '50000'))
+
+# Upper bound on the text of one INSERT statement
+DATABRICKS_STATEMENT_BYTES = int(os.getenv('DATABRICKS_STATEMENT_BYTES', str(8 * 1024 * 1024)))
+
+# Rows per Parquet file uploaded to the volume
+DATABRICKS_FILE_ROWS = int(os.getenv('DATABRICKS_FILE_ROWS', '500000'))
+
+# Local directory the Parquet files are written to; the connection must be
+# opened with staging_allowed_local_path set to it for PUT to read them
+DATABRICKS_STAGING_DIR = os.getenv('DATABRICKS_STAGING_DIR', tempfile.gettempdir())
+
+# COPY INTO takes at most 1,000 files in its FILES list
+COPY_MAX_FILES = 1000
+
+# ============================================
+# LITERALS
+# ============================================
+
+def quoted(text):
+    """Spark SQL string literals (backslash escapes)"""
+    return "'" + text.str.replace('\\', '\\\\', regex=False).str.replace("'", "\\'", regex=False) + "'"
+
+def sql_literals(values):
+    """One column as Spark SQL literals, NULL for missing values"""
+    nulls = values.isna().to_numpy()
+    inferred = pd.api.types.infer_dtype(values, skipna=True)
+    if inferred == 'boolean':
+        text = values.map({True: 'TRUE', False: 'FALSE'})
+    elif values.dtype.kind == 'M' or inferred == 'datetime':
+        text = "TIMESTAMP'" + pd.to_datetime(values).dt.strftime('%Y-%m-%d %H:%M:%S.%f') + "'"
+    elif inferred == 'date':
+        text = "DATE'" + values.astype(str) + "'"
+    elif values.dtype.kind == 'f' and (values.dropna() % 1 == 0).all():
+        text = values.astype('Int64').astype(str)
+    elif values.dtype.kind in 'iuf':
+        text = values.astype(str)
+    else:
+        text = quoted(values.astype(str))
+    return pd.Series(np.where(nulls, 'NULL', text), index=values.index)
+
+def sql_rows(df):
+    """"(...)" row literals for a chunk"""
+    literals = [sql_literals(df.iloc[:, i]) for i in range(df.shape[1])]
+    return ('(' + literals[0].str.cat(literals[1:], sep=', ') + ')').tolist()
+
+def statements(prefix, rows, statement_bytes):
+    """Multi-row INSERT statements of at most statement_bytes each (an oversized row goes alone)"""
+    batch, used = [], len(prefix)
+    for row in rows:
+        size = len(row.encode('utf-8')) + 2
+        if batch and used + size > statement_bytes:
+            yield prefix + ', '.join(batch)
+            batch, used = [], len(prefix)
+        batch.append(row)
+        used += size
+    if batch:
+        yield prefix + ', '.join(batch)
+
+# ============================================
+# LOAD
+# ============================================
+
+class DatabricksLoader(BulkLoader):
+    """Multi-row INSERT ... VALUES into a (fully qualified) Unity Catalog table
+
+    Databricks SQL commits each statement, so commit_rows has no effect and a
+    failed load leaves the chunks sent before the failure in the table.
+    """
+
+    dialect = 'databricks'
+    chunk_rows = DATABRICKS_CHUNK_ROWS
+
+    def __init__(self, connection, chunk_rows=None, commit_rows=0, statement_bytes=DATABRICKS_STATEMENT_BYTES):
+        super().__init__(connection, chunk_rows, commit_rows)
+        self.statement_bytes = statement_bytes
+
+    @property
+    def method(self):
+        return 'multi-row VALUES'
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def serialize(self, chunk):
+        return column_names(chunk), sql_rows(chunk)
+
+    def send(self, table_name, payload):
+        columns, rows = payload
+        target = f"{table_name} ({', '.join(columns)})" if columns else table_name
+        cursor = self.connection.cursor()
+        try:
+            for statement in statements(f"INSERT INTO {target} VALUES ", rows, self.statement_bytes):
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+        return len(rows)
+
+# ============================================
+# PARQUET
+# ============================================
+
+def parquet_table(chunk):
+    """A chunk as an Arrow table Spark can read (positional columns become _c0, _c1, ...)"""
+    import pyarrow as pa
+
+    if column_names(chunk) is None:
+        chunk = chunk.set_axis([f'_c{i}' for i in range(chunk.shape[1])], axis=1)
+    table = pa.Table.from_pandas(chunk, preserve_index=False)
+    # An all-NULL column has Arrow's null type, which Parquet readers reject
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+    return table
+
+def copy_select(file_columns, table_columns):
+    """COPY INTO's SELECT list: each file column cast to its table column's type"""
+    if all(column.startswith('_c') for column in file_columns):
+        pairs = zip(file_columns, table_columns)
+    else:
+        types = {name.upper(): (name, data_type) for name, data_type in table_columns}
+        pairs = [(column, types[column.upper()]) for column in file_columns]
+    return ', '.join(f"CAST(`{column}` AS {data_type}) AS `{name}`"
+                     for column, (name, data_type) in pairs)
+
+class DatabricksVolumeLoader(BulkLoader):
+    """Parquet files staged in a Unity Catalog volume, then COPY INTO the table
+
+    volume_path is a directory inside a volume (/Volumes/catalog/schema/volume/...).
+    send() uploads a chunk's file; commit() copies every file uploaded since
+    the last commit in one COPY INTO - one Delta transaction, checked against
+    the rows uploaded - and removes them. rollback() removes them uncopied.
+    """
+
+    dialect = 'databricks'
+    chunk_rows = DATABRICKS_FILE_ROWS
+
+    def __init__(self, connection, volume_path, chunk_rows=None, commit_rows=0,
+                 staging_dir=DATABRICKS_STAGING_DIR):
+        super().__init__(connection, chunk_rows, commit_rows)
+        self.volume_path = volume_path.rstrip('/')
+        self.staging_dir = staging_dir
+        self.table_columns = {}
+        self.staged = []
+
+    @property
+    def method(self):
+        return 'Parquet + COPY INTO'
+
+    def describe(self, table_name):
+        """[(column, type)] of a table, in table order"""
+        if table_name not in self.table_columns:
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute(f"DESCRIBE TABLE {table_name}")
+                columns = []
+                for name, data_type, *_ in cursor.fetchall():
+                    if not name or name.startswith('#'):  # partitioning section
+                        break
+                    columns.append((name, data_type))
+            finally:
+                cursor.close()
+            self.table_columns[table_name] = columns
+        return self.table_columns[table_name]
+
+    def serialize(self, chunk):
+        import pyarrow.parquet as pq
+
+        table = parquet_table(chunk)
+        handle, path = tempfile.mkstemp(prefix='databricks_load_', suffix='.parquet', dir=self.staging_dir)
+        os.close(handle)
+        # Spark reads microsecond timestamps, not pandas' nanoseconds
+        pq.write_table(table, path, compression='snappy',
+                       coerce_timestamps='us', allow_truncated_timestamps=True)
+        return path, table.column_names, table.num_rows
+
+    def send(self, table_name, payload):
+        path, columns, rows = payload
+        remote = f"{self.volume_path}/{os.path.basename(path)}"
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"PUT '{path}' INTO '{remote}' OVERWRITE")
+        finally:
+            cursor.close()
+            os.remove(path)
+        self.staged.append((table_name, remote, columns, rows))
+        return rows
+
+    def _remove_staged(self, cursor):
+        for _, remote, _, _ in self.staged:
+            cursor.execute(f"REMOVE '{remote}'")
+        self.staged = []
+
+    def commit(self):
+        if not self.staged:
+            return
+        cursor = self.connection.cursor()
+        try:
+            table_name, _, columns, _ = self.staged[0]
+            select = copy_select(columns, self.describe(table_name))
+            for first in range(0, len(self.staged), COPY_MAX_FILES):
+                batch = self.staged[first:first + COPY_MAX_FILES]
+                files = ', '.join(f"'{os.path.basename(remote)}'" for _, remote, _, _ in batch)
+                cursor.execute(f"COPY INTO {table_name} "
+                               f"FROM (SELECT {select} FROM '{self.volume_path}') "
+                               f"FILEFORMAT = PARQUET FILES = ({files})")
+                result = cursor.fetchone()
+                names = [column[0] for column in cursor.description]
+                inserted = int(result[names.index('num_inserted_rows')])
+                expected = sum(rows for _, _, _, rows in batch)
+                if inserted != expected:
+                    raise RuntimeError(f"COPY INTO {table_name} inserted {inserted:,} rows, "
+                                       f"{expected:,} were uploaded")
+            self._remove_staged(cursor)
+        finally:
+            cursor.close()
+
+    def rollback(self):
+        if not self.staged:
+            return
+        cursor = self.connection.cursor()
+        try:
+            self._remove_staged(cursor)
+        finally:
+            cursor.close()
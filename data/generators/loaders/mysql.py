@@ -0,0 +1,193 @@
+"""
+MySQL loader: LOAD DATA LOCAL INFILE with a multi-row INSERT fallback
+Each DataFrame chunk is serialized once into escaped tab-separated text. The
+fast path writes it to a temp TSV and runs LOAD DATA LOCAL INFILE; the
+fallback (for servers with local_infile=OFF) turns the same fields into
+multi-row INSERT statements sized to max_allowed_packet.
+
+Both run with autocommit, unique_checks and foreign_key_checks switched off
+for the session - meant for seeding tables with trusted generated data.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from .base import BulkLoader, column_names
+
+# Rows serialized per LOAD DATA file / INSERT batch
+LOAD_CHUNK_ROWS = int(os.getenv('LOAD_CHUNK_ROWS', '100000'))
+
+# NULL in LOAD DATA text (with the default ESCAPED BY '\\')
+NULL_MARKER = r'\N'
+
+# Room left in each INSERT packet for the protocol header
+PACKET_HEADROOM = 1024
+
+# ============================================
+# SERIALIZATION
+# ============================================
+
+def tsv_field(values):
+    """One column as LOAD DATA text: escaped strings, 1/0 booleans, \\N for NULL"""
+    nulls = values.isna().to_numpy()
+    if pd.api.types.infer_dtype(values, skipna=True) == 'boolean':
+        text = values.map({True: '1', False: '0'})
+    elif values.dtype.kind == 'M':
+        text = values.dt.strftime('%Y-%m-%d %H:%M:%S.%f')
+    elif values.dtype.kind == 'f' and (values.dropna() % 1 == 0).all():
+        # Integer columns that pandas turned into floats because of NULLs
+        text = values.astype('Int64').astype(str)
+    elif values.dtype.kind in 'iuf':
+        text = values.astype(str)
+    else:
+        text = (values.astype(str)
+                .str.replace('\\', '\\\\', regex=False)
+                .str.replace('\t', '\\t', regex=False)
+                .str.replace('\n', '\\n', regex=False)
+                .str.replace('\r', '\\r', regex=False))
+    return text.where(~nulls, NULL_MARKER)
+
+def tsv_fields(df):
+    """Every column of a chunk as LOAD DATA text"""
+    return [tsv_field(df.iloc[:, i]) for i in range(df.shape[1])]
+
+def to_tsv(fields):
+    """Join the fields into LOAD DATA file contents"""
+    return fields[0].str.cat(fields[1:], sep='\t').str.cat(sep='\n') + '\n'
+
+def sql_rows(fields):
+    """Join the fields into "(...)" INSERT row literals
+
+    LOAD DATA escapes are also valid string-literal escapes (unless the server
+    runs with NO_BACKSLASH_ESCAPES), so only quotes need escaping on top.
+    """
+    literals = [pd.Series(np.where(field == NULL_MARKER, 'NULL',
+                                   "'" + field.str.replace("'", "\\'", regex=False) + "'"),
+                          index=field.index)
+                for field in fields]
+    return '(' + literals[0].str.cat(literals[1:], sep=', ') + ')'
+
+# ============================================
+# SESSION
+# ============================================
+
+def infile_supported(connection):
+    """Whether the server accepts LOAD DATA LOCAL INFILE (local_infile=ON)"""
+    cursor = connection.cursor()
+    cursor.execute("SELECT @@GLOBAL.local_infile")
+    enabled = cursor.fetchone()[0]
+    cursor.close()
+    return bool(int(enabled))
+
+def max_allowed_packet(connection):
+    """The server's max_allowed_packet in bytes"""
+    cursor = connection.cursor()
+    cursor.execute("SELECT @@SESSION.max_allowed_packet")
+    size = cursor.fetchone()[0]
+    cursor.close()
+    return int(size)
+
+@contextmanager
+def bulk_load_session(connection):
+    """Autocommit, unique checks and foreign key checks off for a load, restored afterwards"""
+    cursor = connection.cursor()
+    cursor.execute("SELECT @@SESSION.unique_checks, @@SESSION.foreign_key_checks")
+    unique_checks, foreign_key_checks = cursor.fetchone()
+    autocommit = connection.autocommit
+    connection.autocommit = False
+    cursor.execute("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+    try:
+        yield cursor
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.execute(f"SET SESSION unique_checks = {int(unique_checks)}, "
+                       f"foreign_key_checks = {int(foreign_key_checks)}")
+        connection.autocommit = autocommit
+        cursor.close()
+
+# ============================================
+# LOAD
+# ============================================
+
+def load_data_infile(cursor, table_name, columns, fields):
+    """LOAD DATA LOCAL INFILE one chunk from a temp TSV; returns the rows MySQL loaded"""
+    fd, path = tempfile.mkstemp(prefix=f"{table_name.replace('.', '_')}_", suffix='.tsv')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(to_tsv(fields))
+        column_list = f"({', '.join(columns)})" if columns else ''
+        cursor.execute(f"""
+            LOAD DATA LOCAL INFILE '{path.replace(os.sep, '/')}'
+            INTO TABLE {table_name}
+            CHARACTER SET utf8mb4
+            FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+            LINES TERMINATED BY '\\n'
+            {column_list}
+        """)
+        return cursor.rowcount
+    finally:
+        os.remove(path)
+
+def insert_multirow(cursor, table_name, columns, fields, packet_bytes):
+    """Multi-row INSERTs of one chunk, each statement sized to fit max_allowed_packet"""
+    target = f"{table_name} ({', '.join(columns)})" if columns else table_name
+    prefix = f"INSERT INTO {target} VALUES "
+    rows = sql_rows(fields).tolist()
+    sizes = [len(row.encode('utf-8')) + 2 for row in rows]
+    limit = packet_bytes - PACKET_HEADROOM - len(prefix)
+    loaded = start = used = 0
+    for end, size in enumerate(sizes + [limit + 1]):
+        # Flush before the row that would overflow (a single oversized row goes alone)
+        if end > start and (used + size > limit or end == len(rows)):
+            cursor.execute(prefix + ', '.join(rows[start:end]))
+            loaded += cursor.rowcount
+            start, used = end, 0
+        used += size
+    return loaded
+
+class MySQLLoader(BulkLoader):
+    """LOAD DATA LOCAL INFILE ('infile') or multi-row INSERTs ('insert')
+
+    'infile' falls back to 'insert' when the server has local_infile=OFF.
+    """
+
+    dialect = 'mysql'
+    chunk_rows = LOAD_CHUNK_ROWS
+
+    def __init__(self, connection, chunk_rows=None, commit_rows=0, method='infile'):
+        super().__init__(connection, chunk_rows, commit_rows)
+        if method == 'infile' and not infile_supported(connection):
+            print("⚠️  Server has local_infile=OFF, falling back to multi-row INSERTs")
+            method = 'insert'
+        self.load_method = method
+        self.packet_bytes = max_allowed_packet(connection) if method == 'insert' else None
+        self.cursor = None
+
+    @property
+    def method(self):
+        return 'LOAD DATA' if self.load_method == 'infile' else 'multi-row INSERT'
+
+    @contextmanager
+    def session(self, table_name):
+        with bulk_load_session(self.connection) as cursor:
+            self.cursor = cursor
+            try:
+                yield
+            finally:
+                self.cursor = None
+
+    def serialize(self, chunk):
+        return column_names(chunk), tsv_fields(chunk)
+
+    def send(self, table_name, payload):
+        columns, fields = payload
+        if self.load_method == 'infile':
+            return load_data_infile(self.cursor, table_name, columns, fields)
+        return insert_multirow(self.cursor, table_name, columns, fields, self.packet_bytes)
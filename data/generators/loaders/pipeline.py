@@ -0,0 +1,203 @@
+"""
+Concurrent generate-and-load pipeline
+A producer thread runs the generators and pushes their chunks onto a bounded
+queue; PIPELINE_LOAD_WORKERS loaders, each on its own connection, drain it.
+When the queue is full the producer waits, so at most PIPELINE_QUEUE_CHUNKS
+chunks (plus one per worker) are in memory however large the scale factor.
+
+Tables are loaded in the order given, one at a time: a table's chunks are
+only sent once every row of the previous table is committed and its
+table_session() (index / foreign key rebuild) has finished, so children never
+arrive before their parents. Generating the next table overlaps that rebuild.
+
+    stages = [('digital_customer_profile', profile_batches()),
+              ('digital_session', session_batches())]
+    results = run_pipeline(stages, connect, lambda conn: PostgresCopyLoader(conn))
+"""
+
+import os
+import queue
+import threading
+import time
+
+from .base import iter_chunks, load_metrics, print_load_metrics
+
+# Loader connections draining the queue
+PIPELINE_LOAD_WORKERS = int(os.getenv('PIPELINE_LOAD_WORKERS', '3'))
+
+# Generated chunks waiting for a loader
+PIPELINE_QUEUE_CHUNKS = int(os.getenv('PIPELINE_QUEUE_CHUNKS', '4'))
+
+# Seconds between checks for a failed worker while blocked on the queue
+POLL_SECONDS = 0.5
+
+_DONE = object()
+
+class _Stage:
+    """Progress of one table through the pipeline"""
+
+    def __init__(self, table_name, data, checkpoint=None):
+        self.table_name = table_name
+        self.data = data
+        self.checkpoint = checkpoint
+        self.chunks_queued = 0
+        self.chunks_loaded = 0
+        self.generated = False
+        self.rows = 0
+        self.rows_loaded = 0
+        self.errors = []
+
+    @property
+    def finished(self):
+        return self.generated and self.chunks_loaded == self.chunks_queued
+
+class _Pipeline:
+
+    def __init__(self, stages, connect, make_loader, load_workers, queue_chunks, chunk_rows):
+        self.stages = [_Stage(*stage) for stage in stages]
+        self.connect = connect
+        self.make_loader = make_loader
+        self.load_workers = load_workers
+        self.chunk_rows = chunk_rows
+        self.chunks = queue.Queue(maxsize=queue_chunks)
+        self.changed = threading.Condition()
+        self.stopped = threading.Event()
+        self.failures = []
+        self.open_stage = -1
+
+    def open_loader(self):
+        """A new connection and the loader bound to it"""
+        connection = self.connect()
+        if connection is None:
+            raise ConnectionError("pipeline could not open a loader connection")
+        return connection, self.make_loader(connection)
+
+    def fail(self, error):
+        with self.changed:
+            self.failures.append(error)
+            self.stopped.set()
+            self.changed.notify_all()
+
+    def put(self, item):
+        """Queue an item, waiting for room; False once the pipeline has failed"""
+        while not self.stopped.is_set():
+            try:
+                self.chunks.put(item, timeout=POLL_SECONDS)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def get(self):
+        while not self.stopped.is_set():
+            try:
+                return self.chunks.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                pass
+        return _DONE
+
+    def stage_chunks(self, stage):
+        """(chunk, before_commit hook) pairs; checkpointed chunks are queued whole"""
+        if stage.checkpoint is None:
+            return ((chunk, None) for chunk in iter_chunks(stage.data, self.chunk_rows))
+        return ((chunk, stage.checkpoint.recorder(stage.table_name, chunk_index, seed))
+                for chunk_index, seed, chunk in stage.data)
+
+    def produce(self):
+        """Run the generators in stage order, chunking onto the queue"""
+        try:
+            for index, stage in enumerate(self.stages):
+                for chunk, before_commit in self.stage_chunks(stage):
+                    with self.changed:
+                        stage.chunks_queued += 1
+                    if not self.put((index, chunk, before_commit)):
+                        return
+                with self.changed:
+                    stage.generated = True
+                    self.changed.notify_all()
+            for _ in range(self.load_workers):
+                self.put(_DONE)
+        except Exception as e:
+            self.fail(e)
+
+    def consume(self):
+        """Load queued chunks on a connection of its own"""
+        connection = None
+        try:
+            connection, loader = self.open_loader()
+            while (item := self.get()) is not _DONE:
+                index, chunk, before_commit = item
+                stage = self.stages[index]
+                with self.changed:
+                    self.changed.wait_for(lambda: self.open_stage >= index or self.stopped.is_set())
+                if self.stopped.is_set():
+                    return
+                rows, loaded = loader.load_rows(stage.table_name, chunk, before_commit=before_commit)
+                with self.changed:
+                    stage.rows += rows
+                    stage.rows_loaded += loaded
+                    stage.errors.extend(loader.errors)
+                    stage.chunks_loaded += 1
+                    self.changed.notify_all()
+        except Exception as e:
+            self.fail(e)
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def run(self):
+        """Open each table in turn while the threads generate and load it"""
+        connection, loader = self.open_loader()
+        self.chunk_rows = self.chunk_rows or loader.chunk_rows
+        threads = [threading.Thread(target=self.produce, name='pipeline-producer', daemon=True)]
+        threads += [threading.Thread(target=self.consume, name=f'pipeline-loader-{i}', daemon=True)
+                    for i in range(self.load_workers)]
+        for thread in threads:
+            thread.start()
+
+        results = []
+        try:
+            for index, stage in enumerate(self.stages):
+                print(f"📥 Loading {stage.table_name} ({loader.dialect} {loader.method}, "
+                      f"{self.load_workers} connections)...")
+                start = time.perf_counter()
+                with loader.table_session(stage.table_name):
+                    with self.changed:
+                        self.open_stage = index
+                        self.changed.notify_all()
+                        self.changed.wait_for(lambda: stage.finished or self.stopped.is_set())
+                if self.stopped.is_set():
+                    break
+                result = load_metrics(loader, stage.table_name, stage.rows, stage.rows_loaded,
+                                      stage.errors, time.perf_counter() - start)
+                print_load_metrics(result)
+                results.append(result)
+        except Exception as e:
+            self.fail(e)
+        finally:
+            self.stopped.set()
+            with self.changed:
+                self.changed.notify_all()
+            for thread in threads:
+                thread.join()
+            connection.close()
+
+        if self.failures:
+            raise self.failures[0]
+        return results
+
+def run_pipeline(stages, connect, make_loader, load_workers=PIPELINE_LOAD_WORKERS,
+                 queue_chunks=PIPELINE_QUEUE_CHUNKS, chunk_rows=None):
+    """Generate and load tables concurrently; returns their load metrics in stage order
+
+    stages is an ordered list of (table_name, data) or (table_name, data,
+    checkpoint), data being anything BulkLoader.load() takes - a generator
+    of DataFrames keeps generation lazy, so it overlaps the loads and only
+    the queued chunks are held in memory. Checkpointed data yields
+    (chunk_index, seed, chunk) as for BulkLoader.load(checkpoint=...). Generators run in stage order on one thread and may use the
+    output of earlier stages. connect() opens a connection (None if it
+    cannot); make_loader(connection) returns a BulkLoader bound to it. One extra
+    connection runs each table's table_session(); chunk_rows defaults to
+    its loader's.
+    """
+    return _Pipeline(stages, connect, make_loader, load_workers, queue_chunks, chunk_rows).run()
@@ -0,0 +1,194 @@
+"""
+PostgreSQL COPY FROM STDIN loader
+Streams DataFrame chunks through an in-memory CSV buffer into COPY, and can
+drop the table's secondary indexes and foreign keys for the load and rebuild
+them afterwards - building an index once and validating a foreign key in one
+pass is much faster than maintaining them row by row.
+"""
+
+import io
+import os
+import re
+from contextlib import contextmanager, nullcontext
+
+from .base import BulkLoader, column_names
+
+# Rows serialized per COPY call
+COPY_CHUNK_ROWS = int(os.getenv('COPY_CHUNK_ROWS', '100000'))
+
+# Bytes psycopg2 sends per read from the buffer
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# NULL marker in the CSV stream; unlike '' it keeps empty strings distinct from NULL
+NULL_MARKER = r'\N'
+
+# Definitions of dropped indexes / foreign keys until they are restored, so a
+# killed load does not lose them (the next load of the table restores them)
+DROPPED_TABLE = 'load_dropped_definition'
+
+# ============================================
+# INDEXES AND FOREIGN KEYS
+# ============================================
+
+def drop_indexes(connection, table_name):
+    """Drop a table's secondary indexes; returns their CREATE INDEX statements
+
+    Indexes backing a PRIMARY KEY or UNIQUE constraint are kept: foreign keys
+    and ON CONFLICT depend on them.
+    """
+    cursor = connection.cursor()
+    cursor.execute("""
+        SELECT i.indexname, i.indexdef
+        FROM pg_indexes i
+        WHERE i.schemaname = current_schema()
+          AND i.tablename = %s
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c
+                          WHERE c.conname = i.indexname AND c.conrelid = %s::regclass)
+    """, (table_name, table_name))
+    indexes = cursor.fetchall()
+    for name, _ in indexes:
+        cursor.execute(f'DROP INDEX IF EXISTS "{name}"')
+    cursor.close()
+    return [definition for _, definition in indexes]
+
+def create_indexes(connection, definitions):
+    """Rebuild dropped indexes (idempotently)"""
+    cursor = connection.cursor()
+    for definition in definitions:
+        cursor.execute(re.sub(r'^CREATE (UNIQUE )?INDEX ', r'CREATE \1INDEX IF NOT EXISTS ', definition))
+    cursor.close()
+
+def drop_foreign_keys(connection, table_name):
+    """Drop a table's foreign keys; returns {constraint name: definition}"""
+    cursor = connection.cursor()
+    cursor.execute("""
+        SELECT conname, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE contype = 'f' AND conrelid = %s::regclass
+    """, (table_name,))
+    foreign_keys = dict(cursor.fetchall())
+    for name in foreign_keys:
+        cursor.execute(f'ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS "{name}"')
+    cursor.close()
+    return foreign_keys
+
+def add_foreign_keys(connection, table_name, foreign_keys):
+    """Re-add dropped foreign keys; each is validated in one pass over the table"""
+    cursor = connection.cursor()
+    cursor.execute("""
+        SELECT conname FROM pg_constraint WHERE contype = 'f' AND conrelid = %s::regclass
+    """, (table_name,))
+    existing = {name for name, in cursor.fetchall()}
+    for name, definition in foreign_keys.items():
+        if name not in existing:
+            cursor.execute(f'ALTER TABLE {table_name} ADD CONSTRAINT "{name}" {definition}')
+    cursor.close()
+
+def remember_dropped(connection, table_name, indexes, foreign_keys):
+    """Record dropped definitions (in the dropping transaction); returns any an interrupted load left"""
+    cursor = connection.cursor()
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {DROPPED_TABLE} (
+            table_name VARCHAR(128) NOT NULL,
+            name VARCHAR(128),
+            definition TEXT NOT NULL
+        )
+    """)
+    cursor.execute(f"SELECT name, definition FROM {DROPPED_TABLE} WHERE table_name = %s", (table_name,))
+    left = cursor.fetchall()
+    rows = [(table_name, None, definition) for definition in indexes]
+    rows += [(table_name, name, definition) for name, definition in foreign_keys.items()]
+    cursor.executemany(f"INSERT INTO {DROPPED_TABLE} (table_name, name, definition) VALUES (%s, %s, %s)", rows)
+    cursor.close()
+    return ([definition for name, definition in left if name is None],
+            {name: definition for name, definition in left if name is not None})
+
+def forget_dropped(connection, table_name):
+    cursor = connection.cursor()
+    cursor.execute(f"DELETE FROM {DROPPED_TABLE} WHERE table_name = %s", (table_name,))
+    cursor.close()
+
+@contextmanager
+def indexes_dropped(connection, table_name):
+    """Drop secondary indexes and foreign keys for a load, restoring them even if it fails
+
+    A load that breaks a foreign key fails when the key is re-added. If the
+    process dies before the restore, the next load of the table restores them.
+    """
+    indexes = drop_indexes(connection, table_name)
+    foreign_keys = drop_foreign_keys(connection, table_name)
+    left_indexes, left_foreign_keys = remember_dropped(connection, table_name, indexes, foreign_keys)
+    indexes += left_indexes
+    foreign_keys.update(left_foreign_keys)
+    # Committed so that loads on other connections are not blocked by the drop's table lock
+    connection.commit()
+    try:
+        yield
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        create_indexes(connection, indexes)
+        add_foreign_keys(connection, table_name, foreign_keys)
+        forget_dropped(connection, table_name)
+        cursor = connection.cursor()
+        cursor.execute(f"ANALYZE {table_name}")
+        cursor.close()
+        connection.commit()
+
+# ============================================
+# COPY
+# ============================================
+
+def copy_ready(df):
+    """Integer columns that pandas turned into floats because of NULLs go back to integers"""
+    df = df.copy(deep=False)
+    for column in df.columns:
+        values = df[column]
+        if values.dtype.kind == 'f':
+            present = values.dropna()
+            if len(present) and (present % 1 == 0).all():
+                df[column] = values.astype('Int64')
+    return df
+
+def to_copy_buffer(chunk):
+    """Serialize a DataFrame chunk as a COPY-ready CSV buffer"""
+    buffer = io.StringIO()
+    copy_ready(chunk).to_csv(buffer, index=False, header=False, na_rep=NULL_MARKER)
+    buffer.seek(0)
+    return column_names(chunk), buffer
+
+def copy_buffer(cursor, table_name, columns, buffer):
+    """COPY one serialized chunk"""
+    target = f"{table_name} ({', '.join(columns)})" if columns else table_name
+    cursor.copy_expert(f"COPY {target} FROM STDIN WITH (FORMAT csv, NULL '{NULL_MARKER}')",
+                       buffer, size=COPY_BUFFER_SIZE)
+
+class PostgresCopyLoader(BulkLoader):
+    """COPY FROM STDIN; rebuild_indexes drops secondary indexes and foreign keys for the load"""
+
+    dialect = 'postgres'
+    chunk_rows = COPY_CHUNK_ROWS
+
+    def __init__(self, connection, chunk_rows=None, commit_rows=0, rebuild_indexes=True):
+        super().__init__(connection, chunk_rows, commit_rows)
+        self.rebuild_indexes = rebuild_indexes
+
+    @property
+    def method(self):
+        return 'COPY, indexes rebuilt' if self.rebuild_indexes else 'COPY'
+
+    def table_session(self, table_name):
+        return indexes_dropped(self.connection, table_name) if self.rebuild_indexes else nullcontext()
+
+    def serialize(self, chunk):
+        return to_copy_buffer(chunk)
+
+    def send(self, table_name, payload):
+        columns, buffer = payload
+        cursor = self.connection.cursor()
+        try:
+            copy_buffer(cursor, table_name, columns, buffer)
+            return cursor.rowcount
+        finally:
+            cursor.close()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Rolling output writer for generated datasets
+Appends DataFrame chunks to size-capped files so generation memory stays flat
+
+Supported formats: csv, csv.gz, csv.zst and parquet. Parquet files are typed
+from the Snowflake DDL in snowflake/02_direct_load/02_create_tables.sql
+(TIMESTAMP, DATE, BOOLEAN, INTEGER, DECIMAL(p,s), VARCHAR) so COPY loads them
+by column name without any text parsing. csv.zst and parquet need pyarrow.
+"""
+
+import gzip
+import os
+import re
+
+# Output format -> file extension
+FORMAT_EXTENSIONS = {
+    'csv': '.csv',
+    'csv.gz': '.csv.gz',
+    'csv.zst': '.csv.zst',
+    'parquet': '.parquet',
+}
+
+# <table>[_<shard:05d>][_<part:05d>].<ext>
+OUTPUT_FILE = re.compile(r'^(?P<table>.+?)(_\d{5})*(?P<ext>\.csv|\.csv\.gz|\.csv\.zst|\.parquet)$')
+
+# DDL the Parquet schemas are derived from
+TABLE_DDL = os.getenv('TABLE_DDL', os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..',
+    'snowflake', '02_direct_load', '02_create_tables.sql'))
+
+def table_for_file(filename):
+    """t24_customer_00003_00001.parquet -> t24_customer.csv (None if not an output file)"""
+    match = OUTPUT_FILE.match(filename)
+    return f"{match.group('table')}.csv" if match else None
+
+def clear_outputs(output_dir):
+    """Delete every table output (any shard, part or format) left in output_dir by earlier runs"""
+    removed = [f for f in os.listdir(output_dir) if table_for_file(f)]
+    for filename in removed:
+        os.remove(os.path.join(output_dir, filename))
+    return removed
+
+def format_for_file(filename):
+    """t24_customer_00003.csv.gz -> csv.gz"""
+    ext = OUTPUT_FILE.match(filename).group('ext')
+    return next(fmt for fmt, e in FORMAT_EXTENSIONS.items() if e == ext)
+
+# ============================================
+# PARQUET SCHEMAS
+# ============================================
+
+_table_schemas = None
+
+def load_table_schemas(ddl_path=TABLE_DDL):
+    """Parse CREATE TABLE statements into {table.csv: [(column, snowflake_type), ...]}"""
+    schemas = {}
+    with open(ddl_path) as f:
+        ddl = f.read()
+    for table in re.finditer(r'CREATE OR REPLACE TABLE (\w+) \((.*?)\n\);', ddl, re.S):
+        columns = []
+        for line in table.group(2).splitlines():
+            column = re.match(r'\s*(\w+)\s+([A-Z_]+(?:\(\d+(?:,\s*\d+)?\))?)', line)
+            if column and column.group(1) not in ('PRIMARY', 'FOREIGN', 'CONSTRAINT', 'UNIQUE'):
+                columns.append((column.group(1), column.group(2)))
+        schemas[f'{table.group(1).lower()}.csv'] = columns
+    return schemas
+
+def arrow_type(snowflake_type):
+    """Map a Snowflake column type to the matching Arrow type"""
+    import pyarrow as pa
+
+    decimal = re.match(r'(?:DECIMAL|NUMBER|NUMERIC)\((\d+),\s*(\d+)\)', snowflake_type)
+    if decimal:
+        return pa.decimal128(int(decimal.group(1)), int(decimal.group(2)))
+    base = snowflake_type.split('(')[0]
+    if base in ('INTEGER', 'INT', 'BIGINT', 'NUMBER'):
+        return pa.int64()
+    if base in ('FLOAT', 'DOUBLE', 'REAL'):
+        return pa.float64()
+    if base == 'BOOLEAN':
+        return pa.bool_()
+    if base == 'DATE':
+        return pa.date32()
+    if base.startswith('TIMESTAMP'):
+        return pa.timestamp('us')
+    return pa.string()
+
+def arrow_schema(filename, df):
+    """Typed Arrow schema for a table, falling back to inference for tables not in the DDL"""
+    import pyarrow as pa
+
+    global _table_schemas
+    if _table_schemas is None:
+        _table_schemas = load_table_schemas()
+    columns = _table_schemas.get(filename)
+    if not columns:
+        return pa.Schema.from_pandas(df, preserve_index=False)
+    return pa.schema([(name, arrow_type(sf_type)) for name, sf_type in columns])
+
+def to_arrow(df, schema):
+    """Convert a DataFrame chunk to an Arrow table with exactly the given column types"""
+    import pandas as pd
+    import pyarrow as pa
+
+    arrays = []
+    for field in schema:
+        column = df[field.name]
+        if pa.types.is_timestamp(field.type) or pa.types.is_date(field.type):
+            column = pd.to_datetime(column)
+        elif pa.types.is_decimal(field.type):
+            # Via float64: an int64 source would need precision 19 + scale
+            column = pd.to_numeric(column).astype('float64')
+        array = pa.array(column, from_pandas=True)
+        arrays.append(array.cast(field.type, safe=not pa.types.is_decimal(field.type)))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+# ============================================
+# ROLLING WRITER
+# ============================================
+
+class RollingWriter:
+    """Append DataFrame chunks to <table>.<ext>, rolling to <table>_<part:05d>.<ext> files
+
+    The first file keeps the plain table name; once it reaches rows_per_file the
+    writer renames it to part 00000 and continues in 00001, 00002, ... so small
+    tables stay a single file and large ones come out pre-split for COPY.
+    """
+
+    def __init__(self, output_dir, filename, rows_per_file=0, output_format='csv'):
+        if output_format not in FORMAT_EXTENSIONS:
+            raise ValueError(f"Unknown output format '{output_format}' "
+                             f"(expected one of {', '.join(FORMAT_EXTENSIONS)})")
+        self.output_dir = output_dir
+        self.table = filename
+        self.rows_per_file = rows_per_file
+        self.output_format = output_format
+        self.stem = os.path.splitext(filename)[0]
+        self.ext = FORMAT_EXTENSIONS[output_format]
+        self.filename = self.stem + self.ext
+        self.files = {}  # filename -> rows written
+        self.part = 0
+        self.current = None
+        self.current_rows = 0
+        self.sink = None
+        self.header_written = False
+        self.schema = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _part_name(self, part):
+        return f'{self.stem}_{part:05d}{self.ext}'
+
+    def _open_sink(self, path, df):
+        if self.output_format == 'parquet':
+            import pyarrow.parquet as pq
+            if self.schema is None:
+                self.schema = arrow_schema(self.table, df)
+            return pq.ParquetWriter(path, self.schema, compression='snappy')
+        if self.output_format == 'csv.zst':
+            import pyarrow as pa
+            return pa.CompressedOutputStream(path, 'zstd')
+        if self.output_format == 'csv.gz':
+            return gzip.open(path, 'wb')
+        return open(path, 'wb')
+
+    def _close_sink(self):
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+
+    def _open(self, df):
+        """Start a new output file"""
+        self._close_sink()
+        if self.part == 0:
+            self.current = self.filename
+        else:
+            if self.part == 1:
+                # The table no longer fits one file: the first file becomes part 00000
+                first = self._part_name(0)
+                os.replace(os.path.join(self.output_dir, self.filename),
+                           os.path.join(self.output_dir, first))
+                self.files[first] = self.files.pop(self.filename)
+            self.current = self._part_name(self.part)
+        self.sink = self._open_sink(os.path.join(self.output_dir, self.current), df)
+        self.files[self.current] = 0
+        self.current_rows = 0
+        self.header_written = False
+        self.part += 1
+
+    def _append(self, df):
+        if self.output_format == 'parquet':
+            # One row group per chunk
+            self.sink.write_table(to_arrow(df, self.schema))
+        else:
+            self.sink.write(df.to_csv(index=False, header=not self.header_written).encode('utf-8'))
+            self.header_written = True
+        self.current_rows += len(df)
+        self.files[self.current] += len(df)
+
+    def write(self, df):
+        """Append a chunk, splitting it across file boundaries when needed"""
+        if self.current is None:
+            self._open(df)
+        start = 0
+        while True:
+            if self.rows_per_file and self.current_rows >= self.rows_per_file:
+                self._open(df)
+            take = len(df) - start
+            if self.rows_per_file:
+                take = min(take, self.rows_per_file - self.current_rows)
+            self._append(df.iloc[start:start + take])
+            start += take
+            if start >= len(df):
+                return self
+
+    def close(self):
+        """Finish writing and return {filename: rows} for every file produced"""
+        self._close_sink()
+        return self.files
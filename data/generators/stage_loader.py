@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Pipelined Snowflake stage loader
+PUTs files over a thread pool and starts each table's COPY INTO as soon as
+all of its files have landed, running independent COPYs concurrently.
+
+Works with any DB-API style connection (conn.cursor(), cursor.execute(),
+cursor.fetchall(), cursor.description), so it can be driven by the real
+Snowflake connector or by a fake one - see benchmark_stage_loader.py.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from tqdm import tqdm
+
+from output_writer import format_for_file, table_for_file
+
+# COPY options per generator output format. Compressed files are PUT as-is
+# (AUTO_COMPRESS=FALSE); Parquet is typed, so columns load by name with no text parsing.
+CSV_FILE_FORMAT = """
+            TYPE = 'CSV'
+            COMPRESSION = '{compression}'
+            FIELD_DELIMITER = ','
+            SKIP_HEADER = 1
+            FIELD_OPTIONALLY_ENCLOSED_BY = '"'
+            NULL_IF = ('NULL', 'null', '')
+            EMPTY_FIELD_AS_NULL = TRUE
+            DATE_FORMAT = 'AUTO'
+            TIMESTAMP_FORMAT = 'AUTO'"""
+
+COPY_OPTIONS = {
+    'csv': f"FILE_FORMAT = ({CSV_FILE_FORMAT.format(compression='NONE')}\n        )",
+    'csv.gz': f"FILE_FORMAT = ({CSV_FILE_FORMAT.format(compression='GZIP')}\n        )",
+    'csv.zst': f"FILE_FORMAT = ({CSV_FILE_FORMAT.format(compression='ZSTD')}\n        )",
+    'parquet': "FILE_FORMAT = (TYPE = 'PARQUET' USE_LOGICAL_TYPE = TRUE)\n"
+               "        MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE",
+}
+
+# PATTERN loads can mix plain and compressed parts of a table (see file_splitter.py)
+PATTERN_COPY_OPTIONS = f"FILE_FORMAT = ({CSV_FILE_FORMAT.format(compression='AUTO')}\n        )"
+
+MB = 1024 * 1024
+
+# ============================================
+# STATEMENTS
+# ============================================
+
+def put_sql(path, stage, put_parallel):
+    """PUT statement for one local file"""
+    return (f"PUT file://{os.path.abspath(path)} @{stage} "
+            f"AUTO_COMPRESS=FALSE OVERWRITE=TRUE PARALLEL={put_parallel}")
+
+def copy_sql(stage, filenames, schema, table, pattern=None):
+    """COPY INTO statement for all the files of one table, listed or matched by PATTERN"""
+    if pattern:
+        source = f"PATTERN = '{pattern}'"
+        options = PATTERN_COPY_OPTIONS
+    else:
+        file_list = ', '.join(f"'{f}'" for f in filenames)
+        source = f"FILES = ({file_list})"
+        options = COPY_OPTIONS[format_for_file(filenames[0])]
+    return f"""
+        COPY INTO {schema}.{table}
+        FROM @{stage}
+        {source}
+        {options}
+        ON_ERROR = 'CONTINUE'
+        """
+
+def remove_sql(stage, pattern):
+    """REMOVE every staged file matching a PATTERN"""
+    return f"REMOVE @{stage} PATTERN = '{pattern}'"
+
+# Per-file columns kept from a COPY INTO result
+COPY_RESULT_COLUMNS = ('file', 'status', 'rows_parsed', 'rows_loaded', 'errors_seen',
+                       'first_error', 'first_error_line', 'first_error_column_name')
+
+def copy_file_results(cursor, result):
+    """Per-file dicts from a COPY INTO result (empty when no file was processed)"""
+    columns = [col[0].lower() for col in (cursor.description or [])]
+    if 'rows_loaded' not in columns:
+        return []  # e.g. "Copy executed with 0 files processed."
+    files = []
+    for row in result:
+        values = dict(zip(columns, row))
+        entry = {column: values.get(column) for column in COPY_RESULT_COLUMNS}
+        for column in ('rows_parsed', 'rows_loaded', 'errors_seen'):
+            entry[column] = int(entry[column] or 0)
+        files.append(entry)
+    return files
+
+# ============================================
+# PIPELINE STEPS
+# ============================================
+
+def put_file(conn, path, stage, put_parallel):
+    """PUT one file; returns a per-file result dict"""
+    filename = os.path.basename(path)
+    size = os.path.getsize(path)
+    start = time.perf_counter()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(put_sql(path, stage, put_parallel))
+        error = None
+    except Exception as e:
+        error = str(e)
+    finally:
+        cursor.close()
+    return {'file': filename, 'bytes': size,
+            'seconds': time.perf_counter() - start, 'error': error}
+
+def copy_table(conn, stage, filenames, schema, table, truncate=True, pattern=None):
+    """TRUNCATE + COPY INTO one table from its staged files; returns a per-table result dict"""
+    start = time.perf_counter()
+    cursor = conn.cursor()
+    try:
+        # Fully qualified names: COPYs share the session, so no USE SCHEMA
+        if truncate:
+            cursor.execute(f"TRUNCATE TABLE {schema}.{table}")
+        cursor.execute(copy_sql(stage, filenames, schema, table, pattern))
+        copied = copy_file_results(cursor, cursor.fetchall())
+        error = None
+    except Exception as e:
+        copied, error = [], str(e)
+    finally:
+        cursor.close()
+    # rows is what COPY loaded; rows_parsed - rows is what ON_ERROR = 'CONTINUE' dropped
+    return {'schema': schema, 'table': table, 'files': len(filenames),
+            'rows': sum(f['rows_loaded'] for f in copied) if not error else None,
+            'rows_parsed': sum(f['rows_parsed'] for f in copied),
+            'errors_seen': sum(f['errors_seen'] for f in copied),
+            'copy_results': copied, 'truncated': truncate,
+            'seconds': time.perf_counter() - start, 'error': error}
+
+def default_copy_plan(csv_dir, filenames):
+    """Upload every file, then TRUNCATE + COPY each table from all of its files"""
+    plan = {}
+    for filename in sorted(filenames):
+        entry = plan.setdefault(table_for_file(filename), {'upload': [], 'copy': [], 'truncate': True})
+        entry['upload'].append(os.path.join(csv_dir, filename))
+        entry['copy'].append(filename)
+    return plan
+
+def load_pipelined(conn, csv_dir, filenames, table_mappings, stage,
+                   upload_workers=4, copy_workers=4, put_parallel=4, copy_plan=None):
+    """Upload files in parallel and COPY each table as soon as its last file lands
+
+    table_mappings maps a logical table file (t24_customer.csv) to (schema, table).
+    copy_plan maps a table key to {'upload': [paths], 'copy': [staged names],
+    'truncate': bool} (see upload_manifest.plan_tables); by default every file
+    is uploaded and every table reloaded. Entries with a 'pattern' (see
+    file_splitter.split_plan) have their old staged files removed before the
+    upload and are COPYed by PATTERN.
+    Returns (file_results, table_results, wall_seconds).
+    """
+    if copy_plan is None:
+        copy_plan = default_copy_plan(csv_dir, filenames)
+    copy_plan = {key: p for key, p in copy_plan.items() if p['copy']}
+    pending = {key: len(p['upload']) for key, p in copy_plan.items()}
+    failed = set()
+
+    file_results, table_results = [], []
+    start = time.perf_counter()
+
+    # Clear out stale parts before re-staging tables that load by PATTERN
+    cursor = conn.cursor()
+    for key, plan in copy_plan.items():
+        if plan.get('pattern'):
+            cursor.execute(remove_sql(stage, plan['pattern']))
+    cursor.close()
+
+    with ThreadPoolExecutor(max_workers=upload_workers) as uploads, \
+         ThreadPoolExecutor(max_workers=copy_workers) as copies:
+        copy_futures = []
+        def submit_copy(key):
+            schema, table = table_mappings[key]
+            plan = copy_plan[key]
+            copy_futures.append(copies.submit(copy_table, conn, stage, plan['copy'], schema, table,
+                                              plan['truncate'], plan.get('pattern')))
+
+        # Tables whose files are all staged already can COPY straight away
+        for key in [key for key, count in pending.items() if count == 0]:
+            submit_copy(key)
+
+        # Largest files first so the long uploads do not trail at the end
+        ordered = sorted(((path, key) for key, p in copy_plan.items() for path in p['upload']),
+                         key=lambda item: -os.path.getsize(item[0]))
+        put_futures = {uploads.submit(put_file, conn, path, stage, put_parallel): key
+                       for path, key in ordered}
+
+        for future in tqdm(as_completed(put_futures), total=len(put_futures), desc="Uploading"):
+            result = future.result()
+            key = result['table'] = put_futures[future]
+            file_results.append(result)
+            if result['error']:
+                tqdm.write(f"✗ Failed to upload {result['file']}: {result['error']}")
+                failed.add(key)
+            pending[key] -= 1
+            if pending[key] == 0:
+                if key in failed:
+                    tqdm.write(f"⚠️  Skipping COPY for {key} (upload failed)")
+                    continue
+                submit_copy(key)
+
+        for future in as_completed(copy_futures):
+            result = future.result()
+            table_results.append(result)
+            if result['error']:
+                print(f"✗ Failed to copy into {result['schema']}.{result['table']}: {result['error']}")
+            else:
+                action = 'reloaded' if result['truncated'] else 'appended'
+                rejected = result['rows_parsed'] - (result['rows'] or 0)
+                print(f"✓ {result['schema']}.{result['table']}: {result['rows'] or 0:,} rows {action} "
+                      f"from {result['files']} file(s) in {result['seconds']:.1f}s"
+                      + (f" ({rejected:,} rows rejected)" if rejected > 0 else ""))
+
+    return file_results, table_results, time.perf_counter() - start
+
+def print_throughput_report(file_results, table_results, wall_seconds):
+    """Per-file and per-table throughput for a pipelined load"""
+    print("\n⏱️  Upload throughput (per file):")
+    for r in sorted(file_results, key=lambda r: r['file']):
+        rate = r['bytes'] / MB / r['seconds'] if r['seconds'] else 0
+        status = 'FAILED' if r['error'] else f"{rate:8.1f} MB/s"
+        print(f"   • {r['file']:<45} {r['bytes'] / MB:>9.1f} MB {r['seconds']:>7.2f}s {status}")
+
+    print("\n⏱️  COPY throughput (per table):")
+    for r in sorted(table_results, key=lambda r: (r['schema'], r['table'])):
+        rows = r['rows'] or 0
+        rate = rows / r['seconds'] if r['seconds'] else 0
+        status = 'FAILED' if r['error'] else f"{rate:>12,.0f} rows/s"
+        print(f"   • {r['schema'] + '.' + r['table']:<45} {rows:>10,} rows {r['seconds']:>7.2f}s {status}")
+
+    total_bytes = sum(r['bytes'] for r in file_results)
+    total_rows = sum(r['rows'] or 0 for r in table_results)
+    wall_seconds = max(wall_seconds, 1e-9)
+    print(f"\n   Wall time: {wall_seconds:.1f}s  |  {total_bytes / MB / wall_seconds:.1f} MB/s  |  "
+          f"{total_rows / wall_seconds:,.0f} rows/s")
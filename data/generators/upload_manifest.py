@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Content-hash manifest for incremental uploads
+Records every uploaded file (size, mtime, SHA-256, row count, target table)
+so re-runs only PUT and COPY the files that actually changed.
+
+Each entry also keeps staged_sha256: the SHA-256 of the copy staged under
+the file's own name (None if it is not staged under it, e.g. split into
+parts). It differs from sha256 after an append, which stages only the new
+rows, so a later reload knows to PUT the whole file again.
+
+A table is planned as one of:
+    skip    - every file matches the manifest
+    reload  - something changed: PUT every file whose staged copy is not
+              the local one, TRUNCATE + COPY all files
+    append  - (optional) the only change is new rows at the end of a CSV, or
+              new part files next to unchanged ones: PUT just the new data and
+              COPY it without truncating
+"""
+
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+
+from output_writer import format_for_file, table_for_file
+
+MANIFEST_NAME = '.upload_manifest.json'
+HASH_BLOCK_SIZE = 8 * 1024 * 1024
+
+# ============================================
+# FINGERPRINTS
+# ============================================
+
+def sha256_file(path, limit=None):
+    """SHA-256 of a file, or of its first `limit` bytes"""
+    digest = hashlib.sha256()
+    remaining = limit
+    with open(path, 'rb') as f:
+        while remaining is None or remaining > 0:
+            block = f.read(HASH_BLOCK_SIZE if remaining is None else min(HASH_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            digest.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    return digest.hexdigest()
+
+def count_rows(path):
+    """Data rows in a generated file (CSV rows are parsed, so quoted newlines count once)"""
+    fmt = format_for_file(os.path.basename(path))
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).metadata.num_rows
+    if fmt == 'csv.zst':
+        import pyarrow as pa
+        stream = io.TextIOWrapper(pa.CompressedInputStream(pa.OSFile(path), 'zstd'), newline='')
+    elif fmt == 'csv.gz':
+        stream = gzip.open(path, 'rt', newline='')
+    else:
+        stream = open(path, newline='')
+    with stream:
+        return max(sum(1 for _ in csv.reader(stream)) - 1, 0)
+
+def fingerprint(path, previous=None):
+    """Manifest entry for a file; reuses the previous hash when size and mtime are unchanged"""
+    stat = os.stat(path)
+    entry = {'size': stat.st_size, 'mtime': stat.st_mtime}
+    if previous and previous['size'] == entry['size'] and previous['mtime'] == entry['mtime']:
+        entry['sha256'], entry['rows'] = previous['sha256'], previous['rows']
+    else:
+        entry['sha256'] = sha256_file(path)
+        if previous and previous['sha256'] == entry['sha256']:
+            entry['rows'] = previous['rows']  # touched, not changed
+        else:
+            entry['rows'] = count_rows(path)
+    return entry
+
+# ============================================
+# MANIFEST
+# ============================================
+
+def load_manifest(path):
+    """{filename: entry} from disk, empty if there is no manifest yet"""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def save_manifest(path, manifest):
+    """Write the manifest atomically"""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def _write_csv_delta(path, old_size, delta_dir):
+    """Header + the bytes appended after old_size, as a standalone CSV for COPY"""
+    with open(path, 'rb') as f:
+        header = f.readline()
+        f.seek(old_size)
+        tail = f.read()
+    delta_name = f"{os.path.basename(path)[:-len('.csv')]}.append-{hashlib.sha256(tail).hexdigest()[:8]}.csv"
+    delta_path = os.path.join(delta_dir, delta_name)
+    with open(delta_path, 'wb') as f:
+        f.write(header)
+        f.write(tail)
+    return delta_path
+
+def _staged_sha256(previous, stage):
+    """SHA-256 of the copy of a file staged under its own name, None if there is none"""
+    if not previous or previous.get('stage') != stage:
+        return None
+    # Manifests from before staged_sha256 staged whole files only
+    return previous.get('staged_sha256', previous['sha256'])
+
+def plan_tables(csv_dir, filenames, manifest, table_mappings, stage, append=False, delta_dir=None):
+    """Compare files on disk with the manifest and decide what to do per table
+
+    Returns (entries, plan): entries are the new manifest entries per file, and
+    plan maps each table key to {'action', 'upload': [paths], 'copy': [staged names],
+    'truncate': bool}.
+    """
+    entries, by_table = {}, {}
+    for filename in sorted(filenames):
+        key = table_for_file(filename)
+        previous = manifest.get(filename)
+        entry = fingerprint(os.path.join(csv_dir, filename), previous)
+        entry['table'] = '.'.join(table_mappings[key])
+        entry['stage'] = stage
+        entry['staged_sha256'] = _staged_sha256(previous, stage)
+        entries[filename] = entry
+        by_table.setdefault(key, []).append(filename)
+
+    plan = {}
+    for key, files in by_table.items():
+        target = '.'.join(table_mappings[key])
+        previous_files = {f for f, e in manifest.items()
+                          if e.get('table') == target and e.get('stage') == stage}
+        changed = [f for f in files
+                   if f not in manifest or manifest[f]['sha256'] != entries[f]['sha256']
+                   or manifest[f].get('table') != target or manifest[f].get('stage') != stage]
+        removed = previous_files - set(files)
+
+        if not changed and not removed:
+            plan[key] = {'action': 'skip', 'upload': [], 'copy': [], 'truncate': False}
+            continue
+
+        if append and not removed and previous_files:
+            new_files = [f for f in changed if f not in previous_files]
+            grown = [f for f in changed if f in previous_files]
+            deltas = []
+            for f in grown:
+                old = manifest[f]
+                path = os.path.join(csv_dir, f)
+                if (format_for_file(f) == 'csv' and entries[f]['size'] > old['size']
+                        and sha256_file(path, old['size']) == old['sha256']):
+                    deltas.append(_write_csv_delta(path, old['size'], delta_dir))
+                else:
+                    break
+            else:
+                # Grown files keep their old staged copy: only the delta is PUT
+                for f in new_files:
+                    entries[f]['staged_sha256'] = entries[f]['sha256']
+                uploads = [os.path.join(csv_dir, f) for f in new_files] + deltas
+                plan[key] = {'action': 'append', 'upload': uploads,
+                             'copy': [os.path.basename(p) for p in uploads], 'truncate': False}
+                continue
+
+        # COPY reads every file from the stage, so PUT any whose staged copy is stale
+        stale = [f for f in files if entries[f]['staged_sha256'] != entries[f]['sha256']]
+        for f in stale:
+            entries[f]['staged_sha256'] = entries[f]['sha256']
+        plan[key] = {'action': 'reload', 'upload': [os.path.join(csv_dir, f) for f in stale],
+                     'copy': files, 'truncate': True}
+    return entries, plan
+
+def record_loaded(manifest, entries, plan, loaded_tables):
+    """Update the manifest for the tables whose COPY succeeded"""
+    for key in loaded_tables:
+        target = None
+        for filename, entry in entries.items():
+            if table_for_file(filename) == key:
+                manifest[filename] = entry
+                target = entry['table']
+        # Files that no longer exist for a reloaded table drop out of the manifest
+        if plan[key]['truncate']:
+            current = {f for f in entries if table_for_file(f) == key}
+            for filename in [f for f, e in manifest.items() if e.get('table') == target and f not in current]:
+                del manifest[filename]
+    return manifest
@@ -2,13 +2,25 @@
 """
 Upload all generated CSV files to Snowflake
 Uses Snowflake connector to PUT files to stage and COPY INTO tables
+Accepts every generator output format: csv, csv.gz, csv.zst and parquet
+Uploads run in parallel and each table's COPY starts as soon as its files land
+Re-runs only upload and reload tables whose files changed (see upload_manifest.py)
+Large CSVs are split into compressed parts and COPYed by PATTERN (see file_splitter.py)
+Writes a JSON load report from the COPY results (see load_report.py)
 """
 
 import snowflake.connector
 import os
 from pathlib import Path
-from tqdm import tqdm
+import shutil
 import sys
+import tempfile
+
+from file_splitter import SPLIT_TARGET_MB, split_plan
+from load_report import build_load_report, fetch_row_counts, print_load_report, save_load_report
+from output_writer import table_for_file
+from stage_loader import load_pipelined, print_throughput_report
+from upload_manifest import MANIFEST_NAME, load_manifest, plan_tables, record_loaded, save_manifest
 
 # Configuration
 CSV_DIR = 'data/generated_csv'
@@ -20,6 +32,20 @@ SNOWFLAKE_WAREHOUSE = 'COMPUTE_WH'
 SNOWFLAKE_STAGE = 'CSV_DATA_STAGE'
 SNOWFLAKE_ROLE = 'ACCOUNTADMIN'
 
+# Pipelined load: concurrent PUTs, concurrent COPYs, and PUT's own PARALLEL threads per file
+UPLOAD_WORKERS = int(os.getenv('UPLOAD_WORKERS', '4'))
+COPY_WORKERS = int(os.getenv('COPY_WORKERS', '4'))
+PUT_PARALLEL = int(os.getenv('PUT_PARALLEL', '4'))
+
+# Incremental uploads: manifest of loaded files, FORCE_RELOAD=true to ignore it,
+# APPEND_SUPERSETS=true to load grown CSVs / new part files without truncating
+MANIFEST_PATH = os.getenv('UPLOAD_MANIFEST', os.path.join(CSV_DIR, MANIFEST_NAME))
+FORCE_RELOAD = os.getenv('FORCE_RELOAD', 'false').lower() == 'true'
+APPEND_SUPERSETS = os.getenv('APPEND_SUPERSETS', 'false').lower() == 'true'
+
+# JSON load report (rows parsed/loaded/dropped per table and file) for monitoring
+LOAD_REPORT_PATH = os.getenv('LOAD_REPORT', os.path.join(CSV_DIR, 'load_report.json'))
+
 # Table mapping: CSV filename -> (schema, table_name)
 TABLE_MAPPINGS = {
     # Digital Banking
@@ -86,83 +112,6 @@ def connect_to_snowflake():
             print(f"✗ Alternative connection also failed: {e2}")
             sys.exit(1)
 
-def upload_csv_to_stage(conn, csv_file_path, csv_filename):
-    """Upload a CSV file to Snowflake internal stage"""
-    cursor = conn.cursor()
-    try:
-        # Use absolute path for PUT command
-        abs_path = os.path.abspath(csv_file_path)
-        
-        # PUT command to upload file to stage
-        put_sql = f"PUT file://{abs_path} @{SNOWFLAKE_STAGE} AUTO_COMPRESS=FALSE OVERWRITE=TRUE"
-        cursor.execute(put_sql)
-        
-        return True
-    except Exception as e:
-        print(f"✗ Failed to upload {csv_filename}: {e}")
-        return False
-    finally:
-        cursor.close()
-
-def copy_into_table(conn, csv_filename, schema, table_name):
-    """Copy data from stage into Snowflake table"""
-    cursor = conn.cursor()
-    try:
-        # Set schema
-        cursor.execute(f"USE SCHEMA {schema}")
-        
-        # Truncate table first
-        cursor.execute(f"TRUNCATE TABLE {table_name}")
-        
-        # COPY INTO command
-        copy_sql = f"""
-        COPY INTO {table_name}
-        FROM @{SNOWFLAKE_STAGE}/{csv_filename}
-        FILE_FORMAT = (
-            TYPE = 'CSV'
-            FIELD_DELIMITER = ','
-            SKIP_HEADER = 1
-            FIELD_OPTIONALLY_ENCLOSED_BY = '"'
-            NULL_IF = ('NULL', 'null', '')
-            EMPTY_FIELD_AS_NULL = TRUE
-            DATE_FORMAT = 'AUTO'
-            TIMESTAMP_FORMAT = 'AUTO'
-        )
-        ON_ERROR = 'CONTINUE'
-        """
-        
-        cursor.execute(copy_sql)
-        result = cursor.fetchall()
-        
-        # Get row count
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        row_count = cursor.fetchone()[0]
-        
-        return row_count
-    except Exception as e:
-        print(f"✗ Failed to copy into {schema}.{table_name}: {e}")
-        return None
-    finally:
-        cursor.close()
-
-def validate_data(conn):
-    """Validate all tables have data"""
-    print("\n🔍 Validating data load...")
-    cursor = conn.cursor()
-    
-    results = []
-    for csv_file, (schema, table) in TABLE_MAPPINGS.items():
-        try:
-            cursor.execute(f"USE SCHEMA {schema}")
-            cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            count = cursor.fetchone()[0]
-            results.append((schema, table, count))
-        except Exception as e:
-            results.append((schema, table, f"ERROR: {e}"))
-    
-    cursor.close()
-    return results
-
 def main():
     """Main execution"""
     print("=" * 80)
@@ -176,60 +125,95 @@ def main():
         sys.exit(1)
     
     # Get list of CSV files
-    csv_files = [f for f in os.listdir(CSV_DIR) if f.endswith('.csv')]
+    csv_files = [f for f in os.listdir(CSV_DIR) if table_for_file(f)]
     if not csv_files:
         print(f"✗ No CSV files found in {CSV_DIR}")
         sys.exit(1)
     
-    print(f"\n📁 Found {len(csv_files)} CSV files to upload")
-    
-    # Connect to Snowflake
-    conn = connect_to_snowflake()
-    
-    # Upload and load each file
-    print("\n📤 Uploading CSV files to Snowflake stage...")
-    upload_results = []
+    print(f"\n📁 Found {len(csv_files)} CSV files to upload "
+          f"({len({table_for_file(f) for f in csv_files})} tables)")
     
-    for csv_file in tqdm(sorted(csv_files), desc="Uploading"):
-        if csv_file in TABLE_MAPPINGS:
-            csv_path = os.path.join(CSV_DIR, csv_file)
-            success = upload_csv_to_stage(conn, csv_path, csv_file)
-            upload_results.append((csv_file, success))
-        else:
+    for csv_file in sorted(csv_files):
+        if table_for_file(csv_file) not in TABLE_MAPPINGS:
             print(f"⚠️  Skipping {csv_file} (no table mapping)")
+    upload_files = [f for f in csv_files if table_for_file(f) in TABLE_MAPPINGS]
+    
+    # Compare with the manifest of the last successful load
+    manifest = {} if FORCE_RELOAD else load_manifest(MANIFEST_PATH)
+    work_dir = tempfile.mkdtemp(prefix='upload_work_')
+    entries, plan = plan_tables(CSV_DIR, upload_files, manifest, TABLE_MAPPINGS, SNOWFLAKE_STAGE,
+                                append=APPEND_SUPERSETS, delta_dir=work_dir)
+    actions = {action: sorted(k for k, p in plan.items() if p['action'] == action)
+               for action in ('skip', 'reload', 'append')}
+    print(f"\n🧾 Manifest: {len(actions['skip'])} unchanged, {len(actions['reload'])} to reload, "
+          f"{len(actions['append'])} to append")
+    for key in actions['append']:
+        print(f"   • {key}: appending {len(plan[key]['upload'])} new file(s)")
+    
+    copy_plan = {key: p for key, p in plan.items() if p['action'] != 'skip'}
+    if not copy_plan:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        print("\n✨ Nothing changed since the last upload - Snowflake is up to date!")
+        return
+    
+    # Big files load faster as many parts: Snowflake reads the files of a COPY in parallel
+    splits = split_plan(copy_plan, CSV_DIR, work_dir)
+    for filename in splits:
+        # Staged as parts only, so a later unsplit reload must PUT the whole file
+        entries[filename]['staged_sha256'] = None
+    for filename, parts in sorted(splits.items()):
+        print(f"   • {filename}: split into {len(parts)} parts of ~{SPLIT_TARGET_MB:g} MB "
+              f"({sum(parts.values()):,} rows)")
     
-    # Copy data into tables
-    print("\n📥 Loading data into Snowflake tables...")
-    load_results = []
-    
-    for csv_file in tqdm(sorted(csv_files), desc="Loading"):
-        if csv_file in TABLE_MAPPINGS:
-            schema, table = TABLE_MAPPINGS[csv_file]
-            row_count = copy_into_table(conn, csv_file, schema, table)
-            load_results.append((schema, table, row_count))
+    # Connect to Snowflake
+    conn = connect_to_snowflake()
     
-    # Validate
-    validation_results = validate_data(conn)
+    # Upload and load: PUTs run in parallel, each table's COPY starts once its files land
+    print(f"\n📤 Uploading to Snowflake stage and loading tables "
+          f"({UPLOAD_WORKERS} upload / {COPY_WORKERS} COPY workers, PUT PARALLEL={PUT_PARALLEL})...")
+    file_results, table_results, wall_seconds = load_pipelined(
+        conn, CSV_DIR, upload_files, TABLE_MAPPINGS, SNOWFLAKE_STAGE,
+        upload_workers=UPLOAD_WORKERS, copy_workers=COPY_WORKERS, put_parallel=PUT_PARALLEL,
+        copy_plan=copy_plan)
+    print_throughput_report(file_results, table_results, wall_seconds)
+    shutil.rmtree(work_dir, ignore_errors=True)
+    
+    # Only tables that loaded cleanly are recorded, so failures are retried next run
+    table_keys = {target: key for key, target in TABLE_MAPPINGS.items()}
+    loaded = [table_keys[(r['schema'], r['table'])] for r in table_results if not r['error']]
+    save_manifest(MANIFEST_PATH, record_loaded(manifest, entries, plan, loaded))
+    
+    # Validate: one INFORMATION_SCHEMA query for every table's row count
+    targets = sorted({TABLE_MAPPINGS[key] for key in plan})
+    row_counts = fetch_row_counts(conn, SNOWFLAKE_DATABASE, targets)
     
     # Close connection
     conn.close()
     
+    # Rows in the local files of reloaded tables, so rows COPY dropped show up in the report
+    source_rows = {}
+    for filename, entry in entries.items():
+        key = table_for_file(filename)
+        if plan[key]['action'] == 'reload':
+            source_rows[TABLE_MAPPINGS[key]] = source_rows.get(TABLE_MAPPINGS[key], 0) + entry['rows']
+    report = build_load_report(table_results, file_results, row_counts, source_rows,
+                               skipped=[TABLE_MAPPINGS[key] for key in actions['skip']])
+    save_load_report(LOAD_REPORT_PATH, report)
+    
     # Summary Report
     print("\n" + "=" * 80)
     print("✅ DATA LOAD COMPLETE!")
     print("=" * 80)
-    
-    print("\n📊 Load Summary:")
-    total_rows = 0
-    for schema, table, count in validation_results:
-        if isinstance(count, int):
-            total_rows += count
-            print(f"   • {schema:20s}.{table:35s} {count:>10,} rows")
-        else:
-            print(f"   • {schema:20s}.{table:35s} {count}")
-    
-    print(f"\n🎯 Total Records Loaded: {total_rows:,}")
-    print("\n✨ All data successfully loaded into Snowflake!")
+    print_load_report(report)
+    print(f"\n📝 Load report: {LOAD_REPORT_PATH}")
+    
+    summary = report['summary']
+    if summary['tables_failed'] or summary['upload_failures']:
+        print("\n⚠️  Some tables failed to load - they will be retried on the next run")
+    elif summary['rows_dropped']:
+        print("\n⚠️  Data loaded, but some rows were rejected by COPY (ON_ERROR = 'CONTINUE')")
+    else:
+        print("\n✨ All data successfully loaded into Snowflake!")
     print("=" * 80)
 
 if __name__ == "__main__":
@@ -0,0 +1,626 @@
+#!/usr/bin/env python3
+"""
+Columnar (NumPy) generation engine for the Snowflake Credit Decisioning datasets
+Builds every table from whole arrays instead of per-row Python dicts
+
+Each build_* function mirrors the matching generate_* function in
+generate_all_snowflake_data.py: same columns, same value ranges, same
+distributions. All randomness comes from the numpy Generator passed in,
+so a given seed always produces the same output. Parent keys come from a
+key_registry.KeyRegistry, so child rows are picked by index arithmetic
+and every foreign key names a generated parent row.
+"""
+
+import numpy as np
+import pandas as pd
+
+import faker_pools
+
+SECONDS_PER_DAY = 86400
+DAYS_PER_YEAR = 365
+
+# Character positions of the 32 hex digits inside a formatted UUID
+_UUID_HEX_POSITIONS = (
+    list(range(0, 8)) + list(range(9, 13)) + list(range(14, 18)) +
+    list(range(19, 23)) + list(range(24, 36))
+)
+_HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+_LETTERS = np.frombuffer(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ', dtype=np.uint8)
+
+# ============================================
+# ARRAY HELPERS
+# ============================================
+
+def uuid4_array(rng, n):
+    """Vectorized str(uuid.uuid4()) for n rows"""
+    raw = np.frombuffer(rng.bytes(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+
+    nibbles = np.empty((n, 32), dtype=np.uint8)
+    nibbles[:, 0::2] = raw >> 4
+    nibbles[:, 1::2] = raw & 0x0F
+
+    chars = np.full((n, 36), ord('-'), dtype=np.uint8)
+    chars[:, _UUID_HEX_POSITIONS] = _HEX_DIGITS[nibbles]
+    return chars.view('S36').ravel().astype(str).astype(object)
+
+def format_ids(prefix, numbers, width):
+    """Vectorized f'{prefix}{number:0{width}d}'"""
+    digits = np.char.zfill(np.asarray(numbers, dtype=np.int64).astype(str), width)
+    return np.char.add(prefix, digits).astype(object)
+
+def bothify_array(rng, n, letters, digits):
+    """Vectorized fake.bothify('?' * letters + '#' * digits)"""
+    chars = np.empty((n, letters + digits), dtype=np.uint8)
+    chars[:, :letters] = _LETTERS[rng.integers(0, len(_LETTERS), (n, letters))]
+    chars[:, letters:] = rng.integers(ord('0'), ord('9') + 1, (n, digits), dtype=np.uint8)
+    return chars.view(f'S{letters + digits}').ravel().astype(str).astype(object)
+
+def choice(rng, values, n, weights=None):
+    """Vectorized random.choice / random.choices(..., weights=...)[0]"""
+    values = np.array(values, dtype=object)
+    if weights is None:
+        return values[rng.integers(0, len(values), n)]
+    p = np.asarray(weights, dtype=float)
+    return values[rng.choice(len(values), size=n, p=p / p.sum())]
+
+def where_none(mask, values):
+    """Keep values where mask is True, None elsewhere"""
+    return np.where(mask, values, None)
+
+def datetimes_between(rng, now, n, start_seconds_ago, end_seconds_ago=0):
+    """Vectorized fake.date_time_between(start_date=..., end_date=...)"""
+    offsets = rng.integers(end_seconds_ago, start_seconds_ago + 1, n)
+    return now - offsets.astype('timedelta64[s]')
+
+def dates_between(rng, start, end):
+    """Uniform dates in [start, end] (both datetime64[D], scalar or array)"""
+    start = np.asarray(start, dtype='datetime64[D]')
+    end = np.asarray(end, dtype='datetime64[D]')
+    span = np.maximum((end - start).astype(np.int64), 0)
+    n = max(start.size, end.size)
+    return start + np.floor(rng.random(n) * (span + 1)).astype('timedelta64[D]')
+
+def days_ago(rng, today, n, start_days_ago, end_days_ago=0):
+    """Vectorized fake.date_between(start_date='-Nd', end_date='-Md')"""
+    return dates_between(rng, today - np.timedelta64(start_days_ago, 'D'),
+                         np.full(n, today - np.timedelta64(end_days_ago, 'D')))
+
+def reference_times(now):
+    """Second-resolution 'now' and day-resolution 'today' for a run"""
+    now = np.datetime64(now.replace(microsecond=0), 's')
+    return now, now.astype('datetime64[D]')
+
+def _now_column(now, n):
+    return np.full(n, now, dtype='datetime64[s]')
+
+# ============================================
+# 1. DIGITAL BANKING DATA
+# ============================================
+
+def build_digital_customer_profile(rng, pools, now, keys):
+    """Columnar digital banking customer profiles (one per registered customer)"""
+    now, _ = reference_times(now)
+    n = keys.num_customers
+
+    return pd.DataFrame({
+        'DIGITAL_ID': keys.digital_ids,
+        'CUSTOMER_ID': keys.customer_ids,
+        'EMAIL': faker_pools.perturb_emails(rng, pools, n),
+        'MOBILE_NUMBER': faker_pools.truncate(faker_pools.sample(rng, pools['phone_number'], n), 20),
+        'USERNAME': faker_pools.truncate(faker_pools.sample(rng, pools['user_name'], n), 30),
+        'REGISTRATION_DATE': datetimes_between(rng, now, n, 3 * DAYS_PER_YEAR * SECONDS_PER_DAY),
+        'LAST_LOGIN': datetimes_between(rng, now, n, 30 * SECONDS_PER_DAY),
+        'LOGIN_COUNT': rng.integers(5, 501, n),
+        'FAILED_LOGIN_COUNT': rng.integers(0, 6, n),
+        'MFA_ENABLED': rng.random(n) < 0.5,
+        'MFA_TYPE': choice(rng, ['SMS', 'APP', 'EMAIL', None], n),
+        'DEVICE_COUNT': rng.integers(1, 4, n),
+        'PRIMARY_DEVICE_TYPE': choice(rng, ['iOS', 'Android', 'Web'], n),
+        'BIOMETRIC_ENABLED': rng.random(n) < 0.5,
+        'PUSH_NOTIFICATIONS': rng.random(n) < 0.5,
+        'EMAIL_VERIFIED': rng.random(n) < 0.5,
+        'MOBILE_VERIFIED': rng.random(n) < 0.5,
+        'EKYC_STATUS': choice(rng, ['VERIFIED', 'PENDING', 'REJECTED'], n),
+        'EKYC_DATE': pd.Series(datetimes_between(rng, now, n, 2 * DAYS_PER_YEAR * SECONDS_PER_DAY)).where(rng.random(n) > 0.1),
+        'PREFERRED_LANGUAGE': choice(rng, ['EN', 'ZH', 'MS', 'TA'], n),
+        'TIMEZONE': 'Asia/Singapore',
+        'CREATED_DATE': datetimes_between(rng, now, n, 3 * DAYS_PER_YEAR * SECONDS_PER_DAY),
+        'MODIFIED_DATE': _now_column(now, n),
+    })
+
+def build_digital_sessions(rng, pools, now, num_sessions, keys):
+    """Columnar digital banking sessions, registered in keys for the child events"""
+    now, _ = reference_times(now)
+    n = num_sessions
+
+    parent = keys.sample_customers(rng, n)
+    session_start = datetimes_between(rng, now, n, 90 * SECONDS_PER_DAY)
+    duration = rng.integers(30, 3601, n)
+    session_ids = uuid4_array(rng, n)
+    keys.register_sessions(session_ids, parent, session_start)
+
+    return pd.DataFrame({
+        'SESSION_ID': session_ids,
+        'DIGITAL_ID': keys.digital_ids[parent],
+        'CUSTOMER_ID': keys.customer_ids[parent],
+        'SESSION_START': session_start,
+        'SESSION_END': session_start + duration.astype('timedelta64[s]'),
+        'DURATION_SECONDS': duration,
+        'DEVICE_ID': uuid4_array(rng, n),
+        'DEVICE_TYPE': choice(rng, ['iOS', 'Android', 'Web', 'Tablet'], n),
+        'DEVICE_MODEL': choice(rng, ['iPhone 14', 'Samsung S23', 'iPad', 'Pixel 7', 'Chrome'], n),
+        'OS_VERSION': choice(rng, ['iOS 17', 'Android 14', 'Windows 11', 'macOS 14'], n),
+        'APP_VERSION': np.char.add(np.char.add('4.', rng.integers(0, 10, n).astype(str)),
+                                   np.char.add('.', rng.integers(0, 21, n).astype(str))).astype(object),
+        'IP_ADDRESS': _ipv4_array(rng, n),
+        'GEOLOCATION_LAT': np.round(rng.uniform(1.2, 1.5, n), 7),
+        'GEOLOCATION_LON': np.round(rng.uniform(103.6, 104.0, n), 7),
+        'CITY': choice(rng, ['Singapore', 'Jurong', 'Tampines', 'Woodlands'], n),
+        'COUNTRY': 'SGP',
+        'PAGES_VIEWED': rng.integers(1, 21, n),
+        'TRANSACTIONS_INITIATED': rng.integers(0, 6, n),
+        'TRANSACTIONS_COMPLETED': rng.integers(0, 6, n),
+        'ERROR_COUNT': rng.integers(0, 4, n),
+        'SESSION_QUALITY_SCORE': np.round(rng.uniform(70, 100, n), 2),
+        'EXIT_REASON': choice(rng, ['LOGOUT', 'TIMEOUT', 'COMPLETED', 'ERROR'], n),
+        'CREATED_DATE': session_start,
+    })
+
+def build_digital_events(rng, pools, now, num_events, keys):
+    """Columnar digital banking events for the sessions registered in keys"""
+    n = num_events
+
+    parent = keys.sample_sessions(rng, n)
+    customer = keys.session_customer[parent]
+    session_start = keys.session_start.astype('datetime64[s]')[parent]
+    has_error_code = rng.random(n) <= 0.1
+    has_error_message = rng.random(n) <= 0.1
+
+    return pd.DataFrame({
+        'EVENT_ID': uuid4_array(rng, n),
+        'SESSION_ID': keys.session_ids[parent],
+        'DIGITAL_ID': keys.digital_ids[customer],
+        'CUSTOMER_ID': keys.customer_ids[customer],
+        'EVENT_TYPE': choice(rng, ['PAGE_VIEW', 'BUTTON_CLICK', 'TRANSACTION', 'SEARCH', 'FORM_SUBMIT'], n),
+        'EVENT_NAME': choice(rng, ['account_view', 'transfer', 'bill_payment', 'balance_check', 'statement_download'], n),
+        'EVENT_TIMESTAMP': session_start + rng.integers(0, 3601, n).astype('timedelta64[s]'),
+        'PAGE_NAME': choice(rng, ['Dashboard', 'Accounts', 'Transfer', 'Bills', 'Profile'], n),
+        'ELEMENT_ID': np.char.add('btn_', rng.integers(1, 101, n).astype(str)).astype(object),
+        'EVENT_DATA': '{"amount": 1000, "currency": "SGD"}',
+        'RESPONSE_TIME_MS': rng.integers(50, 2001, n),
+        'SUCCESS': rng.random(n) < 0.75,
+        'ERROR_CODE': where_none(has_error_code, np.char.add('ERR_', rng.integers(100, 1000, n).astype(str))),
+        'ERROR_MESSAGE': where_none(has_error_message, 'Timeout error'),
+        'CREATED_DATE': session_start,
+    })
+
+def build_digital_kyc(rng, pools, now, digital_df):
+    """Columnar KYC documents (one per digital profile)"""
+    now, today = reference_times(now)
+    n = len(digital_df)
+
+    issue_date = days_ago(rng, today, n, 10 * DAYS_PER_YEAR, DAYS_PER_YEAR)
+
+    return pd.DataFrame({
+        'DOCUMENT_ID': uuid4_array(rng, n),
+        'DIGITAL_ID': digital_df['DIGITAL_ID'].to_numpy(),
+        'CUSTOMER_ID': digital_df['CUSTOMER_ID'].to_numpy(),
+        'DOCUMENT_TYPE': choice(rng, ['PASSPORT', 'NRIC', 'DRIVERS_LICENSE'], n),
+        'DOCUMENT_NUMBER': bothify_array(rng, n, 2, 6),
+        'ISSUING_COUNTRY': 'SGP',
+        'ISSUE_DATE': issue_date,
+        'EXPIRY_DATE': issue_date + np.timedelta64(3650, 'D'),
+        'UPLOAD_DATE': datetimes_between(rng, now, n, 2 * DAYS_PER_YEAR * SECONDS_PER_DAY),
+        'VERIFICATION_STATUS': choice(rng, ['VERIFIED', 'PENDING', 'REJECTED'], n),
+        'VERIFICATION_DATE': datetimes_between(rng, now, n, 2 * DAYS_PER_YEAR * SECONDS_PER_DAY),
+        'VERIFICATION_METHOD': choice(rng, ['AI', 'MANUAL', 'THIRD_PARTY'], n),
+        'CONFIDENCE_SCORE': np.round(rng.uniform(85, 99.9, n), 2),
+        'REJECTION_REASON': where_none(rng.random(n) <= 0.1, 'Document unclear'),
+        'FACE_MATCH_SCORE': np.round(rng.uniform(90, 99.9, n), 2),
+        'LIVENESS_CHECK': rng.random(n) < 0.5,
+        'CREATED_DATE': datetimes_between(rng, now, n, 2 * DAYS_PER_YEAR * SECONDS_PER_DAY),
+        'MODIFIED_DATE': _now_column(now, n),
+    })
+
+def _ipv4_array(rng, n):
+    """Vectorized fake.ipv4()"""
+    octets = rng.integers(0, 256, (n, 4)).astype(str)
+    out = octets[:, 0]
+    for i in range(1, 4):
+        out = np.char.add(np.char.add(out, '.'), octets[:, i])
+    return out.astype(object)
+
+# ============================================
+# 2. T24 CORE BANKING DATA
+# ============================================
+
+def build_t24_customers(rng, pools, now, keys):
+    """Columnar T24 customer master data (one per registered customer)"""
+    now, today = reference_times(now)
+    n = keys.num_customers
+
+    age = np.clip(rng.normal(40, 15, n).astype(int), 18, 80)
+    dob = (now - (age * 365.25 * SECONDS_PER_DAY).astype('timedelta64[s]')).astype('datetime64[D]')
+    years_customer = rng.integers(1, 21, n)
+    customer_since = now - (years_customer * DAYS_PER_YEAR * SECONDS_PER_DAY).astype('timedelta64[s]')
+
+    credit_score = (rng.beta(5, 3, n) * 550 + 300).astype(int)
+    risk_cat = np.where(credit_score >= 720, 'LOW', np.where(credit_score >= 650, 'MEDIUM', 'HIGH')).astype(object)
+
+    return pd.DataFrame({
+        'CUSTOMER_ID': keys.customer_ids,
+        'MNEMONIC': faker_pools.truncate(faker_pools.sample(rng, pools['user_name'], n), 20),
+        'SHORT_NAME': faker_pools.truncate(faker_pools.sample(rng, pools['name'], n), 50),
+        'NAME_1': faker_pools.sample(rng, pools['name'], n),
+        'NAME_2': '',
+        'GENDER': choice(rng, ['M', 'F'], n),
+        'DATE_OF_BIRTH': dob,
+        'MARITAL_STATUS': choice(rng, ['SINGLE', 'MARRIED', 'DIVORCED', 'WIDOWED'], n),
+        'NATIONALITY': 'SGP',
+        'RESIDENCE': 'SGP',
+        'SECTOR': choice(rng, ['1001', '1002', '2001', '2002'], n),
+        'INDUSTRY': choice(rng, ['TECH', 'FINANCE', 'HEALTH', 'RETAIL', 'MANUF'], n),
+        'TARGET_MARKET': choice(rng, ['RETAIL', 'WEALTH', 'CORPORATE'], n, weights=[70, 20, 10]),
+        'CUSTOMER_STATUS': choice(rng, ['ACTIVE', 'DORMANT'], n, weights=[95, 5]),
+        'CUSTOMER_SINCE': customer_since.astype('datetime64[D]'),
+        'KYC_STATUS': choice(rng, ['VERIFIED', 'PENDING', 'EXPIRED'], n, weights=[90, 5, 5]),
+        'KYC_LAST_REVIEW': today - rng.integers(0, 366, n).astype('timedelta64[D]'),
+        'RISK_CATEGORY': risk_cat,
+        'RELATIONSHIP_MANAGER': format_ids('RM', rng.integers(1, 51, n), 3),
+        'BRANCH_CODE': format_ids('BR', rng.integers(1, 21, n), 3),
+        'CREATED_DATE': customer_since,
+        'MODIFIED_DATE': _now_column(now, n),
+    })
+
+def build_t24_accounts(rng, pools, now, customers_df, keys):
+    """Columnar T24 accounts for the accounts assigned in keys"""
+    now, today = reference_times(now)
+    n = keys.num_accounts
+
+    parent = keys.account_owner
+    segment = customers_df['TARGET_MARKET'].to_numpy()[parent]
+    product_type = choice(rng, ['SAVINGS', 'CURRENT', 'FIXED_DEPOSIT', 'CREDIT_CARD'], n, weights=[40, 30, 20, 10])
+
+    # Balance based on segment
+    low = np.select([segment == 'WEALTH', segment == 'RETAIL'], [50000, 1000], 10000)
+    high = np.select([segment == 'WEALTH', segment == 'RETAIL'], [500000, 50000], 200000)
+    balance = np.round(rng.uniform(low, high), 2)
+
+    opening_date = days_ago(rng, today, n, 10 * DAYS_PER_YEAR)
+
+    return pd.DataFrame({
+        'ACCOUNT_ID': keys.account_ids(np.arange(n)),
+        'CUSTOMER_ID': keys.customer_ids[parent],
+        'ACCOUNT_TITLE': np.char.add(product_type.astype(str), ' Account').astype(object),
+        'CATEGORY': np.array([p[:4] for p in product_type], dtype=object),
+        'PRODUCT_CODE': format_ids('PRD', rng.integers(100, 1000, n), 3),
+        'PRODUCT_NAME': np.char.add(product_type.astype(str), ' Product').astype(object),
+        'CURRENCY': 'SGD',
+        'WORKING_BALANCE': balance,
+        'ONLINE_ACTUAL_BAL': balance,
+        'LOCKED_AMOUNT': 0,
+        'AVAILABLE_LIMIT': np.where(product_type == 'CREDIT_CARD', np.round(balance * 0.9, 2), 0),
+        'ACCOUNT_STATUS': choice(rng, ['ACTIVE', 'DORMANT', 'CLOSED'], n, weights=[85, 10, 5]),
+        'OPENING_DATE': opening_date,
+        'LAST_ACTIVITY_DATE': dates_between(rng, opening_date, np.full(n, today)),
+        'INTEREST_RATE': np.round(rng.uniform(0.5, 3.5, n), 4),
+        'BRANCH_CODE': format_ids('BR', rng.integers(1, 21, n), 3),
+        'JOINT_HOLDER_1': None,
+        'JOINT_HOLDER_2': None,
+        'CREATED_DATE': opening_date,
+        'MODIFIED_DATE': _now_column(now, n),
+    })
+
+# Loan parameters per type: (principal range, term choices, rate range)
+LOAN_PARAMETERS = {
+    'MORTGAGE': ((200000, 1000000), [120, 180, 240, 300], (2.5, 4.5)),
+    'AUTO': ((30000, 150000), [36, 48, 60, 72], (3.5, 6.5)),
+    'BUSINESS': ((50000, 500000), [36, 48, 60, 84], (5.0, 9.0)),
+    'PERSONAL': ((5000, 50000), [12, 24, 36, 48, 60], (6.0, 12.0)),
+}
+
+def build_t24_loans(rng, pools, now, customers_df, keys):
+    """Columnar T24 loans for the loans assigned in keys"""
+    now, today = reference_times(now)
+    n = keys.num_loans
+
+    parent = keys.loan_owner
+    risk_cat = customers_df['RISK_CATEGORY'].to_numpy()[parent]
+    loan_type = choice(rng, ['PERSONAL', 'MORTGAGE', 'AUTO', 'BUSINESS'], n, weights=[40, 30, 20, 10])
+
+    # Loan parameters
+    principal = np.empty(n)
+    term = np.empty(n, dtype=np.int64)
+    rate = np.empty(n)
+    for name, ((p_low, p_high), terms, (r_low, r_high)) in LOAN_PARAMETERS.items():
+        mask = loan_type == name
+        k = int(mask.sum())
+        principal[mask] = rng.uniform(p_low, p_high, k)
+        term[mask] = np.asarray(terms)[rng.integers(0, len(terms), k)]
+        rate[mask] = rng.uniform(r_low, r_high, k)
+
+    # Adjust rate by risk
+    rate += np.select([risk_cat == 'HIGH', risk_cat == 'MEDIUM'], [2.0, 1.0], 0.0)
+
+    start_date = days_ago(rng, today, n, 5 * DAYS_PER_YEAR)
+
+    # Calculate EMI
+    monthly_rate = rate / 12 / 100
+    growth = (1 + monthly_rate) ** term
+    emi = np.where(monthly_rate > 0, principal * monthly_rate * growth / (growth - 1), principal / term)
+
+    # Payments made
+    months_elapsed = (today - start_date).astype(np.int64) // 30
+    payments_made = np.minimum(months_elapsed, term)
+
+    # Outstanding principal
+    outstanding = np.where(
+        (monthly_rate > 0) & (payments_made < term),
+        principal * (growth - (1 + monthly_rate) ** payments_made) / (growth - 1),
+        0.0
+    )
+    outstanding = np.maximum(0, outstanding)
+
+    # Delinquency
+    delinquency_prob = np.select([risk_cat == 'LOW', risk_cat == 'MEDIUM'], [0.02, 0.05], 0.12)
+    dpd_draw = choice(rng, [0, 15, 45, 75, 120], n, weights=[50, 25, 15, 7, 3]).astype(np.int64)
+    dpd = np.where(rng.random(n) < delinquency_prob, dpd_draw, 0)
+
+    loan_status = np.where(dpd == 0, 'CURRENT', np.where(dpd < 90, 'DELINQUENT', 'DEFAULT')).astype(object)
+    loan_status[outstanding == 0] = 'CLOSED'
+
+    return pd.DataFrame({
+        'LOAN_ID': keys.loan_ids(np.arange(n)),
+        'CUSTOMER_ID': keys.customer_ids[parent],
+        'ACCOUNT_ID': keys.account_ids(keys.loan_account),
+        'LOAN_TYPE': loan_type,
+        'PRODUCT_CODE': format_ids('LN', rng.integers(100, 1000, n), 3),
+        'PRODUCT_NAME': np.char.add(loan_type.astype(str), ' Loan').astype(object),
+        'CURRENCY': 'SGD',
+        'PRINCIPAL_AMOUNT': np.round(principal, 2),
+        'OUTSTANDING_PRINCIPAL': np.round(outstanding, 2),
+        'INTEREST_RATE': np.round(rate, 4),
+        'INTEREST_TYPE': choice(rng, ['FIXED', 'FLOATING'], n),
+        'TERM_MONTHS': term,
+        'MONTHLY_PAYMENT': np.round(emi, 2),
+        'START_DATE': start_date,
+        'MATURITY_DATE': start_date + (term * 30).astype('timedelta64[D]'),
+        'NEXT_PAYMENT_DATE': start_date + ((payments_made + 1) * 30).astype('timedelta64[D]'),
+        'PAYMENTS_MADE': payments_made,
+        'PAYMENTS_REMAINING': term - payments_made,
+        'DAYS_PAST_DUE': dpd,
+        'ARREARS_AMOUNT': np.where(dpd > 0, np.round(emi * (dpd // 30), 2), 0),
+        'LOAN_STATUS': loan_status,
+        'COLLATERAL_TYPE': choice(rng, ['PROPERTY', 'VEHICLE', 'DEPOSITS', 'UNSECURED'], n),
+        'COLLATERAL_VALUE': np.round(principal * rng.uniform(1.2, 1.8, n), 2),
+        'LTV_RATIO': np.round(1 / rng.uniform(1.2, 1.8, n), 4),
+        'APPROVAL_DATE': start_date - rng.integers(7, 31, n).astype('timedelta64[D]'),
+        'APPROVED_BY': format_ids('OFFICER', rng.integers(1, 101, n), 3),
+        'CREATED_DATE': start_date,
+        'MODIFIED_DATE': _now_column(now, n),
+    })
+
+def build_t24_transactions(rng, pools, now, num_transactions, keys, transaction_offset=0):
+    """Columnar T24 transactions on the accounts assigned in keys"""
+    now, today = reference_times(now)
+    n = num_transactions
+
+    parent = keys.sample_accounts(rng, n)
+    txn_type = choice(rng, ['DEPOSIT', 'WITHDRAWAL', 'TRANSFER', 'PAYMENT', 'FEE'], n)
+    amount = rng.uniform(10, 5000, n)
+    signed_amount = np.round(np.where((txn_type == 'DEPOSIT') | (txn_type == 'TRANSFER'), amount, -amount), 2)
+    value_date = days_ago(rng, today, n, DAYS_PER_YEAR)
+    value_midnight = value_date.astype('datetime64[s]')
+
+    is_payment = txn_type == 'PAYMENT'
+    is_transfer = txn_type == 'TRANSFER'
+
+    return pd.DataFrame({
+        'TRANSACTION_ID': format_ids('TXN-', transaction_offset + np.arange(n), 10),
+        'ACCOUNT_ID': keys.account_ids(parent),
+        'CUSTOMER_ID': keys.customer_ids[keys.account_owner[parent]],
+        'TRANSACTION_TYPE': txn_type,
+        'TRANSACTION_CODE': format_ids('TC', rng.integers(100, 1000, n), 3),
+        'TRANSACTION_DESC': np.char.add(txn_type.astype(str), ' transaction').astype(object),
+        'AMOUNT': signed_amount,
+        'CURRENCY': 'SGD',
+        'AMOUNT_LCY': signed_amount,
+        'EXCHANGE_RATE': 1.0,
+        'VALUE_DATE': value_date,
+        'BOOKING_DATE': value_date,
+        'PROCESSING_TIME': value_midnight + (rng.integers(9, 18, n) * 3600).astype('timedelta64[s]'),
+        'BALANCE_AFTER': np.round(rng.uniform(1000, 50000, n), 2),
+        'CHANNEL': choice(rng, ['MOBILE', 'ATM', 'BRANCH', 'INTERNET', 'POS'], n),
+        'MERCHANT_NAME': where_none(is_payment, faker_pools.sample(rng, pools['company'], n)),
+        'MERCHANT_CATEGORY': where_none(is_payment, choice(rng, ['RETAIL', 'FOOD', 'TRAVEL', 'UTILITIES'], n)),
+        'COUNTERPARTY_ACCT': where_none(is_transfer, keys.account_ids(keys.sample_accounts(rng, n))),
+        'COUNTERPARTY_NAME': where_none(is_transfer, faker_pools.sample(rng, pools['name'], n)),
+        'COUNTERPARTY_BANK': where_none(is_transfer, choice(rng, ['DBS', 'OCBC', 'UOB', 'MAYBANK'], n)),
+        'REFERENCE': format_ids('REF', rng.integers(100000, 1000000, n), 6),
+        'REVERSAL_FLAG': 0,
+        'REVERSED_TXN_ID': None,
+        'CREATED_DATE': value_midnight,
+    })
+
+def build_t24_payment_schedule(rng, pools, now, num_schedules, loans_df, keys, schedule_offset=0):
+    """Columnar payment schedules for the loans assigned in keys (loans_df in loan order)"""
+    now, today = reference_times(now)
+    n = num_schedules
+
+    parent = keys.sample_loans(rng, n)
+    term = loans_df['TERM_MONTHS'].to_numpy()[parent]
+    start_date = loans_df['START_DATE'].to_numpy().astype('datetime64[D]')[parent]
+    monthly_payment = loans_df['MONTHLY_PAYMENT'].to_numpy()[parent]
+    loan_status = loans_df['LOAN_STATUS'].to_numpy()[parent]
+
+    installment_num = np.floor(rng.random(n) * term).astype(np.int64) + 1
+    due_date = start_date + (installment_num * 30).astype('timedelta64[D]')
+
+    principal_due = monthly_payment * 0.7
+    interest_due = monthly_payment * 0.3
+
+    # Payment status
+    is_past = due_date < today
+    paid_prob = np.where(loan_status == 'CURRENT', 0.85, 0.3)
+    paid = is_past & (rng.random(n) < paid_prob)
+    status = np.where(is_past, np.where(paid, 'PAID', 'OVERDUE'), 'SCHEDULED').astype(object)
+    overdue = status == 'OVERDUE'
+
+    return pd.DataFrame({
+        'SCHEDULE_ID': format_ids('SCH-', schedule_offset + np.arange(n), 10),
+        'LOAN_ID': keys.loan_ids(parent),
+        'CUSTOMER_ID': keys.customer_ids[keys.loan_owner[parent]],
+        'INSTALLMENT_NUMBER': installment_num,
+        'DUE_DATE': due_date,
+        'PRINCIPAL_DUE': np.round(principal_due, 2),
+        'INTEREST_DUE': np.round(interest_due, 2),
+        'TOTAL_DUE': np.round(monthly_payment, 2),
+        'PRINCIPAL_PAID': np.where(paid, np.round(principal_due, 2), 0),
+        'INTEREST_PAID': np.where(paid, np.round(interest_due, 2), 0),
+        'TOTAL_PAID': np.where(paid, np.round(monthly_payment, 2), 0),
+        'PAYMENT_DATE': pd.Series(due_date).where(paid),
+        'PAYMENT_STATUS': status,
+        'DAYS_LATE': np.where(overdue, np.maximum(0, (today - due_date).astype(np.int64)), 0),
+        'PENALTY_AMOUNT': np.where(overdue, np.round(rng.uniform(10, 100, n), 2), 0),
+        'CREATED_DATE': start_date,
+        'MODIFIED_DATE': _now_column(now, n),
+    })
+
+def build_t24_collateral(rng, pools, now, loans_df, collateral_offset=0):
+    """Columnar collateral records for secured loans"""
+    now, today = reference_times(now)
+    secured = loans_df[loans_df['COLLATERAL_TYPE'] != 'UNSECURED']
+    n = len(secured)
+
+    collateral_type = secured['COLLATERAL_TYPE'].to_numpy()
+    start_date = secured['START_DATE'].to_numpy().astype('datetime64[D]')
+    collateral_value = secured['COLLATERAL_VALUE'].to_numpy()
+
+    return pd.DataFrame({
+        'COLLATERAL_ID': format_ids('COL-', collateral_offset + np.arange(n), 8),
+        'LOAN_ID': secured['LOAN_ID'].to_numpy(),
+        'CUSTOMER_ID': secured['CUSTOMER_ID'].to_numpy(),
+        'COLLATERAL_TYPE': collateral_type,
+        'DESCRIPTION': np.char.add(np.char.add(collateral_type.astype(str), ' for '),
+                                   np.char.add(secured['LOAN_TYPE'].to_numpy().astype(str), ' loan')).astype(object),
+        'ORIGINAL_VALUE': collateral_value,
+        'CURRENT_VALUE': np.round(collateral_value * rng.uniform(0.9, 1.1, n), 2),
+        'VALUATION_DATE': dates_between(rng, start_date, np.full(n, today)),
+        'VALUATION_SOURCE': choice(rng, ['INTERNAL', 'EXTERNAL', 'MARKET'], n),
+        'CURRENCY': 'SGD',
+        'LOCATION': where_none(collateral_type == 'PROPERTY', faker_pools.sample(rng, pools['address'], n)),
+        'INSURANCE_POLICY': format_ids('INS', rng.integers(100000, 1000000, n), 6),
+        'INSURANCE_EXPIRY': dates_between(rng, today, np.full(n, today + np.timedelta64(2 * DAYS_PER_YEAR, 'D'))),
+        'LIEN_POSITION': 1,
+        'REGISTRATION_REF': format_ids('REG', rng.integers(100000, 1000000, n), 6),
+        'STATUS': secured['LOAN_STATUS'].to_numpy(),
+        'CREATED_DATE': start_date,
+        'MODIFIED_DATE': _now_column(now, n),
+    })
+
+# ============================================
+# 3. CREDIT BUREAU DATA
+# ============================================
+
+def build_credit_scores(rng, pools, now, customers_df, score_offset=0):
+    """Columnar credit scores (one per customer)"""
+    now, today = reference_times(now)
+    n = len(customers_df)
+
+    # Credit score aligned with risk category
+    risk_cat = customers_df['RISK_CATEGORY'].to_numpy()
+    mean = np.select([risk_cat == 'LOW', risk_cat == 'MEDIUM'], [750, 680], 600)
+    std = np.select([risk_cat == 'LOW', risk_cat == 'MEDIUM'], [30, 25], 40)
+    score = np.clip(rng.normal(mean, std).astype(int), 300, 850)
+
+    return pd.DataFrame({
+        'CREDIT_SCORE_ID': format_ids('CS-', score_offset + np.arange(n), 8),
+        'CUSTOMER_ID': customers_df['CUSTOMER_ID'].to_numpy(),
+        'BUREAU_NAME': choice(rng, ['EXPERIAN', 'EQUIFAX', 'TRANSUNION'], n),
+        'SCORE': score,
+        'SCORE_DATE': days_ago(rng, today, n, 30),
+        'SCORE_VERSION': '3.0',
+        'DELINQUENCY_SCORE': rng.integers(1, 101, n),
+        'BANKRUPTCY_FLAG': (rng.random(n) < 0.25).astype(int),
+        'FORECLOSURE_FLAG': 0,
+        'TOTAL_ACCOUNTS': rng.integers(3, 16, n),
+        'OPEN_ACCOUNTS': rng.integers(2, 11, n),
+        'TOTAL_BALANCE': np.round(rng.uniform(10000, 200000, n), 2),
+        'AVAILABLE_CREDIT': np.round(rng.uniform(5000, 100000, n), 2),
+        'CREDIT_UTILIZATION': np.round(rng.uniform(10, 80, n), 2),
+        'OLDEST_ACCOUNT_MONTHS': rng.integers(24, 241, n),
+        'RECENT_INQUIRIES': rng.integers(0, 6, n),
+        'DEROGATORY_MARKS': rng.integers(0, 4, n),
+        'CREATED_DATE': _now_column(now, n),
+        'MODIFIED_DATE': _now_column(now, n),
+    })
+
+def build_credit_inquiries(rng, pools, now, num_inquiries, keys, inquiry_offset=0):
+    """Columnar credit inquiries"""
+    now, today = reference_times(now)
+    n = num_inquiries
+
+    return pd.DataFrame({
+        'INQUIRY_ID': format_ids('INQ-', inquiry_offset + np.arange(n), 10),
+        'CUSTOMER_ID': keys.customer_ids[keys.sample_customers(rng, n)],
+        'INQUIRY_DATE': days_ago(rng, today, n, 2 * DAYS_PER_YEAR),
+        'INQUIRY_TYPE': choice(rng, ['HARD', 'SOFT'], n),
+        'CREDITOR_NAME': choice(rng, ['DBS Bank', 'OCBC Bank', 'UOB', 'Standard Chartered', 'Citibank'], n),
+        'PRODUCT_TYPE': choice(rng, ['CREDIT_CARD', 'PERSONAL_LOAN', 'AUTO_LOAN', 'MORTGAGE'], n),
+        'INQUIRY_AMOUNT': pd.Series(np.round(rng.uniform(5000, 500000, n), 2)).where(rng.random(n) > 0.3),
+        'INQUIRY_REASON': choice(rng, ['NEW_CREDIT', 'ACCOUNT_REVIEW', 'CREDIT_INCREASE'], n),
+        'CREATED_DATE': _now_column(now, n),
+    })
+
+def build_tradelines(rng, pools, now, num_tradelines, keys, tradeline_offset=0):
+    """Columnar credit tradelines"""
+    now, today = reference_times(now)
+    n = num_tradelines
+
+    open_date = days_ago(rng, today, n, 15 * DAYS_PER_YEAR, DAYS_PER_YEAR)
+    credit_limit = rng.uniform(5000, 50000, n)
+    balance = rng.random(n) * credit_limit * 0.8
+
+    return pd.DataFrame({
+        'TRADELINE_ID': format_ids('TL-', tradeline_offset + np.arange(n), 10),
+        'CUSTOMER_ID': keys.customer_ids[keys.sample_customers(rng, n)],
+        'CREDITOR_NAME': choice(rng, ['DBS', 'OCBC', 'UOB', 'Citi', 'HSBC', 'Standard Chartered'], n),
+        'ACCOUNT_TYPE': choice(rng, ['CREDIT_CARD', 'INSTALLMENT_LOAN', 'LINE_OF_CREDIT', 'MORTGAGE'], n),
+        'ACCOUNT_NUMBER': np.char.add('****', rng.integers(1000, 10000, n).astype(str)).astype(object),
+        'ACCOUNT_STATUS': choice(rng, ['OPEN', 'CLOSED', 'CHARGED_OFF'], n, weights=[85, 10, 5]),
+        'OPEN_DATE': open_date,
+        'CLOSE_DATE': pd.Series(dates_between(rng, open_date, np.full(n, today))).where(rng.random(n) < 0.2),
+        'CREDIT_LIMIT': np.round(credit_limit, 2),
+        'CURRENT_BALANCE': np.round(balance, 2),
+        'HIGHEST_BALANCE': np.round(credit_limit * rng.uniform(0.3, 0.95, n), 2),
+        'PAYMENT_STATUS': choice(rng, ['CURRENT', 'LATE_30', 'LATE_60', 'LATE_90'], n, weights=[90, 6, 3, 1]),
+        'MONTHLY_PAYMENT': np.round(rng.uniform(100, 2000, n), 2),
+        'LAST_PAYMENT_DATE': days_ago(rng, today, n, 60),
+        'LAST_PAYMENT_AMOUNT': np.round(rng.uniform(100, 2000, n), 2),
+        'CREATED_DATE': open_date,
+        'MODIFIED_DATE': _now_column(now, n),
+    })
+
+def build_public_records(rng, pools, now, customers_df, record_offset=0):
+    """Columnar public records (10% of customers)"""
+    now, today = reference_times(now)
+    sampled = rng.choice(len(customers_df), size=int(round(len(customers_df) * 0.1)), replace=False)
+    n = len(sampled)
+
+    record_date = days_ago(rng, today, n, 10 * DAYS_PER_YEAR, DAYS_PER_YEAR)
+
+    return pd.DataFrame({
+        'RECORD_ID': format_ids('PR-', record_offset + np.arange(n), 8),
+        'CUSTOMER_ID': customers_df['CUSTOMER_ID'].to_numpy()[sampled],
+        'RECORD_TYPE': choice(rng, ['BANKRUPTCY', 'TAX_LIEN', 'JUDGMENT', 'FORECLOSURE'], n),
+        'FILING_DATE': record_date,
+        'CLOSE_DATE': pd.Series(dates_between(rng, record_date, np.full(n, today))).where(rng.random(n) > 0.3),
+        'STATUS': choice(rng, ['DISCHARGED', 'WITHDRAWN', 'SATISFIED', 'ACTIVE'], n),
+        'AMOUNT': np.round(rng.uniform(5000, 100000, n), 2),
+        'COURT': np.char.add(faker_pools.sample(rng, pools['city'], n).astype(str), ' Court').astype(object),
+        'CASE_NUMBER': format_ids('CASE', rng.integers(100000, 1000000, n), 6),
+        'CREATED_DATE': record_date,
+        'MODIFIED_DATE': _now_column(now, n),
+    })
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+"""
+Migrate the digital banking tables from MySQL to PostgreSQL
+Replaces the psql / CSV steps of migrate_mysql_to_postgres*.sh. Each table is
+streamed out of MySQL through an unbuffered (server-side) cursor, its types
+are converted on the fly and it is written with COPY (data/generators/loaders).
+MIGRATE_WORKERS tables - and key ranges of large tables such as DIGITAL_EVENT -
+are copied at once, each over its own pair of connections. Primary keys,
+indexes and foreign keys are built after the data, then every table is
+verified by row count and an order-independent checksum of its rows.
+
+Against the local containers from infrastructure/docker:
+
+    docker compose -f infrastructure/docker/docker-compose.yml up -d mysql-digital postgres-digital
+    python scripts/migrate_mysql_to_postgres.py
+
+The target tables are dropped and recreated. Nothing should write to the
+source meanwhile: the key ranges are read in separate transactions.
+"""
+
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import mysql.connector
+import numpy as np
+import pandas as pd
+import psycopg2
+from tqdm import tqdm
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'generators'))
+from loaders import PostgresCopyLoader, print_load_summary
+from loaders.base import load_metrics
+from loaders.postgres import NULL_MARKER
+
+# MySQL source
+MYSQL_HOST = os.getenv('MYSQL_HOST', 'localhost')
+MYSQL_PORT = int(os.getenv('MYSQL_PORT', '3306'))
+MYSQL_DATABASE = os.getenv('MYSQL_DATABASE', 'digital_banking')
+MYSQL_USER = os.getenv('MYSQL_USER', 'digitaluser')
+MYSQL_PASSWORD = os.getenv('MYSQL_PASSWORD', 'DigitalPass!')
+
+# PostgreSQL target
+POSTGRES_HOST = os.getenv('POSTGRES_HOST', 'localhost')
+POSTGRES_PORT = int(os.getenv('POSTGRES_PORT', '5432'))
+POSTGRES_DATABASE = os.getenv('POSTGRES_DATABASE', 'digital_banking')
+POSTGRES_USER = os.getenv('POSTGRES_USER', 'digitaluser')
+POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', 'DigitalPass123!')
+
+# Comma-separated MySQL table names; empty migrates every table in the database
+MIGRATE_TABLES = [t.strip() for t in os.getenv('MIGRATE_TABLES', '').split(',') if t.strip()]
+# Key ranges copied at once, each over a MySQL and a PostgreSQL connection
+MIGRATE_WORKERS = int(os.getenv('MIGRATE_WORKERS', '4'))
+# Tables with more rows than this are split into MIGRATE_PARTITIONS key ranges
+MIGRATE_PARTITION_ROWS = int(os.getenv('MIGRATE_PARTITION_ROWS', '1000000'))
+MIGRATE_PARTITIONS = int(os.getenv('MIGRATE_PARTITIONS', str(MIGRATE_WORKERS)))
+# Rows fetched from the cursor (and sent per COPY) at a time
+MIGRATE_FETCH_ROWS = int(os.getenv('MIGRATE_FETCH_ROWS', '50000'))
+# Verification: 'checksum' (row count and row checksum), 'count' or 'none'
+MIGRATE_VERIFY = os.getenv('MIGRATE_VERIFY', 'checksum')
+
+Column = namedtuple('Column', ['source', 'target', 'pg_type', 'kind', 'nullable', 'default', 'auto_increment'])
+
+def print_banner():
+    print("=" * 70)
+    print("MySQL to PostgreSQL Migration")
+    print("=" * 70)
+    print(f"Source: mysql://{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}")
+    print(f"Target: postgresql://{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DATABASE}")
+    print(f"Workers: {MIGRATE_WORKERS} (tables over {MIGRATE_PARTITION_ROWS:,} rows in "
+          f"{MIGRATE_PARTITIONS} key ranges), verify: {MIGRATE_VERIFY}")
+    print("=" * 70)
+    print()
+
+# ============================================
+# CONNECTIONS
+# ============================================
+
+def mysql_connect():
+    return mysql.connector.connect(host=MYSQL_HOST, port=MYSQL_PORT, database=MYSQL_DATABASE,
+                                   user=MYSQL_USER, password=MYSQL_PASSWORD)
+
+def postgres_connect():
+    return psycopg2.connect(host=POSTGRES_HOST, port=POSTGRES_PORT, database=POSTGRES_DATABASE,
+                            user=POSTGRES_USER, password=POSTGRES_PASSWORD, connect_timeout=10)
+
+def text(value):
+    """information_schema values arrive as bytes from some server / connector versions"""
+    return value.decode() if isinstance(value, (bytes, bytearray)) else value
+
+# ============================================
+# SCHEMA
+# ============================================
+
+def postgres_type(data_type, column_type, length, precision, scale):
+    """(PostgreSQL type, value kind) for a MySQL column"""
+    unsigned = 'unsigned' in column_type
+    if column_type.startswith('tinyint(1)') or column_type == 'bit(1)':
+        return 'BOOLEAN', 'boolean'
+    integers = {
+        'tinyint': 'SMALLINT',
+        'smallint': 'INTEGER' if unsigned else 'SMALLINT',
+        'mediumint': 'INTEGER',
+        'int': 'BIGINT' if unsigned else 'INTEGER',
+        'year': 'SMALLINT',
+        'bit': 'BIGINT',
+    }
+    if data_type in integers:
+        return integers[data_type], 'integer'
+    if data_type == 'bigint':
+        return ('NUMERIC(20)', 'decimal') if unsigned else ('BIGINT', 'integer')
+    if data_type == 'decimal':
+        return f'NUMERIC({precision},{scale})', 'decimal'
+    if data_type == 'float':
+        return 'REAL', 'float'
+    if data_type == 'double':
+        return 'DOUBLE PRECISION', 'float'
+    if data_type in ('datetime', 'timestamp'):
+        return 'TIMESTAMP', 'datetime'
+    if data_type == 'date':
+        return 'DATE', 'text'
+    if data_type == 'time':
+        # MySQL TIME is a duration of up to ±838 hours, not a time of day
+        return 'INTERVAL', 'time'
+    if data_type in ('char', 'varchar'):
+        return f'{data_type.upper()}({length})', 'text'
+    if data_type in ('enum', 'set'):
+        return f'VARCHAR({length})', 'text'
+    if data_type == 'json':
+        return 'JSONB', 'json'
+    if data_type in ('binary', 'varbinary', 'tinyblob', 'blob', 'mediumblob', 'longblob'):
+        return 'BYTEA', 'binary'
+    return 'TEXT', 'text'
+
+def postgres_default(default, kind, extra):
+    """A MySQL column default as a PostgreSQL DEFAULT expression (None: no default)"""
+    if default is None:
+        return None
+    if default.upper().startswith(('CURRENT_TIMESTAMP', 'NOW(')):
+        return 'CURRENT_TIMESTAMP'
+    if 'DEFAULT_GENERATED' in extra:
+        return None  # other expression defaults have no portable translation
+    if kind == 'boolean':
+        return 'FALSE' if default in ('0', "b'0'") else 'TRUE'
+    if kind in ('integer', 'float', 'decimal'):
+        return default
+    return "'" + default.replace("'", "''") + "'"
+
+def read_schema(connection, table_name):
+    """Columns, keys, indexes and foreign keys of a MySQL table"""
+    cursor = connection.cursor()
+    cursor.execute("""
+        SELECT COLUMN_NAME, DATA_TYPE, COLUMN_TYPE, CHARACTER_MAXIMUM_LENGTH, NUMERIC_PRECISION,
+               NUMERIC_SCALE, IS_NULLABLE, COLUMN_DEFAULT, EXTRA
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        ORDER BY ORDINAL_POSITION
+    """, (table_name,))
+    columns = []
+    for name, data_type, column_type, length, precision, scale, nullable, default, extra in cursor.fetchall():
+        name, data_type, column_type, extra = text(name), text(data_type), text(column_type), text(extra) or ''
+        pg_type, kind = postgres_type(data_type, column_type, length, precision, scale)
+        columns.append(Column(name, name.lower(), pg_type, kind, nullable == 'YES',
+                              postgres_default(text(default), kind, extra), 'auto_increment' in extra))
+
+    cursor.execute("""
+        SELECT INDEX_NAME, NON_UNIQUE, COLUMN_NAME
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_TYPE <> 'FULLTEXT'
+        ORDER BY INDEX_NAME, SEQ_IN_INDEX
+    """, (table_name,))
+    indexes = {}
+    for index_name, non_unique, column_name in cursor.fetchall():
+        unique, index_columns = indexes.setdefault(text(index_name), (not int(non_unique), []))
+        index_columns.append(text(column_name).lower())
+    primary_key = indexes.pop('PRIMARY', (True, []))[1]
+    # Large tables are split into ranges of a single-column primary key
+    key = next((c for c in columns if [c.target] == primary_key), None)
+
+    cursor.execute("""
+        SELECT k.CONSTRAINT_NAME, k.COLUMN_NAME, k.REFERENCED_TABLE_NAME, k.REFERENCED_COLUMN_NAME,
+               r.UPDATE_RULE, r.DELETE_RULE
+        FROM information_schema.KEY_COLUMN_USAGE k
+        JOIN information_schema.REFERENTIAL_CONSTRAINTS r
+          ON r.CONSTRAINT_SCHEMA = k.CONSTRAINT_SCHEMA AND r.CONSTRAINT_NAME = k.CONSTRAINT_NAME
+        WHERE k.TABLE_SCHEMA = DATABASE() AND k.TABLE_NAME = %s AND k.REFERENCED_TABLE_NAME IS NOT NULL
+        ORDER BY k.CONSTRAINT_NAME, k.ORDINAL_POSITION
+    """, (table_name,))
+    foreign_keys = {}
+    for name, column_name, parent, parent_column, update_rule, delete_rule in cursor.fetchall():
+        foreign_key = foreign_keys.setdefault(text(name), {'columns': [], 'parent': text(parent),
+                                                           'parent_columns': [], 'update_rule': text(update_rule),
+                                                           'delete_rule': text(delete_rule)})
+        foreign_key['columns'].append(text(column_name).lower())
+        foreign_key['parent_columns'].append(text(parent_column).lower())
+    cursor.close()
+
+    return {
+        'source': table_name,
+        'target': table_name.lower(),
+        'columns': columns,
+        'primary_key': primary_key,
+        'key': key,
+        'indexes': indexes,
+        'foreign_keys': foreign_keys,
+    }
+
+def create_target_table(connection, table):
+    """Recreate a table in PostgreSQL without keys or indexes (built after the data)"""
+    definitions = []
+    for column in table['columns']:
+        definition = f"{column.target} {column.pg_type}"
+        if column.default is not None:
+            definition += f" DEFAULT {column.default}"
+        if not column.nullable:
+            definition += " NOT NULL"
+        definitions.append(definition)
+    cursor = connection.cursor()
+    cursor.execute(f"DROP TABLE IF EXISTS {table['target']} CASCADE")
+    cursor.execute(f"CREATE TABLE {table['target']} (\n    " + ",\n    ".join(definitions) + "\n)")
+    connection.commit()
+    cursor.close()
+
+def create_keys(table):
+    """Primary key, indexes and identity columns of a loaded table, on a connection of its own"""
+    connection = postgres_connect()
+    try:
+        cursor = connection.cursor()
+        target = table['target']
+        if table['primary_key']:
+            cursor.execute(f"ALTER TABLE {target} ADD PRIMARY KEY ({', '.join(table['primary_key'])})")
+        for name, (unique, columns) in table['indexes'].items():
+            # MySQL index names are per table, PostgreSQL ones per schema
+            cursor.execute(f"CREATE {'UNIQUE ' if unique else ''}INDEX {target}_{name.lower()} "
+                           f"ON {target} ({', '.join(columns)})")
+        for column in table['columns']:
+            if column.auto_increment:
+                cursor.execute(f"ALTER TABLE {target} ALTER COLUMN {column.target} "
+                               f"ADD GENERATED BY DEFAULT AS IDENTITY")
+                cursor.execute(f"SELECT setval(pg_get_serial_sequence('{target}', '{column.target}'), "
+                               f"COALESCE(MAX({column.target}), 0) + 1, false) FROM {target}")
+        cursor.execute(f"ANALYZE {target}")
+        connection.commit()
+        cursor.close()
+    finally:
+        connection.close()
+
+def create_foreign_keys(connection, tables):
+    """Foreign keys between migrated tables; each is validated in one pass"""
+    migrated = {table['source']: table['target'] for table in tables}
+    cursor = connection.cursor()
+    for table in tables:
+        for name, key in table['foreign_keys'].items():
+            if key['parent'] not in migrated:
+                print(f"⚠️  {table['target']}.{name}: {key['parent']} is not migrated, foreign key skipped")
+                continue
+            cursor.execute(f"ALTER TABLE {table['target']} ADD CONSTRAINT {name.lower()} "
+                           f"FOREIGN KEY ({', '.join(key['columns'])}) "
+                           f"REFERENCES {migrated[key['parent']]} ({', '.join(key['parent_columns'])}) "
+                           f"ON UPDATE {key['update_rule']} ON DELETE {key['delete_rule']}")
+    connection.commit()
+    cursor.close()
+
+# ============================================
+# KEY RANGES
+# ============================================
+
+def count_rows(connection, table):
+    cursor = connection.cursor()
+    cursor.execute(f"SELECT COUNT(*) FROM `{table['source']}`")
+    rows = cursor.fetchone()[0]
+    cursor.close()
+    return rows
+
+def key_ranges(connection, table, rows):
+    """[(low, high)] covering the table; None is unbounded, high is exclusive
+
+    Only tables over MIGRATE_PARTITION_ROWS with a single-column primary key
+    are split; the bounds are the keys at even row offsets.
+    """
+    if rows <= MIGRATE_PARTITION_ROWS or table['key'] is None or MIGRATE_PARTITIONS < 2:
+        return [(None, None)]
+    key = table['key'].source
+    cursor = connection.cursor()
+    bounds = []
+    for i in range(1, MIGRATE_PARTITIONS):
+        cursor.execute(f"SELECT `{key}` FROM `{table['source']}` ORDER BY `{key}` LIMIT 1 OFFSET %s",
+                       (rows * i // MIGRATE_PARTITIONS,))
+        bound = cursor.fetchall()[0][0]
+        if not bounds or bound != bounds[-1]:
+            bounds.append(bound)
+    cursor.close()
+    return list(zip([None] + bounds, bounds + [None]))
+
+def range_filter(key, key_range):
+    """WHERE clause and parameters selecting a key range"""
+    low, high = key_range
+    conditions, params = [], []
+    if low is not None:
+        conditions.append(f"{key} >= %s")
+        params.append(low)
+    if high is not None:
+        conditions.append(f"{key} < %s")
+        params.append(high)
+    return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+# ============================================
+# CONVERSION AND CHECKSUMS
+# ============================================
+
+def convert(frame, columns):
+    """MySQL values in the form COPY expects for the PostgreSQL types"""
+    for column in columns:
+        values = frame[column.target]
+        if column.kind == 'boolean':
+            frame[column.target] = values.astype('boolean')
+        elif column.kind == 'binary':
+            frame[column.target] = values.map(lambda v: None if v is None else '\\x' + bytes(v).hex())
+        elif column.kind == 'time':
+            # Rendered as '-1 days +23:00:00', which is valid INTERVAL input
+            frame[column.target] = pd.to_timedelta(values)
+    return frame
+
+def checksum(frame, columns):
+    """Order-independent checksum of a chunk: the sum of a 64-bit hash per row, mod 2**64
+
+    Each value is hashed in a canonical text form that does not depend on
+    which database it came from or how the rows were chunked, so the sums of
+    both sides agree exactly when the tables hold the same rows.
+    """
+    canonical = {}
+    for column in columns:
+        values = frame[column.target]
+        if column.kind == 'boolean':
+            rendered = values.astype('boolean').astype(str)
+        elif column.kind == 'integer':
+            rendered = values.astype('Int64').astype(str)
+        elif column.kind == 'float':
+            rendered = values.astype('float64').astype(str)
+        elif column.kind == 'datetime':
+            rendered = pd.to_datetime(values).dt.strftime('%Y-%m-%d %H:%M:%S.%f')
+        elif column.kind == 'time':
+            rendered = pd.to_timedelta(values).dt.total_seconds().astype(str)
+        else:
+            rendered = values.astype(str)
+        canonical[column.target] = np.where(values.isna(), NULL_MARKER, rendered.astype(object))
+    hashes = pd.util.hash_pandas_object(pd.DataFrame(canonical), index=False).to_numpy()
+    return int(hashes.sum(dtype=np.uint64))
+
+def target_select(column):
+    """SELECT expression reading a PostgreSQL column back in the form convert() produced"""
+    if column.kind == 'binary':
+        return f"'\\x' || encode({column.target}, 'hex')"
+    if column.kind == 'json':
+        return f"{column.target}::text"
+    return column.target
+
+# ============================================
+# COPY
+# ============================================
+
+def copy_loader(connection):
+    return PostgresCopyLoader(connection, chunk_rows=MIGRATE_FETCH_ROWS, rebuild_indexes=False)
+
+def source_frames(connection, table, key_range, result):
+    """Converted chunks of a key range, streamed from the server; adds to result's checksum"""
+    columns = table['columns']
+    where, params = range_filter(f"`{table['key'].source}`" if table['key'] else None, key_range)
+    # Unbuffered: rows come off the socket as they are fetched, never the whole table at once
+    cursor = connection.cursor(buffered=False)
+    cursor.execute(f"SELECT {', '.join(f'`{c.source}`' for c in columns)} FROM `{table['source']}`{where}",
+                   params)
+    try:
+        while rows := cursor.fetchmany(MIGRATE_FETCH_ROWS):
+            frame = convert(pd.DataFrame.from_records(rows, columns=[c.target for c in columns]), columns)
+            if MIGRATE_VERIFY == 'checksum':
+                result['checksum'] = (result['checksum'] + checksum(frame, columns)) % 2 ** 64
+            yield frame
+    finally:
+        cursor.close()
+
+def copy_range(table, key_range, progress):
+    """Copy one key range of a table over a MySQL and a PostgreSQL connection of its own"""
+    result = {'table': table['target'], 'checksum': 0, 'start': time.perf_counter()}
+    source, target = mysql_connect(), postgres_connect()
+    try:
+        loader = copy_loader(target)
+        result['rows'], result['rows_loaded'] = loader.load_rows(
+            table['target'], source_frames(source, table, key_range, result), progress=progress)
+        result['errors'] = loader.errors
+    finally:
+        source.close()
+        target.close()
+    result['end'] = time.perf_counter()
+    return result
+
+def copy_tables(tables):
+    """Copy every key range of every table, MIGRATE_WORKERS at a time; returns per-table results"""
+    tasks = [(table, key_range) for table in tables for key_range in table['key_ranges']]
+    # Largest tables first, so a big table's ranges do not start last
+    tasks.sort(key=lambda task: -task[0]['rows'] / len(task[0]['key_ranges']))
+    print(f"📥 Copying {len(tables)} tables in {len(tasks)} key ranges over {MIGRATE_WORKERS} workers...")
+    with tqdm(total=sum(table['rows'] for table in tables), unit='rows') as progress, \
+            ThreadPoolExecutor(max_workers=MIGRATE_WORKERS) as workers:
+        futures = [workers.submit(copy_range, table, key_range, progress) for table, key_range in tasks]
+        ranges = [future.result() for future in futures]
+
+    results = []
+    for table in tables:
+        parts = [r for r in ranges if r['table'] == table['target']]
+        table['copied'] = sum(r['rows'] for r in parts)
+        table['source_checksum'] = sum(r['checksum'] for r in parts) % 2 ** 64
+        seconds = max(r['end'] for r in parts) - min(r['start'] for r in parts)
+        results.append(load_metrics(copy_loader(None), table['target'], table['copied'],
+                                    sum(r['rows_loaded'] for r in parts),
+                                    [e for r in parts for e in r['errors']], seconds))
+    return results
+
+# ============================================
+# VERIFICATION
+# ============================================
+
+def verify_range(table, key_range):
+    """Row count and checksum of one key range of the PostgreSQL table"""
+    columns = table['columns']
+    where, params = range_filter(table['key'].target if table['key'] else None, key_range)
+    connection = postgres_connect()
+    try:
+        # Named cursor: PostgreSQL keeps the result server-side and sends it in batches
+        cursor = connection.cursor(name='migrate_verify')
+        cursor.itersize = MIGRATE_FETCH_ROWS
+        cursor.execute(f"SELECT {', '.join(target_select(c) for c in columns)} FROM {table['target']}{where}",
+                       params)
+        rows = total = 0
+        while batch := cursor.fetchmany(MIGRATE_FETCH_ROWS):
+            rows += len(batch)
+            if MIGRATE_VERIFY == 'checksum':
+                frame = pd.DataFrame.from_records(batch, columns=[c.target for c in columns])
+                total = (total + checksum(frame, columns)) % 2 ** 64
+        cursor.close()
+    finally:
+        connection.close()
+    return table['target'], rows, total
+
+def verify_tables(tables):
+    """Compare each PostgreSQL table with what was read from MySQL; True if all match"""
+    print(f"\n🔍 Verifying ({MIGRATE_VERIFY})...")
+    tasks = [(table, key_range) for table in tables for key_range in table['key_ranges']]
+    with ThreadPoolExecutor(max_workers=MIGRATE_WORKERS) as workers:
+        ranges = list(workers.map(lambda task: verify_range(*task), tasks))
+
+    ok = True
+    for table in tables:
+        rows = sum(r for name, r, _ in ranges if name == table['target'])
+        total = sum(c for name, _, c in ranges if name == table['target']) % 2 ** 64
+        matched = rows == table['rows'] == table['copied']
+        line = f"   {table['target']:<30} MySQL {table['rows']:>12,}  PostgreSQL {rows:>12,}"
+        if MIGRATE_VERIFY == 'checksum':
+            matched = matched and total == table['source_checksum']
+            line += f"  checksum {table['source_checksum']:016x} / {total:016x}"
+        print(f"{'✅' if matched else '❌'}{line}")
+        ok = ok and matched
+    return ok
+
+# ============================================
+# MAIN
+# ============================================
+
+def main():
+    print_banner()
+    try:
+        source, target = mysql_connect(), postgres_connect()
+    except Exception as e:
+        print(f"❌ Failed to connect: {e}")
+        print("\nTroubleshooting:")
+        print("1. Make sure both containers are running:")
+        print("   docker compose -f infrastructure/docker/docker-compose.yml up -d mysql-digital postgres-digital")
+        print("2. Check the MYSQL_* / POSTGRES_* settings")
+        return
+
+    cursor = source.cursor()
+    cursor.execute("SELECT TABLE_NAME FROM information_schema.TABLES "
+                   "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_TYPE = 'BASE TABLE' ORDER BY TABLE_NAME")
+    table_names = [text(name) for name, in cursor.fetchall()]
+    cursor.close()
+    if MIGRATE_TABLES:
+        table_names = [name for name in table_names if name in MIGRATE_TABLES]
+
+    print("📊 Reading the MySQL schema...")
+    tables = [read_schema(source, name) for name in table_names]
+    for table in tables:
+        table['rows'] = count_rows(source, table)
+        table['key_ranges'] = key_ranges(source, table, table['rows'])
+        create_target_table(target, table)
+        print(f"✅ {table['target']}: {len(table['columns'])} columns, {table['rows']:,} rows, "
+              f"{len(table['key_ranges'])} key range(s)")
+    source.close()
+    print()
+
+    start = time.perf_counter()
+    results = copy_tables(tables)
+
+    print("\n🔑 Building primary keys, indexes and foreign keys...")
+    with ThreadPoolExecutor(max_workers=MIGRATE_WORKERS) as workers:
+        list(workers.map(create_keys, tables))
+    create_foreign_keys(target, tables)
+    target.close()
+    print(f"✅ Done in {time.perf_counter() - start:.1f}s")
+
+    print_load_summary(results)
+    if MIGRATE_VERIFY != 'none' and not verify_tables(tables):
+        print("\n❌ Verification failed")
+        sys.exit(1)
+
+    print("\n" + "=" * 70)
+    print("🎉 Migration Complete!")
+    print("=" * 70)
+
+if __name__ == "__main__":
+    main()
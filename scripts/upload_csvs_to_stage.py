@@ -2,13 +2,25 @@
 """
 Fast CSV Upload to Snowflake Stage
 Uploads all CSV files from data/generated_csv/ to CSV_DATA_STAGE
+Tables whose files all match the last upload (content hash) are skipped
+(FORCE_UPLOAD=true to re-send all); a changed table has every staged file
+and part REMOVEd before its PUTs, so COPY by PATTERN never loads both
+split parts and whole files
 """
 
 import snowflake.connector
 import os
+import sys
 from pathlib import Path
 from tqdm import tqdm
 
+# Shared upload helpers live next to the generators
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'generators'))
+from file_splitter import table_pattern
+from output_writer import table_for_file
+from stage_loader import remove_sql
+from upload_manifest import fingerprint, load_manifest, save_manifest
+
 # Configuration from .env
 SNOWFLAKE_ACCOUNT = "MZHGUVK-BC67154"
 SNOWFLAKE_USER = "ACCOUNTADMIN"
@@ -20,6 +32,10 @@ SNOWFLAKE_ROLE = "ACCOUNTADMIN"
 
 CSV_DIR = "data/generated_csv"
 
+# Manifest of staged files (size, mtime, SHA-256, rows) used to skip unchanged files
+STAGE_MANIFEST = os.path.join(CSV_DIR, '.stage_manifest.json')
+FORCE_UPLOAD = os.getenv('FORCE_UPLOAD', 'false').lower() == 'true'
+
 def main():
     print("🚀 Fast CSV Upload to Snowflake Stage\n")
     
@@ -36,6 +52,31 @@ def main():
     
     print(f"📁 Found {len(csv_files)} CSV files\n")
     
+    # Only tables with a file changed since the last upload need a PUT
+    manifest = {} if FORCE_UPLOAD else load_manifest(STAGE_MANIFEST)
+    entries, changed_files, table_files = {}, [], {}
+    for csv_file in sorted(csv_files):
+        previous = manifest.get(csv_file.name)
+        entry = fingerprint(csv_file, previous)
+        entry['stage'] = SNOWFLAKE_STAGE
+        entries[csv_file.name] = entry
+        table_files.setdefault(table_for_file(csv_file.name), []).append(csv_file)
+        if (previous and previous['sha256'] == entry['sha256']
+                and previous.get('stage') == SNOWFLAKE_STAGE):
+            manifest[csv_file.name] = entry  # refresh mtime so the hash is not recomputed next time
+        else:
+            changed_files.append(csv_file)
+    
+    # The whole table is re-staged, so unchanged siblings of a changed file are PUT again too
+    changed_tables = sorted({table_for_file(f.name) for f in changed_files})
+    changed_files = [f for table in changed_tables for f in table_files[table]]
+    
+    print(f"🧾 {len(csv_files) - len(changed_files)} unchanged, {len(changed_files)} to upload\n")
+    if not changed_files:
+        save_manifest(STAGE_MANIFEST, manifest)
+        print("✅ Stage is already up to date!")
+        return
+    
     # Connect to Snowflake
     print("🔌 Connecting to Snowflake...")
     try:
@@ -71,23 +112,38 @@ def main():
     cursor.execute(f"USE WAREHOUSE {SNOWFLAKE_WAREHOUSE}")
     cursor.execute(f"USE DATABASE {SNOWFLAKE_DATABASE}")
     
-    # Upload each CSV file
+    # Upload each changed table's CSV files
     print(f"📤 Uploading files to @{SNOWFLAKE_STAGE}...\n")
     
     success_count = 0
-    for csv_file in tqdm(sorted(csv_files), desc="Uploading"):
+    progress = tqdm(total=len(changed_files), desc="Uploading")
+    for table in changed_tables:
+        # Drop every staged file and split part of the table (04_load_all_data.sql COPYs by PATTERN)
         try:
-            abs_path = csv_file.resolve()
-            put_sql = f"PUT file://{abs_path} @{SNOWFLAKE_STAGE} AUTO_COMPRESS=FALSE OVERWRITE=TRUE"
-            cursor.execute(put_sql)
-            success_count += 1
+            cursor.execute(remove_sql(SNOWFLAKE_STAGE, table_pattern(table)))
         except Exception as e:
-            print(f"\n⚠️  Failed to upload {csv_file.name}: {e}")
+            print(f"\n⚠️  Failed to clear staged files of {table}: {e}")
+            progress.update(len(table_files[table]))
+            continue
+        for name in [name for name in manifest if table_for_file(name) == table]:
+            del manifest[name]
+        for csv_file in table_files[table]:
+            try:
+                abs_path = csv_file.resolve()
+                put_sql = f"PUT file://{abs_path} @{SNOWFLAKE_STAGE} AUTO_COMPRESS=FALSE OVERWRITE=TRUE"
+                cursor.execute(put_sql)
+                manifest[csv_file.name] = entries[csv_file.name]
+                success_count += 1
+            except Exception as e:
+                print(f"\n⚠️  Failed to upload {csv_file.name}: {e}")
+            progress.update(1)
+    progress.close()
     
     cursor.close()
     conn.close()
+    save_manifest(STAGE_MANIFEST, manifest)
     
-    print(f"\n✅ Successfully uploaded {success_count}/{len(csv_files)} files!")
+    print(f"\n✅ Successfully uploaded {success_count}/{len(changed_files)} changed files!")
     print(f"\n📋 Next step: Run 04_load_all_data.sql in Snowflake UI to load data into tables")
 
 if __name__ == "__main__":
@@ -16,7 +16,8 @@ USE SCHEMA DIGITAL_BANKING;
 
 TRUNCATE TABLE DIGITAL_CUSTOMER_PROFILE;
 COPY INTO DIGITAL_CUSTOMER_PROFILE 
-FROM @PUBLIC.CSV_DATA_STAGE/digital_customer_profile.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?digital_customer_profile(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -30,7 +31,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE DIGITAL_SESSION;
 COPY INTO DIGITAL_SESSION 
-FROM @PUBLIC.CSV_DATA_STAGE/digital_session.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?digital_session(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -44,7 +46,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE DIGITAL_EVENT;
 COPY INTO DIGITAL_EVENT 
-FROM @PUBLIC.CSV_DATA_STAGE/digital_event.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?digital_event(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -58,7 +61,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE DIGITAL_KYC_DOCUMENT;
 COPY INTO DIGITAL_KYC_DOCUMENT 
-FROM @PUBLIC.CSV_DATA_STAGE/digital_kyc_document.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?digital_kyc_document(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -87,7 +91,8 @@ USE SCHEMA CORE_BANKING;
 
 TRUNCATE TABLE T24_CUSTOMER;
 COPY INTO T24_CUSTOMER 
-FROM @PUBLIC.CSV_DATA_STAGE/t24_customer.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?t24_customer(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -101,7 +106,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE T24_ACCOUNT;
 COPY INTO T24_ACCOUNT 
-FROM @PUBLIC.CSV_DATA_STAGE/t24_account.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?t24_account(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -115,7 +121,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE T24_LOAN;
 COPY INTO T24_LOAN 
-FROM @PUBLIC.CSV_DATA_STAGE/t24_loan.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?t24_loan(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -129,7 +136,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE T24_TRANSACTION;
 COPY INTO T24_TRANSACTION 
-FROM @PUBLIC.CSV_DATA_STAGE/t24_transaction.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?t24_transaction(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -143,7 +151,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE T24_PAYMENT_SCHEDULE;
 COPY INTO T24_PAYMENT_SCHEDULE 
-FROM @PUBLIC.CSV_DATA_STAGE/t24_payment_schedule.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?t24_payment_schedule(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -157,7 +166,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE T24_COLLATERAL;
 COPY INTO T24_COLLATERAL 
-FROM @PUBLIC.CSV_DATA_STAGE/t24_collateral.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?t24_collateral(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -190,7 +200,8 @@ USE SCHEMA CREDIT_BUREAU;
 
 TRUNCATE TABLE CREDIT_SCORE;
 COPY INTO CREDIT_SCORE 
-FROM @PUBLIC.CSV_DATA_STAGE/credit_score.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?credit_score(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -204,7 +215,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE CREDIT_INQUIRY;
 COPY INTO CREDIT_INQUIRY 
-FROM @PUBLIC.CSV_DATA_STAGE/credit_inquiry.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?credit_inquiry(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -218,7 +230,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE TRADELINE;
 COPY INTO TRADELINE 
-FROM @PUBLIC.CSV_DATA_STAGE/tradeline.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?tradeline(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -232,7 +245,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE PUBLIC_RECORD;
 COPY INTO PUBLIC_RECORD 
-FROM @PUBLIC.CSV_DATA_STAGE/public_record.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?public_record(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -261,7 +275,8 @@ USE SCHEMA REFERENCE_DATA;
 
 TRUNCATE TABLE COUNTRY_CODE;
 COPY INTO COUNTRY_CODE 
-FROM @PUBLIC.CSV_DATA_STAGE/country_code.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?country_code(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -275,7 +290,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE CURRENCY_CODE;
 COPY INTO CURRENCY_CODE 
-FROM @PUBLIC.CSV_DATA_STAGE/currency_code.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?currency_code(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -289,7 +305,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE PRODUCT_CATALOG;
 COPY INTO PRODUCT_CATALOG 
-FROM @PUBLIC.CSV_DATA_STAGE/product_catalog.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?product_catalog(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -303,7 +320,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE BRANCH_DIRECTORY;
 COPY INTO BRANCH_DIRECTORY 
-FROM @PUBLIC.CSV_DATA_STAGE/branch_directory.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?branch_directory(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
@@ -317,7 +335,8 @@ ON_ERROR = 'CONTINUE';
 
 TRUNCATE TABLE RELATIONSHIP_MANAGER;
 COPY INTO RELATIONSHIP_MANAGER 
-FROM @PUBLIC.CSV_DATA_STAGE/relationship_manager.csv
+FROM @PUBLIC.CSV_DATA_STAGE
+PATTERN = '(.*/)?relationship_manager(_[0-9]{5})*[.]csv([.]gz|[.]zst)?'
 FILE_FORMAT = (
     TYPE='CSV' 
     SKIP_HEADER=1 
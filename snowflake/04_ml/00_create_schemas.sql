@@ -13,6 +13,9 @@ CREATE SCHEMA IF NOT EXISTS ML_MODELS;
 CREATE SCHEMA IF NOT EXISTS ML_INFERENCE;
 CREATE SCHEMA IF NOT EXISTS ML_PREDICTIONS;
 
+-- Exported XGBoost booster for the vectorized inference UDF (see 01_train_credit_model.py)
+CREATE STAGE IF NOT EXISTS ML_MODELS.MODEL_STAGE;
+
 -- Grant permissions
 GRANT USAGE ON SCHEMA ML_MODELS TO ROLE SYSADMIN;
 GRANT USAGE ON SCHEMA ML_INFERENCE TO ROLE SYSADMIN;
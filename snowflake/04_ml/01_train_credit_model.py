@@ -10,6 +10,13 @@ from snowflake.ml.modeling.xgboost import XGBClassifier
 from snowflake.ml.registry import Registry
 from snowflake.snowpark import functions as F
 import pandas as pd
+import json
+import os
+import tempfile
+
+# 'multi:softprob' keeps the class probabilities (expected default probability,
+# confidence, SCORE_PROBABILITIES); 'multi:softmax' only predicts the band
+OBJECTIVE = 'multi:softprob'
 
 # Get active session (works in Snowflake Notebooks)
 session = get_active_session()
@@ -108,7 +115,7 @@ model = XGBClassifier(
     n_estimators=100,
     max_depth=6,
     learning_rate=0.1,
-    objective='multi:softmax',
+    objective=OBJECTIVE,
     num_class=num_classes,
     random_state=42
 )
@@ -131,6 +138,11 @@ print("\n📊 Sample predictions (remapped scale 0-7):")
 predictions.show(10)
 print(f"\n💡 Note: To convert to original scale, add {min_target} to PREDICTED_SCORE_BAND")
 
+if OBJECTIVE == 'multi:softprob':
+    # Same inference, one probability per remapped class (PREDICT_PROBA_0 ...)
+    print("\n📊 Sample class probabilities:")
+    model.predict_proba(training_df_prepared.select(ALL_FEATURES)).show(10)
+
 # Calculate accuracy (simplified - would use proper train/test split in production)
 print("\n✅ Model evaluation complete")
 
@@ -153,13 +165,34 @@ model_version = registry.log_model(
     version_name="v1",
     model=model,
     sample_input_data=sample_input,
-    comment=f"XGBoost credit scoring model - {num_classes}-band classification (original: {min_target}-{max_target}, remapped: 0-{num_classes-1})"
+    comment=f"XGBoost credit scoring model ({OBJECTIVE}) - {num_classes}-band classification (original: {min_target}-{max_target}, remapped: 0-{num_classes-1})"
 )
 
 print(f"✅ Model registered successfully!")
 print(f"   Model: {model_version.model_name}")
 print(f"   Version: {model_version.version_name}")
 
+# ============================================
+# Step 5b: Export Booster for the Vectorized UDF
+# ============================================
+# PREDICT_CREDIT_SCORE_BATCH (02_create_inference_udf_batch.sql) runs the
+# booster in-process, so it needs the raw model plus the feature order and
+# target remap rather than the registry wrapper
+print("\n💾 Exporting booster to @ML_MODELS.MODEL_STAGE...")
+
+export_dir = tempfile.mkdtemp(prefix='credit_model_')
+booster_path = os.path.join(export_dir, 'credit_scoring_xgboost.json')
+metadata_path = os.path.join(export_dir, 'credit_scoring_xgboost_metadata.json')
+model.to_xgboost().get_booster().save_model(booster_path)
+with open(metadata_path, 'w') as f:
+    json.dump({'features': ALL_FEATURES, 'min_target': int(min_target), 'num_class': num_classes,
+               'objective': OBJECTIVE}, f)
+
+session.sql("CREATE STAGE IF NOT EXISTS ML_MODELS.MODEL_STAGE").collect()
+for path in (booster_path, metadata_path):
+    session.file.put(path, '@ML_MODELS.MODEL_STAGE', auto_compress=False, overwrite=True)
+print("✅ Booster exported: credit_scoring_xgboost.json + credit_scoring_xgboost_metadata.json")
+
 # ============================================
 # Step 6: Summary
 # ============================================
@@ -173,5 +206,6 @@ print(f"💾 Model: CREDIT_SCORING_XGBOOST v1")
 print(f"📝 Note: Predictions will be in remapped scale (0-{num_classes-1}), add {min_target} to get original scale")
 print("\n📋 Next Steps:")
 print("   1. Run 02_create_inference_udf.sql to create real-time scoring function")
+print("      (or 02_create_inference_udf_batch.sql for the vectorized PREDICT_CREDIT_SCORE_BATCH)")
 print("   2. Run 03_batch_scoring.sql to score all customers")
 print("=" * 80)
@@ -0,0 +1,163 @@
+-- ============================================
+-- Snowflake Credit Decisioning Platform
+-- ML: Create Vectorized Batch Inference UDF
+-- Scores whole batches of feature rows in-process, no per-row Snowpark query
+-- ============================================
+
+USE ROLE ACCOUNTADMIN;
+USE DATABASE CREDIT_DECISIONING_DB;
+USE WAREHOUSE COMPUTE_WH;
+USE SCHEMA ML_INFERENCE;
+
+-- ============================================
+-- VECTORIZED CREDIT SCORE PREDICTION UDF
+-- ============================================
+-- PREDICT_CREDIT_SCORE opens a Snowpark session, builds a one-row DataFrame
+-- and runs a query for every row it scores. This version is a pandas
+-- (vectorized) UDF: Snowflake hands it batches of rows as a DataFrame, the
+-- exported XGBoost booster predicts the whole batch from one NumPy matrix,
+-- and the rating / limit / decision mapping is done with array operations
+-- (credit_scoring_engine.py, shared with local and Streamlit scoring).
+--
+-- Requires the booster exported by 01_train_credit_model.py (Step 5b) in
+-- @ML_MODELS.MODEL_STAGE, next to the scoring engine module (from SnowSQL):
+--   PUT file://snowflake/04_ml/credit_scoring_engine.py @ML_MODELS.MODEL_STAGE
+--       AUTO_COMPRESS = FALSE OVERWRITE = TRUE;
+-- Arguments are the model features in training order (ALL_FEATURES); NULLs
+-- are passed to XGBoost as missing values. A multi:softprob model also
+-- returns score_probabilities and derives default_probability / confidence
+-- from them.
+-- Usage: SELECT ML_INFERENCE.PREDICT_CREDIT_SCORE_BATCH(F_AGE, ..., F_KYC_VERIFIED)
+--        (full example at the end of this file)
+
+CREATE OR REPLACE FUNCTION PREDICT_CREDIT_SCORE_BATCH(
+    f_age FLOAT,
+    f_relationship_months FLOAT,
+    f_total_accounts FLOAT,
+    f_total_balance FLOAT,
+    f_avg_balance FLOAT,
+    f_max_balance FLOAT,
+    f_total_available_limit FLOAT,
+    f_account_utilization FLOAT,
+    f_total_loans FLOAT,
+    f_total_outstanding FLOAT,
+    f_avg_loan_amount FLOAT,
+    f_total_monthly_payment FLOAT,
+    f_max_days_past_due FLOAT,
+    f_total_arrears FLOAT,
+    f_delinquent_loans FLOAT,
+    f_debt_to_income FLOAT,
+    f_txn_count_3m FLOAT,
+    f_txn_amount_3m FLOAT,
+    f_avg_txn_amount_3m FLOAT,
+    f_debit_count_3m FLOAT,
+    f_credit_count_3m FLOAT,
+    f_txn_velocity_3m FLOAT,
+    f_txn_count_6m FLOAT,
+    f_txn_amount_6m FLOAT,
+    f_avg_txn_amount_6m FLOAT,
+    f_txn_count_12m FLOAT,
+    f_txn_amount_12m FLOAT,
+    f_credit_score FLOAT,
+    f_credit_utilization FLOAT,
+    f_total_tradelines FLOAT,
+    f_open_tradelines FLOAT,
+    f_delinquent_tradelines FLOAT,
+    f_public_records FLOAT,
+    f_inquiries_6m FLOAT,
+    f_inquiries_12m FLOAT,
+    f_login_count FLOAT,
+    f_session_count_30d FLOAT,
+    f_avg_session_duration FLOAT,
+    f_event_count_30d FLOAT,
+    f_days_since_last_login FLOAT,
+    f_years_employed FLOAT,
+    f_days_since_kyc_review FLOAT,
+    f_gender_encoded FLOAT,
+    f_marital_status_encoded FLOAT,
+    f_employment_status_encoded FLOAT,
+    f_property_owner FLOAT,
+    f_is_active FLOAT,
+    f_mfa_enabled FLOAT,
+    f_biometric_enabled FLOAT,
+    f_high_risk FLOAT,
+    f_kyc_verified FLOAT
+)
+RETURNS VARIANT
+LANGUAGE PYTHON
+RUNTIME_VERSION = '3.10'
+PACKAGES = ('xgboost', 'pandas', 'numpy')
+IMPORTS = ('@ML_MODELS.MODEL_STAGE/credit_scoring_xgboost.json',
+           '@ML_MODELS.MODEL_STAGE/credit_scoring_xgboost_metadata.json',
+           '@ML_MODELS.MODEL_STAGE/credit_scoring_engine.py')
+HANDLER = 'predict'
+AS
+$$
+import sys
+
+import pandas as pd
+
+from credit_scoring_engine import CreditScoringEngine
+
+IMPORT_DIRECTORY = sys._xoptions.get('snowflake_import_directory', '')
+
+# Cache model loading (once per Python process, shared by every batch)
+_engine = None
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        _engine = CreditScoringEngine.load(IMPORT_DIRECTORY)
+    return _engine
+
+def predict(features):
+    engine = get_engine()
+    # Arguments arrive as positional columns, in training feature order
+    scored = engine.score(features)
+    return pd.Series(engine.prediction_details(scored), index=features.index)
+
+# Vectorized UDF: called with a pandas DataFrame per batch of rows
+predict._sf_vectorized_input = pd.DataFrame
+$$;
+
+-- Grant permissions
+GRANT USAGE ON FUNCTION ML_INFERENCE.PREDICT_CREDIT_SCORE_BATCH(
+    FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT,
+    FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT,
+    FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT,
+    FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT,
+    FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT, FLOAT,
+    FLOAT
+) TO ROLE SYSADMIN;
+
+SELECT 'Vectorized inference UDF created successfully!' AS STATUS;
+
+-- Score every customer in the feature store (uncomment after model is trained and exported)
+-- Local benchmark of the handler: python snowflake/04_ml/benchmark_inference_udf.py
+/*
+SELECT
+    CUSTOMER_ID,
+    ML_INFERENCE.PREDICT_CREDIT_SCORE_BATCH(
+        F_AGE, F_RELATIONSHIP_MONTHS,
+        F_TOTAL_ACCOUNTS, F_TOTAL_BALANCE, F_AVG_BALANCE, F_MAX_BALANCE,
+        F_TOTAL_AVAILABLE_LIMIT, F_ACCOUNT_UTILIZATION,
+        F_TOTAL_LOANS, F_TOTAL_OUTSTANDING, F_AVG_LOAN_AMOUNT,
+        F_TOTAL_MONTHLY_PAYMENT, F_MAX_DAYS_PAST_DUE, F_TOTAL_ARREARS,
+        F_DELINQUENT_LOANS, F_DEBT_TO_INCOME,
+        F_TXN_COUNT_3M, F_TXN_AMOUNT_3M, F_AVG_TXN_AMOUNT_3M,
+        F_DEBIT_COUNT_3M, F_CREDIT_COUNT_3M, F_TXN_VELOCITY_3M,
+        F_TXN_COUNT_6M, F_TXN_AMOUNT_6M, F_AVG_TXN_AMOUNT_6M,
+        F_TXN_COUNT_12M, F_TXN_AMOUNT_12M,
+        F_CREDIT_SCORE, F_CREDIT_UTILIZATION,
+        F_TOTAL_TRADELINES, F_OPEN_TRADELINES, F_DELINQUENT_TRADELINES,
+        F_PUBLIC_RECORDS, F_INQUIRIES_6M, F_INQUIRIES_12M,
+        F_LOGIN_COUNT, F_SESSION_COUNT_30D, F_AVG_SESSION_DURATION,
+        F_EVENT_COUNT_30D, F_DAYS_SINCE_LAST_LOGIN,
+        F_YEARS_EMPLOYED, F_DAYS_SINCE_KYC_REVIEW,
+        F_GENDER_ENCODED, F_MARITAL_STATUS_ENCODED,
+        F_EMPLOYMENT_STATUS_ENCODED, F_PROPERTY_OWNER,
+        F_IS_ACTIVE, F_MFA_ENABLED, F_BIOMETRIC_ENABLED,
+        F_HIGH_RISK, F_KYC_VERIFIED
+    ) AS PREDICTION
+FROM ANALYTICS_FEATURE_STORE.CREDIT_SCORING_FEATURES;
+*/
@@ -1,6 +1,23 @@
 """
 Snowflake Batch Scoring Script
 Run this in Snowflake Notebooks to score all customers
+
+SCORING_MODE = 'incremental' (default) only rescores customers whose feature
+vector changed since their last prediction - detected with a hash of the
+model features stored as FEATURE_HASH - and MERGEs them into
+CREDIT_SCORE_PREDICTIONS. SCORING_MODE = 'full' rescores every customer and
+also removes customers no longer in the feature store, in the same
+transaction. The table is updated in place, never replaced.
+
+Every output column, PREDICTION_DETAILS included, is computed in the scoring
+query and the scored rows are written once: appended to the date-clustered
+CREDIT_SCORE_PREDICTIONS_HISTORY (WRITE_HISTORY) and MERGEd from there, or
+MERGEd straight from the scoring query.
+
+A multi:softprob model is scored with predict_proba: the band is the most
+likely class, DEFAULT_PROBABILITY the expected default rate over the class
+probabilities, CONFIDENCE follows the top probability, and the probabilities
+are kept in SCORE_PROBABILITIES (VECTOR(FLOAT, 8), one per band 2-9).
 """
 
 from snowflake.snowpark import Session
@@ -8,11 +25,26 @@ from snowflake.ml.registry import Registry
 from snowflake.snowpark import functions as F
 from snowflake.snowpark.context import get_active_session
 
+# 'incremental' (changed customers only) or 'full'
+SCORING_MODE = 'incremental'
+MODEL_VERSION = 'v1'
+
+PREDICTIONS_TABLE = 'ML_PREDICTIONS.CREDIT_SCORE_PREDICTIONS'
+HISTORY_TABLE = 'ML_PREDICTIONS.CREDIT_SCORE_PREDICTIONS_HISTORY'
+# Append every run's predictions to the (date-clustered) history table
+WRITE_HISTORY = True
+
+# Score bands 2-9 (model classes 0-7) and the top class probability needed
+# for HIGH / MEDIUM confidence, as in credit_scoring_engine.py
+NUM_CLASSES = 8
+HIGH_CONFIDENCE = 0.6
+MEDIUM_CONFIDENCE = 0.4
+
 # Get active session (works in Snowflake Notebooks)
 session = get_active_session()
 
 print("=" * 80)
-print("🚀 BATCH CREDIT SCORE PREDICTION")
+print(f"🚀 BATCH CREDIT SCORE PREDICTION ({SCORING_MODE.upper()})")
 print("=" * 80)
 
 # ============================================
@@ -26,20 +58,13 @@ registry = Registry(
     schema_name="ML_MODELS"
 )
 
-model = registry.get_model("CREDIT_SCORING_XGBOOST").version("v1").load()
-print("✅ Model loaded successfully!")
+model = registry.get_model("CREDIT_SCORING_XGBOOST").version(MODEL_VERSION).load()
+# multi:softprob models (01_train_credit_model.py OBJECTIVE) give class probabilities
+USE_PROBABILITIES = model.to_xgboost().get_params().get('objective') == 'multi:softprob'
+print(f"✅ Model loaded successfully! ({'class probabilities' if USE_PROBABILITIES else 'score band only'})")
 
 # ============================================
-# Step 2: Load Feature Store
-# ============================================
-print("\n📊 Loading feature store...")
-
-feature_df = session.table("ANALYTICS_FEATURE_STORE.CREDIT_SCORING_FEATURES")
-row_count = feature_df.count()
-print(f"✅ Loaded {row_count:,} customer records")
-
-# ============================================
-# Step 3: Get Features List
+# Step 2: Get Features List
 # ============================================
 NUMERIC_FEATURES = [
     'F_AGE', 'F_RELATIONSHIP_MONTHS',
@@ -70,132 +95,232 @@ CATEGORICAL_FEATURES = [
 ALL_FEATURES = NUMERIC_FEATURES + CATEGORICAL_FEATURES
 
 # ============================================
-# Step 4: Make Predictions
+# Step 3: Load Feature Store
 # ============================================
-print("\n🤖 Generating predictions for all customers...")
-print("   This may take a few minutes...")
+print("\n📊 Loading feature store...")
 
-predictions = model.predict(feature_df.select(ALL_FEATURES + ['CUSTOMER_ID']))
+# Hash of the model version and feature vector: a customer needs rescoring
+# only when it differs from the FEATURE_HASH stored with their prediction.
+# (FEATURE_DATE is CURRENT_TIMESTAMP() on every refresh, so it is left out.)
+feature_df = session.table("ANALYTICS_FEATURE_STORE.CREDIT_SCORING_FEATURES").with_column(
+    'FEATURE_HASH', F.hash(F.lit(MODEL_VERSION), *[F.col(name) for name in ALL_FEATURES])
+)
+row_count = feature_df.count()
+print(f"✅ Loaded {row_count:,} customer records")
 
 # ============================================
-# Step 5: Process Results
+# Step 4: Prepare Predictions Tables
 # ============================================
-print("\n📈 Processing prediction results...")
+# Predictions are updated in place (MERGE), never dropped and recreated, so
+# the dashboards always see a complete table
+session.sql(f"""
+    CREATE TABLE IF NOT EXISTS {PREDICTIONS_TABLE} (
+        CUSTOMER_ID VARCHAR(20),
+        PREDICTION_DATE TIMESTAMP,
+        SCORE_BAND INTEGER,
+        CREDIT_RATING VARCHAR(10),
+        DECISION VARCHAR(20),
+        MAX_CREDIT_LIMIT INTEGER,
+        DEFAULT_PROBABILITY DECIMAL(5,3),
+        CONFIDENCE VARCHAR(10),
+        PREDICTION_DETAILS VARIANT,
+        FEATURE_HASH NUMBER(19,0),
+        SCORE_PROBABILITIES VECTOR(FLOAT, {NUM_CLASSES}),
+        CREATED_DATE TIMESTAMP DEFAULT CURRENT_TIMESTAMP()
+    )
+""").collect()
+# Tables from before incremental scoring: their rows have no hash, so are all rescored
+session.sql(f"ALTER TABLE {PREDICTIONS_TABLE} ADD COLUMN IF NOT EXISTS FEATURE_HASH NUMBER(19,0)").collect()
+session.sql(f"""
+    ALTER TABLE {PREDICTIONS_TABLE} ADD COLUMN IF NOT EXISTS SCORE_PROBABILITIES VECTOR(FLOAT, {NUM_CLASSES})
+""").collect()
 
-# Remap score band back to original scale (add 2)
-min_target = 2
-predictions_processed = predictions.select(
-    feature_df['CUSTOMER_ID'],
-    (F.col('PREDICTED_SCORE_BAND').cast('INTEGER') + min_target).alias('SCORE_BAND')
-)
+if WRITE_HISTORY:
+    # One row per customer per run; clustered by day so a run's slice is read by pruning
+    session.sql(f"""
+        CREATE TABLE IF NOT EXISTS {HISTORY_TABLE}
+        LIKE {PREDICTIONS_TABLE}
+        CLUSTER BY (TO_DATE(PREDICTION_DATE))
+    """).collect()
+    session.sql(f"""
+        ALTER TABLE {HISTORY_TABLE} ADD COLUMN IF NOT EXISTS SCORE_PROBABILITIES VECTOR(FLOAT, {NUM_CLASSES})
+    """).collect()
 
-# Map score band to credit rating and decision
-credit_ratings = ['F', 'E', 'D', 'C-', 'C', 'C+', 'B', 'B+', 'A', 'A+']
-def map_credit_rating(score_band):
-    return credit_ratings[score_band] if score_band < len(credit_ratings) else 'F'
+# ============================================
+# Step 5: Detect Changed Customers
+# ============================================
+if SCORING_MODE == 'incremental':
+    print("\n🔍 Detecting customers with changed features...")
+    scored = session.table(PREDICTIONS_TABLE).select(
+        F.col('CUSTOMER_ID').alias('SCORED_CUSTOMER_ID'),
+        F.col('FEATURE_HASH').alias('SCORED_FEATURE_HASH')
+    )
+    customers_to_score = feature_df.join(
+        scored, feature_df['CUSTOMER_ID'] == scored['SCORED_CUSTOMER_ID'], how='left'
+    ).filter(
+        F.col('SCORED_FEATURE_HASH').is_null() | (F.col('SCORED_FEATURE_HASH') != F.col('FEATURE_HASH'))
+    ).select(feature_df.columns)
+else:
+    customers_to_score = feature_df
 
-# Add decision field
-predictions_with_decision = predictions_processed.select(
-    F.col('CUSTOMER_ID'),
-    F.col('SCORE_BAND'),
-    F.when(F.col('SCORE_BAND') >= 5, 'APPROVE').otherwise('DECLINE').alias('DECISION')
-)
+changed_count = customers_to_score.count()
+print(f"✅ {changed_count:,} of {row_count:,} customers to score")
 
 # ============================================
-# Step 6: Save to Predictions Table
+# Step 6: Make Predictions
 # ============================================
-print("\n💾 Saving predictions to ML_PREDICTIONS.CREDIT_SCORE_PREDICTIONS...")
+PREDICTION_COLUMNS = ['CUSTOMER_ID', 'PREDICTION_DATE', 'SCORE_BAND', 'CREDIT_RATING', 'DECISION',
+                      'MAX_CREDIT_LIMIT', 'DEFAULT_PROBABILITY', 'CONFIDENCE', 'PREDICTION_DETAILS',
+                      'FEATURE_HASH', 'SCORE_PROBABILITIES']
 
-# Get feature values for calculations
-feature_values = feature_df.select(
-    'CUSTOMER_ID',
-    'F_TOTAL_BALANCE'
-).join(
-    predictions_with_decision.select('CUSTOMER_ID', 'SCORE_BAND', 'DECISION'),
-    on='CUSTOMER_ID'
-)
+def score_customers(customers_df, prediction_date):
+    """Predictions for customers_df with every output column, computed in one pass"""
+    # CUSTOMER_ID and FEATURE_HASH pass through the model; F_TOTAL_BALANCE is a model feature
+    model_input = customers_df.select(ALL_FEATURES + ['CUSTOMER_ID', 'FEATURE_HASH'])
+    # Remap score band back to original scale (add 2)
+    min_target = 2
 
-# Calculate additional fields - create intermediate columns first
-predictions_intermediate = feature_values.select(
-    F.col('CUSTOMER_ID'),
-    F.current_timestamp().alias('PREDICTION_DATE'),
-    F.col('SCORE_BAND'),
-    # Credit rating mapping
-    F.when(F.col('SCORE_BAND') == 2, 'F')
-     .when(F.col('SCORE_BAND') == 3, 'E')
-     .when(F.col('SCORE_BAND') == 4, 'D')
-     .when(F.col('SCORE_BAND') == 5, 'C-')
-     .when(F.col('SCORE_BAND') == 6, 'C')
-     .when(F.col('SCORE_BAND') == 7, 'C+')
-     .when(F.col('SCORE_BAND') == 8, 'B')
-     .when(F.col('SCORE_BAND') == 9, 'B+')
-     .when(F.col('SCORE_BAND') == 10, 'A')
-     .otherwise('A+').alias('CREDIT_RATING'),
-    F.col('DECISION'),
-    # Max credit limit (simplified calculation) - handle NULLs
-    F.coalesce(
-        (F.coalesce(F.col('F_TOTAL_BALANCE'), F.lit(0)) * F.lit(12) * 
-         F.when(F.col('SCORE_BAND') >= 9, F.lit(3.0))
-          .when(F.col('SCORE_BAND') == 8, F.lit(2.0))
-          .when(F.col('SCORE_BAND') == 7, F.lit(1.5))
-          .when(F.col('SCORE_BAND') == 6, F.lit(1.0))
-          .when(F.col('SCORE_BAND') == 5, F.lit(0.75))
-          .when(F.col('SCORE_BAND') == 4, F.lit(0.5))
-          .when(F.col('SCORE_BAND') == 3, F.lit(0.3))
-          .when(F.col('SCORE_BAND') == 2, F.lit(0.2))
-          .otherwise(F.lit(0.1))).cast('INTEGER'),
-        F.lit(0)
-    ).alias('MAX_CREDIT_LIMIT'),
-    # Default probability (ensure it's between 0 and 1)
-    # Cast to DOUBLE first, then round to 3 decimal places
-    F.round(F.least(F.greatest(((F.lit(10) - F.col('SCORE_BAND')) / F.lit(10.0)), F.lit(0.0)), F.lit(1.0)), 3).alias('DEFAULT_PROBABILITY'),
-    # Confidence
-    F.when((F.col('SCORE_BAND') >= 7) | (F.col('SCORE_BAND') <= 2), 'HIGH')
-     .otherwise('MEDIUM').alias('CONFIDENCE'),
-    # Note: PREDICTION_DETAILS will be added in next step to avoid circular reference
-)
+    if USE_PROBABILITIES:
+        # One inference: the band is the most likely class (PREDICT_PROBA_<class>)
+        predictions = model.predict_proba(model_input)
+        probability_columns = sorted(
+            (name for name in predictions.columns if name.strip('"').upper().startswith('PREDICT_PROBA_')),
+            key=lambda name: int(name.strip('"').rsplit('_', 1)[1])
+        )
+        probabilities = [F.col(name) for name in probability_columns]
+        top_probability = F.greatest(*probabilities)
+        most_likely = F.lit(len(probabilities) - 1)
+        for label in reversed(range(len(probabilities) - 1)):
+            most_likely = F.when(probabilities[label] == top_probability, label).otherwise(most_likely)
+        predictions = predictions.with_column('SCORE_BAND', most_likely + min_target)
 
-# Write to table without PREDICTION_DETAILS first (to avoid OBJECT_CONSTRUCT issues)
-predictions_intermediate.write.mode("overwrite").save_as_table(
-    "ML_PREDICTIONS.CREDIT_SCORE_PREDICTIONS_TEMP"
-)
+        # Expected default rate: each class's band default rate weighted by its probability
+        default_probability = F.lit(0.0)
+        for label, probability in enumerate(probabilities):
+            band_default_rate = max(0.0, min(1.0, (10 - (label + min_target)) / 10.0))
+            default_probability = default_probability + probability * band_default_rate
+        confidence = (F.when(top_probability >= HIGH_CONFIDENCE, 'HIGH')
+                       .when(top_probability >= MEDIUM_CONFIDENCE, 'MEDIUM')
+                       .otherwise('LOW'))
+        score_probabilities = F.array_construct(*probabilities).cast(f'VECTOR(FLOAT, {NUM_CLASSES})')
+    else:
+        predictions = model.predict(model_input).with_column(
+            'SCORE_BAND', F.col('PREDICTED_SCORE_BAND').cast('INTEGER') + min_target
+        )
+        # Simplified - no class probabilities from a multi:softmax model
+        default_probability = F.least(F.greatest(((F.lit(10) - F.col('SCORE_BAND')) / F.lit(10.0)), F.lit(0.0)), F.lit(1.0))
+        confidence = (F.when((F.col('SCORE_BAND') >= 7) | (F.col('SCORE_BAND') <= 2), 'HIGH')
+                       .otherwise('MEDIUM'))
+        score_probabilities = F.lit(None).cast(f'VECTOR(FLOAT, {NUM_CLASSES})')
 
-# Now create PREDICTION_DETAILS using SQL (more reliable for VARIANT types)
-print("   Creating PREDICTION_DETAILS variant column...")
-session.sql("""
-    CREATE OR REPLACE TABLE ML_PREDICTIONS.CREDIT_SCORE_PREDICTIONS AS
-    SELECT 
-        CUSTOMER_ID,
-        PREDICTION_DATE,
-        SCORE_BAND,
-        CREDIT_RATING,
-        DECISION,
-        MAX_CREDIT_LIMIT,
-        DEFAULT_PROBABILITY,
-        CONFIDENCE,
-        OBJECT_CONSTRUCT(
-            'score_band', CAST(SCORE_BAND AS STRING),
-            'credit_rating', CREDIT_RATING,
-            'decision', DECISION,
-            'max_credit_limit', CAST(MAX_CREDIT_LIMIT AS STRING),
-            'default_probability', CAST(DEFAULT_PROBABILITY AS STRING),
-            'confidence', CONFIDENCE
-        ) AS PREDICTION_DETAILS
-    FROM ML_PREDICTIONS.CREDIT_SCORE_PREDICTIONS_TEMP
-""").collect()
+    details = [
+        F.lit('score_band'), F.col('SCORE_BAND').cast('STRING'),
+        F.lit('credit_rating'), F.col('CREDIT_RATING'),
+        F.lit('decision'), F.col('DECISION'),
+        F.lit('max_credit_limit'), F.col('MAX_CREDIT_LIMIT').cast('STRING'),
+        F.lit('default_probability'), F.col('DEFAULT_PROBABILITY').cast('STRING'),
+        F.lit('confidence'), F.col('CONFIDENCE')
+    ]
+    if USE_PROBABILITIES:
+        # VECTOR values cannot go into an OBJECT directly
+        details += [F.lit('score_probabilities'), F.col('SCORE_PROBABILITIES').cast('ARRAY')]
+
+    return predictions.select(
+        F.col('CUSTOMER_ID'),
+        F.lit(prediction_date).cast('TIMESTAMP').alias('PREDICTION_DATE'),
+        F.col('SCORE_BAND'),
+        # Credit rating mapping
+        F.when(F.col('SCORE_BAND') == 2, 'F')
+         .when(F.col('SCORE_BAND') == 3, 'E')
+         .when(F.col('SCORE_BAND') == 4, 'D')
+         .when(F.col('SCORE_BAND') == 5, 'C-')
+         .when(F.col('SCORE_BAND') == 6, 'C')
+         .when(F.col('SCORE_BAND') == 7, 'C+')
+         .when(F.col('SCORE_BAND') == 8, 'B')
+         .when(F.col('SCORE_BAND') == 9, 'B+')
+         .when(F.col('SCORE_BAND') == 10, 'A')
+         .otherwise('A+').alias('CREDIT_RATING'),
+        F.when(F.col('SCORE_BAND') >= 5, 'APPROVE').otherwise('DECLINE').alias('DECISION'),
+        # Max credit limit (simplified calculation) - handle NULLs
+        F.coalesce(
+            (F.coalesce(F.col('F_TOTAL_BALANCE'), F.lit(0)) * F.lit(12) * 
+             F.when(F.col('SCORE_BAND') >= 9, F.lit(3.0))
+              .when(F.col('SCORE_BAND') == 8, F.lit(2.0))
+              .when(F.col('SCORE_BAND') == 7, F.lit(1.5))
+              .when(F.col('SCORE_BAND') == 6, F.lit(1.0))
+              .when(F.col('SCORE_BAND') == 5, F.lit(0.75))
+              .when(F.col('SCORE_BAND') == 4, F.lit(0.5))
+              .when(F.col('SCORE_BAND') == 3, F.lit(0.3))
+              .when(F.col('SCORE_BAND') == 2, F.lit(0.2))
+              .otherwise(F.lit(0.1))).cast('INTEGER'),
+            F.lit(0)
+        ).alias('MAX_CREDIT_LIMIT'),
+        # Default probability (between 0 and 1), rounded to 3 decimal places
+        F.round(default_probability, 3).alias('DEFAULT_PROBABILITY'),
+        confidence.alias('CONFIDENCE'),
+        F.col('FEATURE_HASH'),
+        score_probabilities.alias('SCORE_PROBABILITIES')
+    ).select(
+        *PREDICTION_COLUMNS[:8],
+        # PREDICTION_DETAILS from the columns above, in the same query
+        F.object_construct(*details).alias('PREDICTION_DETAILS'),
+        F.col('FEATURE_HASH'),
+        F.col('SCORE_PROBABILITIES')
+    )
+
+# ============================================
+# Step 7: Save to Predictions Table
+# ============================================
+if changed_count == 0:
+    print("\n✅ No changed customers - predictions are up to date")
+else:
+    print(f"\n🤖 Generating predictions for {changed_count:,} customers...")
+    print("   This may take a few minutes...")
+
+    # One timestamp for the whole run, so this run's rows can be found again
+    prediction_date = session.sql("SELECT CURRENT_TIMESTAMP()::TIMESTAMP_NTZ").collect()[0][0]
+    new_predictions = score_customers(customers_to_score, prediction_date)
+
+    if WRITE_HISTORY:
+        # The only write of the scored rows; the MERGE reads them back from this run's slice
+        print(f"\n📚 Appending predictions to {HISTORY_TABLE}...")
+        new_predictions.select(PREDICTION_COLUMNS).write.mode("append").save_as_table(
+            HISTORY_TABLE, column_order="name"
+        )
+        new_predictions = session.table(HISTORY_TABLE).filter(
+            F.col('PREDICTION_DATE') == F.lit(prediction_date).cast('TIMESTAMP')
+        ).select(PREDICTION_COLUMNS)
 
-# Drop temp table
-session.sql("DROP TABLE IF EXISTS ML_PREDICTIONS.CREDIT_SCORE_PREDICTIONS_TEMP").collect()
+    print(f"\n💾 Saving predictions to {PREDICTIONS_TABLE}...")
+    predictions_table = session.table(PREDICTIONS_TABLE)
+    session.sql("BEGIN").collect()
+    try:
+        predictions_table.merge(
+            new_predictions,
+            predictions_table['CUSTOMER_ID'] == new_predictions['CUSTOMER_ID'],
+            [
+                F.when_matched().update({name: new_predictions[name] for name in PREDICTION_COLUMNS[1:]}),
+                F.when_not_matched().insert({name: new_predictions[name] for name in PREDICTION_COLUMNS}),
+            ]
+        )
+        if SCORING_MODE == 'full':
+            # Customers no longer in the feature store were not rescored
+            predictions_table.delete(F.col('PREDICTION_DATE') < F.lit(prediction_date).cast('TIMESTAMP'))
+        session.sql("COMMIT").collect()
+    except Exception:
+        # Keep the previous predictions if the MERGE or DELETE fails
+        session.sql("ROLLBACK").collect()
+        raise
 
-print("✅ Predictions saved successfully!")
+    print("✅ Predictions saved successfully!")
 
 # ============================================
-# Step 7: Summary Statistics
+# Step 8: Summary Statistics
 # ============================================
 print("\n📊 Summary Statistics:")
 print("=" * 80)
 
-summary = session.table("ML_PREDICTIONS.CREDIT_SCORE_PREDICTIONS").agg(
+summary = session.table(PREDICTIONS_TABLE).agg(
     F.count('*').alias('TOTAL_PREDICTIONS'),
     F.count_distinct('CUSTOMER_ID').alias('CUSTOMERS_SCORED'),
     F.sum(F.when(F.col('DECISION') == 'APPROVE', 1).otherwise(0)).alias('APPROVED_COUNT'),
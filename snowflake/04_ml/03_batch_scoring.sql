@@ -22,9 +22,15 @@ CREATE OR REPLACE TABLE CREDIT_SCORE_PREDICTIONS (
     DEFAULT_PROBABILITY DECIMAL(5,3),
     CONFIDENCE VARCHAR(10),
     PREDICTION_DETAILS VARIANT,
+    FEATURE_HASH NUMBER(19,0),  -- hash of the scored feature vector (incremental scoring)
+    SCORE_PROBABILITIES VECTOR(FLOAT, 8),  -- class probabilities, bands 2-9 (multi:softprob models)
     CREATED_DATE TIMESTAMP DEFAULT CURRENT_TIMESTAMP()
 );
 
+-- Every prediction made, one row per customer per scoring run
+CREATE TABLE IF NOT EXISTS CREDIT_SCORE_PREDICTIONS_HISTORY LIKE CREDIT_SCORE_PREDICTIONS
+    CLUSTER BY (TO_DATE(PREDICTION_DATE));
+
 -- ============================================
 -- BATCH SCORE ALL CUSTOMERS
 -- ============================================
@@ -34,6 +40,8 @@ CREATE OR REPLACE TABLE CREDIT_SCORE_PREDICTIONS (
 -- This SQL file creates the predictions table structure.
 -- The actual batch scoring is performed by the Python script which has
 -- access to Snowpark sessions needed for ML model inference.
+-- By default it runs incrementally: only customers whose features changed
+-- since their last prediction (FEATURE_HASH) are rescored and MERGEd.
 --
 -- To run batch scoring:
 -- 1. Open Snowflake Notebooks
@@ -79,5 +87,6 @@ ORDER BY DECISION;
 
 -- Grant permissions
 GRANT SELECT ON TABLE ML_PREDICTIONS.CREDIT_SCORE_PREDICTIONS TO ROLE SYSADMIN;
+GRANT SELECT ON TABLE ML_PREDICTIONS.CREDIT_SCORE_PREDICTIONS_HISTORY TO ROLE SYSADMIN;
 
 SELECT 'Predictions table created! Run 03_batch_scoring.py in Snowflake Notebooks to score all customers.' AS STATUS;
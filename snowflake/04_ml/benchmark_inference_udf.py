@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark: row-at-a-time vs vectorized credit score inference
+Runs the handler of PREDICT_CREDIT_SCORE_BATCH (02_create_inference_udf_batch.sql)
+locally - the Python between the $$ markers is executed as-is - against a
+booster trained here on synthetic features, exported the same way as Step 5b
+of 01_train_credit_model.py:
+
+    pip install xgboost
+    python snowflake/04_ml/benchmark_inference_udf.py
+
+The row-at-a-time baseline does what PREDICT_CREDIT_SCORE does for each row
+minus the Snowpark query it also runs per row (one-row frame, predict,
+list lookups), so it understates that UDF's real per-row cost.
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+
+BENCHMARK_ROWS = int(os.getenv('BENCHMARK_ROWS', '1000000'))
+BENCHMARK_SCALAR_ROWS = int(os.getenv('BENCHMARK_SCALAR_ROWS', '2000'))
+BENCHMARK_BATCH_ROWS = int(os.getenv('BENCHMARK_BATCH_ROWS', '8192'))
+BENCHMARK_TRAIN_ROWS = int(os.getenv('BENCHMARK_TRAIN_ROWS', '20000'))
+
+ML_DIR = os.path.dirname(os.path.abspath(__file__))
+UDF_SQL = os.path.join(ML_DIR, '02_create_inference_udf_batch.sql')
+
+# Same feature order as 01_train_credit_model.py
+NUMERIC_FEATURES = [
+    'F_AGE', 'F_RELATIONSHIP_MONTHS',
+    'F_TOTAL_ACCOUNTS', 'F_TOTAL_BALANCE', 'F_AVG_BALANCE', 'F_MAX_BALANCE',
+    'F_TOTAL_AVAILABLE_LIMIT', 'F_ACCOUNT_UTILIZATION',
+    'F_TOTAL_LOANS', 'F_TOTAL_OUTSTANDING', 'F_AVG_LOAN_AMOUNT',
+    'F_TOTAL_MONTHLY_PAYMENT', 'F_MAX_DAYS_PAST_DUE', 'F_TOTAL_ARREARS',
+    'F_DELINQUENT_LOANS', 'F_DEBT_TO_INCOME',
+    'F_TXN_COUNT_3M', 'F_TXN_AMOUNT_3M', 'F_AVG_TXN_AMOUNT_3M',
+    'F_DEBIT_COUNT_3M', 'F_CREDIT_COUNT_3M', 'F_TXN_VELOCITY_3M',
+    'F_TXN_COUNT_6M', 'F_TXN_AMOUNT_6M', 'F_AVG_TXN_AMOUNT_6M',
+    'F_TXN_COUNT_12M', 'F_TXN_AMOUNT_12M',
+    'F_CREDIT_SCORE', 'F_CREDIT_UTILIZATION',
+    'F_TOTAL_TRADELINES', 'F_OPEN_TRADELINES', 'F_DELINQUENT_TRADELINES',
+    'F_PUBLIC_RECORDS', 'F_INQUIRIES_6M', 'F_INQUIRIES_12M',
+    'F_LOGIN_COUNT', 'F_SESSION_COUNT_30D', 'F_AVG_SESSION_DURATION',
+    'F_EVENT_COUNT_30D', 'F_DAYS_SINCE_LAST_LOGIN',
+    'F_YEARS_EMPLOYED', 'F_DAYS_SINCE_KYC_REVIEW'
+]
+
+CATEGORICAL_FEATURES = [
+    'F_GENDER_ENCODED', 'F_MARITAL_STATUS_ENCODED',
+    'F_EMPLOYMENT_STATUS_ENCODED', 'F_PROPERTY_OWNER',
+    'F_IS_ACTIVE', 'F_MFA_ENABLED', 'F_BIOMETRIC_ENABLED',
+    'F_HIGH_RISK', 'F_KYC_VERIFIED'
+]
+
+ALL_FEATURES = NUMERIC_FEATURES + CATEGORICAL_FEATURES
+
+# Target bands 2-9, remapped to 0-7 for training as in 01_train_credit_model.py
+MIN_TARGET = 2
+NUM_CLASSES = 8
+
+# ============================================
+# SYNTHETIC MODEL
+# ============================================
+
+def synthetic_features(rng, n):
+    """Feature rows shaped like CREDIT_SCORING_FEATURES, with ~2% NULLs"""
+    numeric = rng.gamma(2.0, 50.0, (n, len(NUMERIC_FEATURES)))
+    numeric[:, NUMERIC_FEATURES.index('F_CREDIT_SCORE')] = rng.integers(300, 851, n)
+    numeric[:, NUMERIC_FEATURES.index('F_TOTAL_BALANCE')] = rng.uniform(0, 200000, n)
+    categorical = rng.integers(0, 3, (n, len(CATEGORICAL_FEATURES))).astype(float)
+    matrix = np.hstack([numeric, categorical])
+    matrix[rng.random(matrix.shape) < 0.02] = np.nan
+    return pd.DataFrame(matrix, columns=ALL_FEATURES)
+
+def export_model(rng, directory, objective='multi:softmax'):
+    """Train a booster and export it as Step 5b of 01_train_credit_model.py does"""
+    features = synthetic_features(rng, BENCHMARK_TRAIN_ROWS)
+    credit_score = features['F_CREDIT_SCORE'].fillna(600).to_numpy()
+    target = np.clip(((credit_score - 300) / 550 * NUM_CLASSES).astype(int), 0, NUM_CLASSES - 1)
+    booster = xgb.train(
+        {'objective': objective, 'num_class': NUM_CLASSES, 'max_depth': 6, 'eta': 0.1, 'seed': 42},
+        xgb.DMatrix(features, label=target),
+        num_boost_round=100,
+    )
+    booster.save_model(os.path.join(directory, 'credit_scoring_xgboost.json'))
+    with open(os.path.join(directory, 'credit_scoring_xgboost_metadata.json'), 'w') as f:
+        json.dump({'features': ALL_FEATURES, 'min_target': MIN_TARGET, 'num_class': NUM_CLASSES,
+                   'objective': objective}, f)
+
+def load_handler(directory):
+    """The UDF's Python body from the SQL file, with the staged files in directory"""
+    with open(UDF_SQL) as f:
+        body = re.search(r'^\$\$\n(.*?)^\$\$;', f.read(), re.S | re.M).group(1)
+    sys._xoptions['snowflake_import_directory'] = directory
+    # Snowflake puts staged .py imports (credit_scoring_engine.py) on the path
+    if ML_DIR not in sys.path:
+        sys.path.insert(0, ML_DIR)
+    namespace = {}
+    exec(compile(body, UDF_SQL, 'exec'), namespace)
+    return namespace['predict']
+
+# ============================================
+# BENCHMARK
+# ============================================
+
+def predict_row_by_row(booster, features):
+    """PREDICT_CREDIT_SCORE's per-row work, without its per-row Snowpark query"""
+    credit_ratings = ['F', 'E', 'D', 'C-', 'C', 'C+', 'B', 'B+', 'A', 'A+']
+    credit_limit_multipliers = [0, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0]
+    results = []
+    for row in features.itertuples(index=False):
+        input_data = pd.DataFrame([row], columns=ALL_FEATURES)
+        score_band = int(booster.predict(xgb.DMatrix(input_data))[0]) + MIN_TARGET
+        total_balance = row.F_TOTAL_BALANCE
+        annual_income = float(total_balance) * 12 if total_balance and not np.isnan(total_balance) else 50000
+        multiplier = credit_limit_multipliers[score_band] if score_band < len(credit_limit_multipliers) else 0
+        results.append({
+            'score_band': score_band,
+            'credit_rating': credit_ratings[score_band] if score_band < len(credit_ratings) else 'F',
+            'decision': 'APPROVE' if score_band >= 5 else 'DECLINE',
+            'max_credit_limit': int(annual_income * multiplier) if annual_income > 0 else 0,
+            'default_probability': round(max(0.0, min(1.0, (10 - score_band) / 10.0)), 3),
+            'confidence': 'HIGH' if score_band >= 7 or score_band <= 2 else 'MEDIUM'
+        })
+    return results
+
+def predict_batches(predict, features):
+    """Call the vectorized handler the way Snowflake does: positional columns, one batch at a time"""
+    results = []
+    for start in range(0, len(features), BENCHMARK_BATCH_ROWS):
+        batch = features.iloc[start:start + BENCHMARK_BATCH_ROWS]
+        batch.columns = range(len(ALL_FEATURES))
+        results.extend(predict(batch))
+    return results
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    print("=" * 80)
+    print(f"⏱️  CREDIT SCORE INFERENCE BENCHMARK ({BENCHMARK_ROWS:,} rows)")
+    print("=" * 80)
+    rng = np.random.default_rng(42)
+    model_dir = tempfile.mkdtemp(prefix='credit_model_')
+    print(f"\n🤖 Training synthetic booster on {BENCHMARK_TRAIN_ROWS:,} rows...")
+    export_model(rng, model_dir)
+    predict = load_handler(model_dir)
+    booster = xgb.Booster()
+    booster.load_model(os.path.join(model_dir, 'credit_scoring_xgboost.json'))
+
+    features = synthetic_features(rng, BENCHMARK_ROWS)
+    sample = features.iloc[:BENCHMARK_SCALAR_ROWS]
+
+    print(f"\n🐢 Row at a time ({len(sample):,} rows)...")
+    expected, scalar_seconds = timed(predict_row_by_row, booster, sample)
+    print(f"🚀 Vectorized handler ({BENCHMARK_ROWS:,} rows, batches of {BENCHMARK_BATCH_ROWS:,})...")
+    results, vector_seconds = timed(predict_batches, predict, features)
+
+    assert len(results) == BENCHMARK_ROWS, f"{len(results):,} results for {BENCHMARK_ROWS:,} rows"
+    assert results[:len(expected)] == expected, "vectorized results differ from the row-at-a-time ones"
+
+    scalar_rate = len(sample) / scalar_seconds
+    vector_rate = BENCHMARK_ROWS / vector_seconds
+    print("\n" + "=" * 80)
+    print(f"   {'Path':<32} {'rows/s':>12} {'1M rows':>12} {'speedup':>10}")
+    print(f"   {'row at a time (no query)':<32} {scalar_rate:>12,.0f} {1e6 / scalar_rate:>11,.0f}s {1.0:>9.1f}x")
+    print(f"   {'vectorized handler':<32} {vector_rate:>12,.0f} {1e6 / vector_rate:>11,.1f}s "
+          f"{vector_rate / scalar_rate:>9.1f}x")
+    print(f"\n   Results identical on the first {len(expected):,} rows")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
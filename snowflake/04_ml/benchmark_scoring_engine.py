@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: credit_scoring_engine throughput
+Reports rows/sec of CreditScoringEngine for pandas, pyarrow and NumPy
+batches at 1..N XGBoost threads, and for a stream of batches through
+score_batches(), using the synthetic booster of benchmark_inference_udf.py.
+The multi:softprob rows show what keeping the class probabilities costs.
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import pyarrow as pa
+
+from benchmark_inference_udf import export_model, synthetic_features
+from credit_scoring_engine import CreditScoringEngine
+
+BENCHMARK_ROWS = int(os.getenv('BENCHMARK_ROWS', '500000'))
+BENCHMARK_BATCH_ROWS = int(os.getenv('BENCHMARK_BATCH_ROWS', '50000'))
+BENCHMARK_THREADS = int(os.getenv('BENCHMARK_THREADS', str(os.cpu_count() or 1)))
+
+def timed(fn, *args):
+    """Run fn and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def thread_counts():
+    """1, 2, 4, ... up to BENCHMARK_THREADS"""
+    counts = [1]
+    while counts[-1] * 2 <= BENCHMARK_THREADS:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != BENCHMARK_THREADS:
+        counts.append(BENCHMARK_THREADS)
+    return counts
+
+def main():
+    print("=" * 80)
+    print(f"⏱️  CREDIT SCORING ENGINE BENCHMARK ({BENCHMARK_ROWS:,} rows)")
+    print("=" * 80)
+    rng = np.random.default_rng(42)
+    model_dir = tempfile.mkdtemp(prefix='credit_model_')
+    export_model(rng, model_dir)
+    softprob_dir = tempfile.mkdtemp(prefix='credit_model_softprob_')
+    export_model(np.random.default_rng(42), softprob_dir, objective='multi:softprob')
+
+    features = synthetic_features(rng, BENCHMARK_ROWS)
+    inputs = {
+        'pandas': features,
+        'pyarrow': pa.Table.from_pandas(features, preserve_index=False),
+        'numpy': features.to_numpy(),
+    }
+    batches = [features.iloc[start:start + BENCHMARK_BATCH_ROWS]
+               for start in range(0, BENCHMARK_ROWS, BENCHMARK_BATCH_ROWS)]
+
+    results = []
+    for threads in thread_counts():
+        engine = CreditScoringEngine.load(model_dir, threads=threads)
+        reference = None
+        for name, batch in inputs.items():
+            scored, seconds = timed(engine.score, batch)
+            if reference is None:
+                reference = scored
+            assert scored.reset_index(drop=True).equals(reference.reset_index(drop=True)), \
+                f"{name} input scored differently"
+            results.append((f"score({name})", threads, BENCHMARK_ROWS / seconds))
+
+        streamed, seconds = timed(lambda: list(engine.score_batches(iter(batches))))
+        assert sum(len(scored) for scored in streamed) == BENCHMARK_ROWS
+        results.append((f"score_batches({BENCHMARK_BATCH_ROWS:,})", threads, BENCHMARK_ROWS / seconds))
+
+        # Same trees, probabilities kept: bands must match the multi:softmax model
+        softprob = CreditScoringEngine.load(softprob_dir, threads=threads)
+        scored, seconds = timed(softprob.score, features)
+        assert scored['SCORE_BAND'].equals(reference['SCORE_BAND']), "softprob bands differ from softmax"
+        results.append(("score(pandas) softprob", threads, BENCHMARK_ROWS / seconds))
+
+    baseline = results[0][2]
+    print(f"\n   {'Path':<28} {'threads':>8} {'rows/s':>12} {'vs 1 thread':>12}")
+    for name, threads, rate in results:
+        print(f"   {name:<28} {threads:>8} {rate:>12,.0f} {rate / baseline:>11.1f}x")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    main()
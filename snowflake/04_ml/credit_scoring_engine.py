@@ -0,0 +1,197 @@
+"""
+Credit Scoring Engine
+Scores feature batches with the XGBoost booster exported by
+01_train_credit_model.py (Step 5b) - no Snowpark session or ML Registry
+needed - and applies the same post-processing as the inference UDFs:
+SCORE_BAND, CREDIT_RATING, DECISION, MAX_CREDIT_LIMIT, DEFAULT_PROBABILITY
+and CONFIDENCE.
+
+A multi:softprob booster also yields SCORE_PROBABILITIES (float32, one per
+class): DEFAULT_PROBABILITY is then the expected default rate over those
+probabilities and CONFIDENCE follows the top class probability. A
+multi:softmax booster only yields the band, so both fall back to the
+(10 - SCORE_BAND) / 10 heuristic.
+
+The same module runs inside PREDICT_CREDIT_SCORE_BATCH (staged next to the
+booster in @ML_MODELS.MODEL_STAGE), in the Streamlit pages and locally:
+
+    engine = CreditScoringEngine.load('model_dir')     # .json or .ubj booster + metadata
+    scored = engine.score(features_df)                 # pandas, pyarrow or NumPy batch
+    for scored in engine.score_batches(session.table(...).to_pandas_batches()):
+        ...
+
+Batches are matched to the training feature order by column name; pandas
+frames with positional columns (as vectorized UDFs receive them) and NumPy
+matrices must already be in that order. NULLs / NaNs are passed to XGBoost
+as missing values.
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+
+MODEL_FILES = ('credit_scoring_xgboost.json', 'credit_scoring_xgboost.ubj')
+METADATA_FILE = 'credit_scoring_xgboost_metadata.json'
+
+# Indexed by score band
+CREDIT_RATINGS = np.array(['F', 'E', 'D', 'C-', 'C', 'C+', 'B', 'B+', 'A', 'A+'], dtype=object)
+CREDIT_LIMIT_MULTIPLIERS = np.array([0, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0])
+
+# Default rate of each score band, indexed by score band
+BAND_DEFAULT_RATES = np.clip((10 - np.arange(len(CREDIT_RATINGS))) / 10.0, 0.0, 1.0)
+
+# Top class probability needed for HIGH / MEDIUM confidence (softprob models)
+HIGH_CONFIDENCE = 0.6
+MEDIUM_CONFIDENCE = 0.4
+
+# Income estimate when there is no balance to base it on
+DEFAULT_ANNUAL_INCOME = 50000
+
+# Output columns, as in ML_PREDICTIONS.CREDIT_SCORE_PREDICTIONS
+# (plus SCORE_PROBABILITIES for multi:softprob models)
+SCORE_COLUMNS = ['SCORE_BAND', 'CREDIT_RATING', 'DECISION', 'MAX_CREDIT_LIMIT',
+                 'DEFAULT_PROBABILITY', 'CONFIDENCE']
+
+class CreditScoringEngine:
+    """Exported credit scoring booster plus its feature order and target remap"""
+
+    def __init__(self, booster, features, min_target, threads=None):
+        self.booster = booster
+        self.features = list(features)
+        self.min_target = int(min_target)
+        self.threads = threads or os.cpu_count() or 1
+        self.booster.set_param({'nthread': self.threads})
+        self.balance_index = self.features.index('F_TOTAL_BALANCE')
+
+    @classmethod
+    def load(cls, directory, threads=None):
+        """Load the booster and metadata exported to directory"""
+        model_paths = [os.path.join(directory, name) for name in MODEL_FILES]
+        model_path = next((path for path in model_paths if os.path.exists(path)), None)
+        if model_path is None:
+            raise RuntimeError(f"No exported booster ({' or '.join(MODEL_FILES)}) in {directory!r}")
+        with open(os.path.join(directory, METADATA_FILE)) as f:
+            metadata = json.load(f)
+        booster = xgb.Booster()
+        booster.load_model(model_path)
+        return cls(booster, metadata['features'], metadata['min_target'], threads)
+
+    # ============================================
+    # INPUT
+    # ============================================
+
+    def to_matrix(self, batch):
+        """float32 feature matrix (training order) and float64 F_TOTAL_BALANCE of a batch"""
+        if isinstance(batch, pd.DataFrame):
+            if set(self.features).issubset(batch.columns):
+                batch = batch[self.features]
+            elif batch.shape[1] != len(self.features):
+                missing = [name for name in self.features if name not in batch.columns]
+                raise ValueError(f"Batch is missing features: {', '.join(missing)}")
+            matrix = batch.to_numpy(dtype=np.float32, na_value=np.nan)
+            balance = batch.iloc[:, self.balance_index].to_numpy(dtype=np.float64, na_value=np.nan)
+        elif type(batch).__module__.startswith('pyarrow'):
+            import pyarrow as pa
+            missing = [name for name in self.features if name not in batch.column_names]
+            if missing:
+                raise ValueError(f"Batch is missing features: {', '.join(missing)}")
+            columns = [batch.column(name).cast(pa.float64()).to_numpy() for name in self.features]
+            matrix = np.column_stack(columns).astype(np.float32)
+            balance = columns[self.balance_index]
+        else:
+            balance = np.asarray(batch, dtype=np.float64)
+            if balance.ndim != 2 or balance.shape[1] != len(self.features):
+                raise ValueError(f"Expected a (rows, {len(self.features)}) matrix, got {balance.shape}")
+            matrix = balance.astype(np.float32)
+            balance = balance[:, self.balance_index]
+        return matrix, balance
+
+    # ============================================
+    # SCORING
+    # ============================================
+
+    def predict_bands(self, matrix):
+        """Score bands (min_target added back) and class probabilities (None for multi:softmax)"""
+        predicted = self.booster.inplace_predict(matrix, missing=np.nan)
+        if predicted.ndim == 2:
+            # multi:softprob: one probability per remapped class, band is the most likely
+            probabilities = predicted.astype(np.float32, copy=False)
+            return probabilities.argmax(axis=1) + self.min_target, probabilities
+        return predicted.astype(np.int64) + self.min_target, None
+
+    def post_process(self, score_band, total_balance, probabilities=None):
+        """Rating, decision, limit, default probability and confidence for score bands"""
+        band = np.clip(score_band, 0, len(CREDIT_RATINGS) - 1)
+        in_range = score_band < len(CREDIT_RATINGS)
+
+        if probabilities is None:
+            # Simplified - no class probabilities from a multi:softmax model
+            default_probability = BAND_DEFAULT_RATES[band] * in_range
+            confidence = np.where((score_band >= 7) | (score_band <= 2), 'HIGH', 'MEDIUM')
+        else:
+            class_bands = np.clip(np.arange(probabilities.shape[1]) + self.min_target, 0, len(CREDIT_RATINGS) - 1)
+            default_probability = probabilities @ BAND_DEFAULT_RATES[class_bands].astype(np.float32)
+            top_probability = probabilities.max(axis=1)
+            confidence = np.where(top_probability >= HIGH_CONFIDENCE, 'HIGH',
+                                  np.where(top_probability >= MEDIUM_CONFIDENCE, 'MEDIUM', 'LOW'))
+
+        # Annual income estimated from total balance (as PREDICT_CREDIT_SCORE_BY_ID_V4 does)
+        total_balance = np.nan_to_num(total_balance)
+        annual_income = np.where(total_balance != 0, total_balance * 12, DEFAULT_ANNUAL_INCOME)
+        multiplier = np.where(in_range, CREDIT_LIMIT_MULTIPLIERS[band], 0)
+
+        scored = pd.DataFrame({
+            'SCORE_BAND': score_band,
+            'CREDIT_RATING': np.where(in_range, CREDIT_RATINGS[band], 'F'),
+            'DECISION': np.where(score_band >= 5, 'APPROVE', 'DECLINE'),
+            'MAX_CREDIT_LIMIT': np.where(annual_income > 0, annual_income * multiplier, 0).astype(np.int64),
+            'DEFAULT_PROBABILITY': np.round(default_probability.astype(np.float64), 3),
+            'CONFIDENCE': confidence,
+        })
+        if probabilities is not None:
+            scored['SCORE_PROBABILITIES'] = list(probabilities)
+        return scored
+
+    def score(self, batch):
+        """SCORE_COLUMNS for every row of a pandas, pyarrow or NumPy batch"""
+        matrix, total_balance = self.to_matrix(batch)
+        score_band, probabilities = self.predict_bands(matrix)
+        scored = self.post_process(score_band, total_balance, probabilities)
+        if isinstance(batch, pd.DataFrame):
+            scored.index = batch.index
+        return scored
+
+    def score_batches(self, batches, workers=2):
+        """Score a stream of batches on a thread pool, yielding results in order"""
+        # Each predict already runs on `threads` XGBoost threads; the pool
+        # overlaps fetching / converting the next batch with scoring this one
+        if workers == 1:
+            for batch in batches:
+                yield self.score(batch)
+            return
+
+        # At most 2 batches per worker in flight, so long streams are not read ahead
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for batch in batches:
+                pending.append(pool.submit(self.score, batch))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    @staticmethod
+    def prediction_details(scored):
+        """PREDICTION_DETAILS objects (lowercase keys) for scored rows"""
+        # zip over tolist() columns: several times faster than to_dict('records')
+        keys = [name.lower() for name in SCORE_COLUMNS]
+        columns = [scored[name].tolist() for name in SCORE_COLUMNS]
+        if 'SCORE_PROBABILITIES' in scored:
+            keys.append('score_probabilities')
+            columns.append(np.round(np.stack(scored['SCORE_PROBABILITIES']).astype(np.float64), 4).tolist())
+        return [dict(zip(keys, values)) for values in zip(*columns)]
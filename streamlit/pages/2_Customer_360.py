@@ -9,6 +9,9 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import json
+import os
+import sys
+import tempfile
 
 st.set_page_config(page_title="Customer 360", page_icon="👥", layout="wide")
 
@@ -59,6 +62,20 @@ except Exception as e:
     st.error("❌ Not connected to Snowflake. Please run this in Snowflake's Streamlit environment.")
     st.stop()
 
+# Where the staged booster and engine are downloaded (reused by every load attempt)
+MODEL_DIR = os.path.join(tempfile.gettempdir(), 'credit_model')
+
+@st.cache_resource
+def load_scoring_engine():
+    """Scoring engine and exported booster from @ML_MODELS.MODEL_STAGE"""
+    # Raises when not staged yet: failures are not cached, so the next search retries
+    os.makedirs(MODEL_DIR, exist_ok=True)
+    session.file.get('@ML_MODELS.MODEL_STAGE', MODEL_DIR)
+    if MODEL_DIR not in sys.path:
+        sys.path.insert(0, MODEL_DIR)
+    from credit_scoring_engine import CreditScoringEngine
+    return CreditScoringEngine.load(MODEL_DIR)
+
 # ============================================
 # Customer Search
 # ============================================
@@ -167,6 +184,28 @@ if 'search_customer' in st.session_state and st.session_state['search_customer']
                     st.json(pred['PREDICTION_DETAILS'])
         else:
             st.warning(f"⚠️ No prediction found for customer {customer_id}")
+            try:
+                engine = load_scoring_engine()
+            except Exception as e:
+                engine = None
+                st.caption(f"Live scoring unavailable: {e}")
+            features = session.sql(f"""
+                SELECT * FROM ANALYTICS_FEATURE_STORE.CREDIT_SCORING_FEATURES
+                WHERE CUSTOMER_ID = '{customer_id}'
+            """).to_pandas() if engine else None
+
+            if features is not None and not features.empty:
+                # Score in-app with the exported model (same logic as PREDICT_CREDIT_SCORE_BATCH)
+                live = engine.score(features).iloc[0]
+                st.caption("⚡ Scored live from the feature store with the exported model")
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("Credit Rating", live['CREDIT_RATING'])
+                col2.metric("Score Band", f"{live['SCORE_BAND']}/9")
+                col3.metric("Decision", f"{'🟢' if live['DECISION'] == 'APPROVE' else '🔴'} {live['DECISION']}")
+                col4.metric("Max Credit Limit", f"${live['MAX_CREDIT_LIMIT']:,}")
+                col1.metric("Default Probability", f"{live['DEFAULT_PROBABILITY']:.1%}")
+                col2.metric("Confidence", live['CONFIDENCE'])
+
             st.info("💡 Try using the stored procedure for real-time scoring:")
             st.code(f"CALL ML_INFERENCE.PREDICT_CREDIT_SCORE_BY_ID_V4('{customer_id}');", language="sql")
             